@@ -11,6 +11,10 @@ class AnchorPoint(LinePoint):
     This is a point which begins or ends a line.
     It is often anchored to a parent shape, but that's not mandatory.
     """
+    __slots__ = ('_stayInside', '_stayOnBorder')
+
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, x: int, y: int, parent: Shape | None):
         """
 
@@ -21,9 +25,7 @@ class AnchorPoint(LinePoint):
         """
         super().__init__(x, y, parent)
 
-        self.apLogger: Logger = getLogger(__name__)
-
-        self.apLogger.debug(f'AnchorPoint __init__  x: {x}, y: {y} parent: {parent}')
+        AnchorPoint.clsLogger.debug(f'AnchorPoint __init__  x: {x}, y: {y} parent: {parent}')
         self._protected:    bool = True  # protected by default
         self._stayInside:   bool = True
         self._stayOnBorder: bool = True
@@ -69,7 +71,7 @@ class AnchorPoint(LinePoint):
             y:  Ordinate of anchor point
         """
 
-        self.apLogger.debug(
+        AnchorPoint.clsLogger.debug(
             (
                 f'x,y: ({x},{y}) '
                 f'parent: {self._parent} '
@@ -86,7 +88,7 @@ class AnchorPoint(LinePoint):
                 width, height      = self._parent.GetSize()
                 width  = abs(width) - 1
                 height = abs(height) - 1
-                self.apLogger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
+                AnchorPoint.clsLogger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
 
                 from miniogl.LineShape import LineShape    # avoid circular import
 
@@ -101,8 +103,9 @@ class AnchorPoint(LinePoint):
 
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
 
-                self.apLogger.debug(f'Final Position: ({self._x}, {self._y})')
+                AnchorPoint.clsLogger.debug(f'Final Position: ({self._x}, {self._y})')
 
+            self._indicateGeometryChanged()
             if self.HasDiagramFrame():
                 self.UpdateModel()
 
@@ -149,7 +152,7 @@ class AnchorPoint(LinePoint):
             down: lambda xDown, yDown: (x, oy + height),
         }
         lesser = min(left, right, up, down)
-        self.apLogger.debug(f'lesser: {lesser}')
+        AnchorPoint.clsLogger.debug(f'lesser: {lesser}')
         return choice[lesser](x, y)
 
     def Detach(self):
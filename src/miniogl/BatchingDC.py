@@ -0,0 +1,217 @@
+
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from wx import Brush
+from wx import Colour
+from wx import DC
+from wx import Font
+from wx import Pen
+
+from wx import PENSTYLE_SOLID
+
+if TYPE_CHECKING:
+    from miniogl.Shape import Shape
+
+LINES:      str = 'lines'
+RECTANGLES: str = 'rectangles'
+POLYGONS:   str = 'polygons'
+TEXTS:      str = 'texts'
+
+#
+# These do not depend on what was drawn, so they do not flush the pending primitives
+#
+QUERIES: frozenset = frozenset({
+    'GetTextExtent', 'GetFullTextExtent', 'GetPartialTextExtents', 'GetMultiLineTextExtent',
+    'GetFont', 'GetCharHeight', 'GetCharWidth', 'GetSize', 'GetPPI',
+    'GetUserScale', 'GetLogicalOrigin', 'GetDeviceOrigin',
+})
+
+
+class BatchingDC:
+    """
+    Wraps a DC for a redraw pass.  Consecutive rectangles, line segments,
+    polygons and texts are collected with the pen and brush they were drawn
+    with, and sent to wx in one `DrawRectangleList`, `DrawLineList`,
+    `DrawPolygonList` or `DrawTextList` call.
+
+    Primitives are never reordered;  A batch is flushed as soon as a
+    different kind of primitive comes, when the font changes under pending
+    texts, or before any call that this class does not batch.  Those calls
+    go to the wrapped DC, so shapes can keep using the whole DC API.
+
+    Pens, brushes and text colours are only sent to the wrapped DC when an
+    unbatched call needs them.
+    """
+    def __init__(self, dc: DC):
+        """
+        Args:
+            dc:  The DC to draw on
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._dc: DC = dc
+
+        self._pen:            Pen    = dc.GetPen()
+        self._brush:          Brush  = dc.GetBrush()
+        self._textForeground: Colour = dc.GetTextForeground()
+        self._stateChanged:   bool   = False      # The wrapped DC does not have our pen, brush or text color
+
+        self._kind:     str       = ''
+        self._items:    List[Any] = []
+        self._pens:     List[Pen] = []
+        self._brushes:  List[Any] = []            # brushes, or text colors for texts
+        self._coords:   List[Tuple[int, int]] = []
+
+    @property
+    def dc(self) -> DC:
+        """
+        Flushes the pending primitives
+
+        Returns:  The wrapped DC, up-to-date, for code that needs to draw on it directly
+        """
+        self.flush()
+        self._syncState()
+        return self._dc
+
+    def SetPen(self, pen: Pen):
+        self._pen          = pen
+        self._stateChanged = True
+
+    def SetBrush(self, brush: Brush):
+        self._brush        = brush
+        self._stateChanged = True
+
+    def SetTextForeground(self, colour: Colour):
+        self._textForeground = colour
+        self._stateChanged   = True
+
+    def GetPen(self) -> Pen:
+        """
+        Returns:  A copy, like wx does;  Callers modify it and the pen may be shared
+        """
+        return Pen(self._pen)
+
+    def GetBrush(self) -> Brush:
+        return Brush(self._brush)
+
+    def GetTextForeground(self) -> Colour:
+        return self._textForeground
+
+    def SetFont(self, font: Font):
+        if self._kind == TEXTS:
+            self.flush()
+        self._dc.SetFont(font)
+
+    def DrawLine(self, *args):
+        if len(args) == 4:
+            self._add(LINES, tuple(args), self._pen)
+        elif len(args) == 2:
+            (x1, y1), (x2, y2) = args
+            self._add(LINES, (x1, y1, x2, y2), self._pen)
+        else:
+            self.dc.DrawLine(*args)
+
+    def DrawLines(self, points, xoffset: int = 0, yoffset: int = 0):
+        """
+        A polyline drawn with a thin solid pen becomes its segments.  Separate
+        segments would restart the dash pattern and lose the line joins, so
+        other polylines go to the wrapped DC unchanged
+        """
+        pen: Pen = self._pen
+        if xoffset != 0 or yoffset != 0 or pen.GetStyle() != PENSTYLE_SOLID or pen.GetWidth() > 1:
+            self.dc.DrawLines(points, xoffset, yoffset)
+            return
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            self._add(LINES, (x1, y1, x2, y2), self._pen)
+
+    def DrawRectangle(self, *args):
+        if len(args) == 4:
+            self._add(RECTANGLES, tuple(args), self._pen, self._brush)
+        elif len(args) == 1:
+            rect = args[0]
+            self._add(RECTANGLES, (rect.GetX(), rect.GetY(), rect.GetWidth(), rect.GetHeight()), self._pen, self._brush)
+        else:
+            self.dc.DrawRectangle(*args)
+
+    def DrawPolygon(self, points, *args, **kwargs):
+        if len(args) > 0 or len(kwargs) > 0:
+            self.dc.DrawPolygon(points, *args, **kwargs)
+        else:
+            self._add(POLYGONS, [(point[0], point[1]) for point in points], self._pen, self._brush)
+
+    def DrawText(self, text: str, *args):
+        if len(args) == 2:
+            x, y = args
+        else:
+            x, y = args[0]
+        self._add(TEXTS, text, self._pen, self._textForeground, coords=(x, y))
+
+    def draw(self, shape: 'Shape'):
+        """
+        Draw a shape through the batch;  Shapes that opted out draw on the wrapped DC
+
+        Args:
+            shape:  The shape to draw
+        """
+        if shape.clsDrawBatched is True:
+            shape.Draw(self)
+        else:
+            shape.Draw(self.dc)
+
+    def flush(self):
+        """
+        Send the pending primitives to the wrapped DC
+        """
+        if len(self._items) == 0:
+            return
+
+        dc: DC = self._dc
+        if self._kind == LINES:
+            dc.DrawLineList(self._items, self._pens)
+        elif self._kind == RECTANGLES:
+            dc.DrawRectangleList(self._items, self._pens, self._brushes)
+        elif self._kind == POLYGONS:
+            dc.DrawPolygonList(self._items, self._pens, self._brushes)
+        elif self._kind == TEXTS:
+            dc.DrawTextList(self._items, self._coords, self._brushes)
+
+        self._items   = []
+        self._pens    = []
+        self._brushes = []
+        self._coords  = []
+        self._kind    = ''
+        self._stateChanged = True     # The list calls leave the last pen and brush behind
+
+    def __getattr__(self, name: str):
+        """
+        Anything we do not batch goes to the wrapped DC, after the pending primitives
+        """
+        if name in QUERIES:
+            return getattr(self._dc, name)
+        return getattr(self.dc, name)
+
+    def _add(self, kind: str, item, pen: Pen, brush=None, coords: Tuple[int, int] | None = None):
+
+        if kind != self._kind:
+            self.flush()
+            self._kind = kind
+
+        self._items.append(item)
+        self._pens.append(pen)
+        self._brushes.append(brush)
+        if coords is not None:
+            self._coords.append(coords)
+
+    def _syncState(self):
+
+        if self._stateChanged is True:
+            self._dc.SetPen(self._pen)
+            self._dc.SetBrush(self._brush)
+            self._dc.SetTextForeground(self._textForeground)
+            self._stateChanged = False
@@ -10,6 +10,8 @@ class ControlPoint(LinePoint):
     If you remove the last line of a control point, the control point will
     automatically be erased.
     """
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, parent=None):
         """
 
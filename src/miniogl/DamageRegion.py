@@ -0,0 +1,94 @@
+
+from typing import List
+from typing import Optional
+
+from miniogl.Shape import BoundingBox
+
+
+class DamageRegion:
+    """
+    The areas of a diagram that need to be repainted, in diagram
+    coordinates.  Overlapping boxes are merged as they are added;  When too
+    many disjoint boxes pile up they are collapsed into their union.
+
+    A region can also be marked as `everything`;  This is used when a shape
+    without a bounding box changes.
+    """
+    MAXIMUM_BOXES: int = 16
+
+    def __init__(self):
+
+        self._boxes:      List[BoundingBox] = []
+        self._everything: bool              = False
+
+    @property
+    def everything(self) -> bool:
+        """
+        Returns:  `True` if the whole diagram must be repainted
+        """
+        return self._everything
+
+    @property
+    def empty(self) -> bool:
+        return self._everything is False and len(self._boxes) == 0
+
+    @property
+    def boxes(self) -> List[BoundingBox]:
+        """
+        Returns:  The disjoint damaged boxes;  Meaningless when `everything` is set
+        """
+        return self._boxes[:]
+
+    @property
+    def bounds(self) -> Optional[BoundingBox]:
+        """
+        Returns:  The union of the damaged boxes or None if the region is empty
+        """
+        if len(self._boxes) == 0:
+            return None
+
+        return BoundingBox((min(box[0] for box in self._boxes), min(box[1] for box in self._boxes),
+                            max(box[2] for box in self._boxes), max(box[3] for box in self._boxes)))
+
+    def add(self, box: BoundingBox):
+        """
+        Args:
+            box:  A (left, top, right, bottom) box to repaint
+        """
+        if self._everything is True:
+            return
+
+        merged: BoundingBox = box
+        growing: bool = True
+        while growing:
+            growing = False
+            for other in self._boxes:
+                if other[0] <= merged[2] and merged[0] <= other[2] and other[1] <= merged[3] and merged[1] <= other[3]:
+                    self._boxes.remove(other)
+                    merged  = BoundingBox((min(merged[0], other[0]), min(merged[1], other[1]), max(merged[2], other[2]), max(merged[3], other[3])))
+                    growing = True
+                    break
+
+        self._boxes.append(merged)
+        if len(self._boxes) > DamageRegion.MAXIMUM_BOXES:
+            self._boxes = [self.bounds]     # type: ignore
+
+    def addEverything(self):
+        self._everything = True
+        self._boxes.clear()
+
+    def take(self) -> 'DamageRegion':
+        """
+        Move the damage to a new region and empty this one
+
+        Returns:  The region with the damage collected so far
+        """
+        taken: DamageRegion = DamageRegion()
+
+        taken._boxes      = self._boxes
+        taken._everything = self._everything
+
+        self._boxes      = []
+        self._everything = False
+
+        return taken
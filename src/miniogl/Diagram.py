@@ -1,12 +1,40 @@
 
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Collection
 from typing import Union
+from typing import ValuesView
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from math import ceil
+from math import floor
+
+from miniogl.DamageRegion import DamageRegion
+from miniogl.NumPySpatialIndex import NumPySpatialIndex
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shape
 from miniogl.Shape import Shapes
 from miniogl.SizerShape import SizerShape
+from miniogl.RectangleShape import RectangleShape
+from miniogl.SpatialIndex import SpatialIndex
+from miniogl.ViewTransform import IDENTITY_TRANSFORM
+from miniogl.ViewTransform import ViewTransform
+from miniogl.ZOrder import ZOrder
+
+from ogl.preferences.OglPreferences import OglPreferences
+
+#
+# Insertion ordered and keyed by identity;  Shapes like OglClass implement a Python
+# level __eq__ that we do not want to run for membership checks
+#
+IdentityShapes = NewType('IdentityShapes', Dict[int, Shape])
+
+ZoomTransforms = Dict[int, ViewTransform]         # by zoom epoch
 
 
 class Diagram:
@@ -16,6 +44,8 @@ class Diagram:
 
     It knows every shapes that can be clicked, selected, and moved.
     """
+    MAXIMUM_LAZY_ZOOMS: int = 8           # Zoom epochs that shapes may lag behind;  Then they are all updated
+
     def __init__(self, panel):
         """
 
@@ -25,28 +55,56 @@ class Diagram:
         self.logger: Logger = getLogger(__name__)
 
         self._panel = panel
-        self._shapes:       Shapes = Shapes([])     # all selectable shapes
-        self._parentShapes: Shapes = Shapes([])     # all first level shapes
+        self._shapes:       ZOrder         = ZOrder()                 # all selectable shapes, in display order
+        self._parentShapes: IdentityShapes = IdentityShapes({})     # all first level shapes
+
+        self._damage:       DamageRegion = DamageRegion()       # what needs a repaint since the last TakeDamage
+        self._spatialIndex: SpatialIndex = self._createSpatialIndex()
+
+        self._zoomEpoch:      int            = 0     # bumped by the panel on each zoom;  See Shape.CheckZoom
+        self._zoomTransforms: ZoomTransforms = {self._zoomEpoch: IDENTITY_TRANSFORM}   # of the epochs shapes may still be in
 
     @property
     def shapes(self) -> Shapes:
         """
         A copy of the originals. You cannot detach or add shapes to the
-        diagram this way.
+        diagram this way.  Prefer `shapesView` when you only need to
+        iterate.
 
         Returns: A list of the shapes in the diagram.
         """
-        return Shapes(self._shapes[:])
+        return Shapes(list(self._shapes))
 
     @property
     def parentShapes(self) -> Shapes:
         """
         Copies of the original. You cannot detach or add shapes to the
-        diagram this way.
+        diagram this way.  Prefer `parentShapesView` when you only need to
+        iterate.
 
         Returns:  A list of the parent shapes in the diagram.
         """
-        return self._parentShapes[:]
+        return Shapes(list(self._parentShapes.values()))
+
+    @property
+    def shapesView(self) -> Collection[Shape]:
+        """
+        A live, read-only view of the shapes in display order;  Nothing is copied.
+        Do not add or detach shapes while iterating it;  Use `shapes` for that.
+
+        Returns: The shapes in the diagram
+        """
+        return self._shapes
+
+    @property
+    def parentShapesView(self) -> ValuesView[Shape]:
+        """
+        A live, read-only view of the first level shapes;  Nothing is copied.
+        Do not add or detach shapes while iterating it.
+
+        Returns: The parent shapes in the diagram
+        """
+        return self._parentShapes.values()
 
     @property
     def panel(self):
@@ -55,6 +113,43 @@ class Diagram:
         """
         return self._panel
 
+    @property
+    def zoomEpoch(self) -> int:
+        """
+        Shapes whose zoom epoch is older have view coordinates for an earlier zoom
+
+        Returns:  The current zoom epoch
+        """
+        return self._zoomEpoch
+
+    def StartZoomEpoch(self, viewTransform: ViewTransform):
+        """
+        The panel calls this when its zoom or offsets change.  The shapes are
+        updated from their models the first time they are needed;  See
+        Shape.CheckZoom.  When they lag too many zooms behind, they are all
+        updated now.
+
+        Args:
+            viewTransform:  How the model coordinates map to the shapes from now on
+        """
+        self._zoomEpoch += 1
+        self._zoomTransforms[self._zoomEpoch] = viewTransform
+
+        if len(self._zoomTransforms) > Diagram.MAXIMUM_LAZY_ZOOMS:
+            for shape in self._shapes:
+                shape.CheckZoom()
+            self.ResetZoomEpochs(viewTransform)
+
+    def ResetZoomEpochs(self, viewTransform: ViewTransform):
+        """
+        Declare every shape up to date with the view transform;  For a panel
+        that takes over an existing diagram
+
+        Args:
+            viewTransform:  How the model coordinates map to the shapes
+        """
+        self._zoomTransforms = {self._zoomEpoch: viewTransform}
+
     def AddShape(self, shape, withModelUpdate: bool = True):
         """
         Add a shape to the diagram.
@@ -65,12 +160,13 @@ class Diagram:
             withModelUpdate:
         """
         self.logger.debug(f'AddShape {shape}')
-        if shape not in self._shapes:
-            self._shapes.append(shape)
-        if shape not in self._parentShapes and shape.parent is None:
-            self._parentShapes.append(shape)
+        shapeId: int = id(shape)
+        self._shapes.add(shape)
+        if shapeId not in self._parentShapes and shape.parent is None:
+            self._parentShapes[shapeId] = shape
 
         shape.Attach(self)
+        self._spatialIndex.insert(shape)
 
         # makes the shape's model (MVC pattern) have the right values depending on
         # the diagram frame state.
@@ -82,9 +178,10 @@ class Diagram:
         Delete all shapes in the diagram.
         """
         while self._shapes:
-            self._shapes[0].Detach()
-        self._shapes = []
-        self._parentShapes = []
+            next(iter(self._shapes)).Detach()
+        self._shapes.clear()
+        self._parentShapes = IdentityShapes({})
+        self._spatialIndex.clear()
 
     def RemoveShape(self, shape: Union[Shape, SizerShape]):
         """
@@ -100,31 +197,180 @@ class Diagram:
         self.logger.debug(f'Determine what got passed in: {shape=}')
         if isinstance(shape, SizerShape):
             self.logger.debug(f'Removing SizerShape')
-        if shape in self._shapes:
-            self._shapes.remove(shape)
-        if shape in self._parentShapes:
-            self._parentShapes.remove(shape)
+        self._shapes.remove(shape)
+        self._parentShapes.pop(id(shape), None)
+        self._spatialIndex.remove(shape)
+
+    def InvalidateShape(self, shape: Shape):
+        """
+        Shapes call this when their position or size changes, so that the
+        diagram can keep its spatial index up to date
+
+        Args:
+            shape:  The shape that moved or was resized
+        """
+        self._spatialIndex.invalidate(shape)
+
+    def RepaintShape(self, shape: Shape):
+        """
+        Shapes call this when they look different but did not move, e.g. when
+        they are selected
+
+        Args:
+            shape:  The shape to repaint
+        """
+        self._spatialIndex.damage(shape)
+
+    def AddDamage(self, box: BoundingBox):
+        """
+        Args:
+            box:  An area to repaint, in diagram coordinates
+        """
+        self._damage.add(box)
+
+    def TakeDamage(self) -> DamageRegion:
+        """
+        Collect the old and new bounds of what changed since the previous call
+
+        Returns:  The areas to repaint;  The diagram starts a new empty region
+        """
+        self._spatialIndex.refresh()
+
+        return self._damage.take()
+
+    def FindShape(self, x: int, y: int) -> Shape | None:
+        """
+        Only the shapes that the spatial index reports under the point are hit
+        tested;  They are tested from the top of the display list down.
+
+        Args:
+            x: abscissa in diagram coordinates
+            y: ordinate in diagram coordinates
+
+        Returns:  The top most shape at (x, y) or None
+        """
+        self._catchUpWithZoom(BoundingBox((x, y, x, y)))
+        candidates: Shapes = Shapes(self._spatialIndex.shapesAt(x, y))
+        candidates.sort(key=self._shapes.key, reverse=True)
+        for shape in candidates:
+            if shape.Inside(x, y):
+                return shape
+
+        return None
+
+    def FindShapesInRectangle(self, rectangle: RectangleShape) -> Shapes:
+        """
+        Used by the selector rectangle.  A shape is inside when the four corners
+        of its (top left, size) box are inside the rectangle.  The rectangle itself
+        is never returned.
+
+        Args:
+            rectangle:  The selection rectangle
+
+        Returns:  The first level shapes fully inside the rectangle, in display order
+        """
+        selectorBox: BoundingBox = cast(BoundingBox, rectangle.GetBoundingBox())
+        left, top, right, bottom = selectorBox
+
+        self._catchUpWithZoom(selectorBox)
+
+        found: Shapes = Shapes([])
+        for shape in self._spatialIndex.shapesIntersecting(selectorBox):
+            if shape.parent is not None or shape is rectangle:
+                continue
+            x0, y0 = shape.topLeft
+            w0, h0 = shape.GetSize()
+            if left <= x0 <= right and left <= x0 + w0 <= right and top <= y0 <= bottom and top <= y0 + h0 <= bottom:
+                found.append(shape)
+
+        found.sort(key=self._shapes.key)
+
+        return found
+
+    def FindShapesIntersecting(self, box: BoundingBox) -> Shapes:
+        """
+        Used to cull what is not on screen.  Shapes without a bounding box
+        are always returned.
+
+        Args:
+            box:  The (left, top, right, bottom) area in diagram coordinates
+
+        Returns:  The shapes whose bounding box intersects the area, in display order
+        """
+        self._catchUpWithZoom(box)
+        found: Shapes = Shapes(self._spatialIndex.shapesIntersecting(box))
+        found.sort(key=self._shapes.key)
+
+        return found
+
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+        Shapes without a bounding box do not count
+
+        Returns:  The (left, top, right, bottom) box enclosing every shape or None if there are none
+        """
+        boxes: List[BoundingBox] = [box for box in (shape.GetBoundingBox() for shape in self._shapes) if box is not None]
+        if len(boxes) == 0:
+            return None
+
+        return BoundingBox((min(box[0] for box in boxes), min(box[1] for box in boxes),
+                            max(box[2] for box in boxes), max(box[3] for box in boxes)))
 
     def MoveToFront(self, shape: Shape):
         """
-        Move the given shape to the end of the display list => last drawn.
+        Move the given shape and its children to the end of the display list => last drawn.
 
         Args:
             shape: The shape to move
         """
-        shapes = [shape] + shape.GetAllChildren()
-        for s in shapes:
-            self._shapes.remove(s)
-        self._shapes = self._shapes + shapes
+        self._shapes.raiseToFront([shape] + shape.GetAllChildren())
 
     def MoveToBack(self, shape: Shape):
         """
-        Move the given shape to the start of the display list => first drawn.
+        Move the given shape and its children to the start of the display list => first drawn.
 
         Args:
             shape: The shape to move
         """
-        shapes = [shape] + shape.GetAllChildren()
-        for s in shapes:
-            self._shapes.remove(s)
-        self._shapes = shapes + self._shapes
+        self._shapes.lowerToBack([shape] + shape.GetAllChildren())
+
+    def _catchUpWithZoom(self, box: BoundingBox):
+        """
+        The spatial index holds the boxes shapes had when they were last updated.
+        Shapes that lag behind the zoom are looked for in the coordinates of
+        their own epoch, and brought up to date, so that the queries see where
+        they are now.
+
+        Args:
+            box:  The (left, top, right, bottom) area in current diagram coordinates
+        """
+        if len(self._zoomTransforms) == 1:
+            return
+
+        currentEpoch: int           = self._zoomEpoch
+        current:      ViewTransform = self._zoomTransforms[currentEpoch]
+        for epoch, transform in list(self._zoomTransforms.items()):
+            if epoch == currentEpoch:
+                continue
+            ratio: float = transform.scale / current.scale
+            epochBox: BoundingBox = BoundingBox((
+                floor((box[0] - current.dx) * ratio + transform.dx) - 2, floor((box[1] - current.dy) * ratio + transform.dy) - 2,
+                ceil((box[2] - current.dx) * ratio + transform.dx) + 2,  ceil((box[3] - current.dy) * ratio + transform.dy) + 2,
+            ))
+            for shape in self._spatialIndex.shapesIntersecting(epochBox):
+                if shape.zoomEpoch == epoch:
+                    shape.CheckZoom()
+
+    def _createSpatialIndex(self) -> SpatialIndex:
+        """
+        The NumPy spatial index is used when the preference asks for it and
+        NumPy is installed
+
+        Returns:  An empty spatial index that records into the diagram damage
+        """
+        if OglPreferences().numpySpatialIndex is True:
+            if NumPySpatialIndex.available() is True:
+                return NumPySpatialIndex(damage=self._damage)
+            self.logger.warning('The NumPy spatial index needs NumPy;  Using the grid spatial index')
+
+        return SpatialIndex(damage=self._damage)
@@ -2,10 +2,16 @@
 from typing import Tuple
 from typing import cast
 from typing import List
+from typing import Set
+from typing import Collection
 
 from logging import Logger
 from logging import getLogger
 
+from math import ceil
+from math import lcm
+
+from wx import CallLater
 from wx import Colour
 from wx import Rect
 from wx import SystemAppearance
@@ -29,10 +35,10 @@ from wx import FONTWEIGHT_NORMAL
 from wx import ID_ANY
 from wx import SUNKEN_BORDER
 from wx import TRANSPARENT_BRUSH
+from wx import TRANSPARENT_PEN
 
 from wx import Bitmap
 from wx import EmptyBitmap
-from wx import Brush
 from wx import ClientDC
 from wx import DC
 from wx import Dialog
@@ -43,16 +49,19 @@ from wx import Size
 from wx import MemoryDC
 from wx import MouseEvent
 from wx import NullBitmap
-from wx import Font
 from wx import Window
 from wx import Pen
-from wx import PenInfo
+from wx import Region
 
 # I know it is there
 # noinspection PyUnresolvedReferences
 from wx.core import PenStyle
 
+from miniogl.BatchingDC import BatchingDC
+from miniogl.DamageRegion import DamageRegion
+from miniogl.ResourcePool import ResourcePool
 from miniogl.Diagram import Diagram
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shapes
 from miniogl.Shape import Shape
 from miniogl.SizerShape import SizerShape
@@ -62,6 +71,8 @@ from miniogl.MiniOglColorEnum import MiniOglColorEnum
 from miniogl.MiniOglPenStyle import MiniOglPenStyle
 from miniogl.ShapeEventHandler import ShapeEventHandler
 from miniogl.DlgDebugDiagramFrame import DlgDebugDiagramFrame
+from miniogl.ViewTransform import IDENTITY_TRANSFORM
+from miniogl.ViewTransform import ViewTransform
 
 from ogl.events.IOglEventEngine import IOglEventEngine
 from ogl.events.OglEventEngine import OglEventEngine
@@ -81,6 +92,12 @@ class DiagramFrame(ScrolledWindow):
     """
     DEFAULT_FONT_SIZE: int = 12
 
+    MAXIMUM_DAMAGE_RATIO: float = 0.5     # Above this fraction of the client area a full redraw is cheaper
+    MAXIMUM_DAMAGE_PASSES: int  = 2       # Shapes may grow while drawing;  Repaint what they damaged
+
+    GRID_TILE_MINIMUM_SIZE: int = 256     # Fewer, larger blits;  Also keeps pen dash patterns mostly continuous
+
+
     def __init__(self, parent: Window):
         """
 
@@ -102,10 +119,18 @@ class DiagramFrame(ScrolledWindow):
         self._clickedShape: Shape = cast(Shape, None)      # last clicked shape
         self._moving:       bool  = False     # a drag has been initiated
 
+        self._dragPosition: Tuple[int, int] | None = None     # latest mouse position not applied to the dragged shapes yet
+        self._dragFrame:    CallLater | None       = None     # applies it at the next frame
+        self._dragInterval: int                    = 0        # milliseconds between drag frames, 0 for every event;  Read when a drag starts
+
         self._xOffset:   int       = 0   # abscissa offset between the view and the model
         self._yOffset:   int       = 0   # ordinate offset between the view and the model
         self._zoomStack: List[float] = []    # store all zoom factors applied
 
+        self._currentZoom:   float         = 1.0                  # product of the zoom stack
+        self._zoomTransform: ViewTransform = IDENTITY_TRANSFORM   # current zoom and offsets
+        self._viewTransform: ViewTransform = IDENTITY_TRANSFORM   # what the shapes use;  See viewTransform
+
         self._minLevelZoom:  int = 0
         self._zoomLevel:     int = 0           # number of zoom factors applied
         self._maxZoomFactor: float = 6         # can zoom in beyond 600%
@@ -126,11 +151,20 @@ class DiagramFrame(ScrolledWindow):
         w, h = self.GetSize()
         self.__workingBitmap    = Bitmap(w, h)   # double buffering
         self.__backgroundBitmap = Bitmap(w, h)
-        self._defaultFont       = Font(DiagramFrame.DEFAULT_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+        self._bufferView:    Tuple[int, int, int, int] | None = None    # scrolled x, y, w, h of the last full draw in the working bitmap
+        self._bufferHasGrid: bool                             = False
+
+        self._gridTile:            Bitmap = Bitmap(1, 1)
+        self._gridTileKey:         Tuple  = ()
+        self._gridTileChangeCount: int    = -1     # The preferences change count the tile key was read at
+        self._gridTilePreferences: Tuple  = ()
+        self._defaultFont       = ResourcePool.font(DiagramFrame.DEFAULT_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
 
         self._prefs:          OglPreferences  = OglPreferences()
         self._oglEventEngine: IOglEventEngine = OglEventEngine(listeningWindow=self)
 
+        self._scaledZoom: bool = self._prefs.scaledZoom    # zoom by scaling the DC;  See scaledZoom
+
         systemAppearance: SystemAppearance = SystemSettings.GetAppearance()
         self._darkMode:   bool             = systemAppearance.IsDark()
 
@@ -171,16 +205,14 @@ class DiagramFrame(ScrolledWindow):
             diagram:
         """
         self._diagram = diagram
+        self._diagram.ResetZoomEpochs(self._viewTransform)
 
     @property
     def currentZoom(self) -> float:
         """
         Returns:  the global current zoom factor.
         """
-        zoom = 1.0
-        for z in self._zoomStack:
-            zoom *= z
-        return zoom
+        return self._currentZoom
 
     @property
     def xOffSet(self) -> int:
@@ -192,6 +224,7 @@ class DiagramFrame(ScrolledWindow):
     @xOffSet.setter
     def xOffSet(self, newValue: int):
         self._xOffset = newValue
+        self._transformChanged()
 
     @property
     def yOffSet(self) -> int:
@@ -203,6 +236,34 @@ class DiagramFrame(ScrolledWindow):
     @yOffSet.setter
     def yOffSet(self, newValue: int):
         self._yOffset = newValue
+        self._transformChanged()
+
+    @property
+    def scaledZoom(self) -> bool:
+        """
+        When True, the zoom and the offsets are applied with the DC user scale and
+        logical origin while painting.  The shapes stay in model coordinates, so
+        zooming does not update them and mouse positions are converted instead.
+        Otherwise, every shape is moved and resized from its model on each zoom.
+
+        Returns:  True when zooming scales the DC
+        """
+        return self._scaledZoom
+
+    @scaledZoom.setter
+    def scaledZoom(self, newValue: bool):
+        assert self.currentZoom == 1.0, 'Only change the zoom mode when the diagram is not zoomed'
+        self._scaledZoom = newValue
+        self._transformChanged()
+
+    @property
+    def viewTransform(self) -> ViewTransform:
+        """
+        Only rebuilt when the zoom or the offsets change;  The identity when the DC is scaled
+
+        Returns:  How the model coordinates map to the shape coordinates
+        """
+        return self._viewTransform
 
     @property
     def defaultZoomFactor(self) -> float:
@@ -263,7 +324,7 @@ class DiagramFrame(ScrolledWindow):
         Returns: A tuple with x,y coordinates
         """
         x, y = self._ConvertEventCoordinates(event)  # Updated by CD, 20041005
-        return x, y
+        return self._viewToDiagram(x, y)
 
     def GenericHandler(self, event: MouseEvent, methodName: str):
         """
@@ -317,23 +378,22 @@ class DiagramFrame(ScrolledWindow):
 
         realShape: Shape = cast(Shape, shape)
         if not event.ControlDown() and not realShape.selected:
-            shapes = self._diagram.shapes       # Get a copy
-            shapes.remove(shape)
+            keep: Set[int] = {id(shape)}
 
             if isinstance(shape, SizerShape):
                 # don't deselect the parent of a sizer
                 # or the parent sizer is detached
-                self._dfLogger.debug(f'Remove parent from copy of shapes')
-                shapes.remove(shape.parent)
+                self._dfLogger.debug(f'Keep the parent of the sizer')
+                keep.add(id(shape.parent))
             elif isinstance(shape, ControlPoint):
                 # don't deselect the line of a control point
                 self._dfLogger.debug(f'{shape=}')
                 for line in shape.lines:
-                    shapes.remove(line)
+                    keep.add(id(line))
             # do not call DeselectAllShapes, because we must ensure that
             # the sizer won't be deselected (because they are detached when they are deselected)
             # deselect every other shape
-            for s in shapes:
+            for s in self._selectedOrMoving(keep):
                 s.selected = False
                 s.moving   = False
 
@@ -353,19 +413,17 @@ class DiagramFrame(ScrolledWindow):
         Args:
             event:
         """
+        self._applyDrag()
+
         if self._selector is not None:
             self.Unbind(EVT_MOTION)
             self._dfLogger.debug(f'{self._selector=}')
             rect = self._selector
 
-            for shape in self._diagram.shapes:
-                x0, y0 = shape.topLeft
-                w0, h0 = shape.GetSize()
-
-                if shape.parent is None and self._isShapeInRectangle(rect, x0=x0, y0=y0, w0=w0, h0=h0):
-                    shape.selected = True
-                    shape.moving   = True
-                    self._selectedShapes.append(shape)
+            for shape in self._diagram.FindShapesInRectangle(rect):
+                shape.selected = True
+                shape.moving   = True
+                self._selectedShapes.append(shape)
             rect.Detach()
             self._selector = cast(RectangleShape, None)
 
@@ -398,7 +456,9 @@ class DiagramFrame(ScrolledWindow):
 
     def OnDrag(self, event: MouseEvent):
         """
-        Callback to drag the selected shapes.
+        Callback to drag the selected shapes.  The shapes are moved at most
+        once per frame, to the latest mouse position;  See the
+        `dragFramesPerSecond` preference.  Zero moves them on every event.
 
         Args:
             event:
@@ -408,6 +468,8 @@ class DiagramFrame(ScrolledWindow):
 
         if not self._moving:
             self.PrepareBackground()
+            framesPerSecond: int = self._prefs.dragFramesPerSecond
+            self._dragInterval = max(1, 1000 // framesPerSecond) if framesPerSecond > 0 else 0
         self._moving = True
         clicked = self._clickedShape
         if clicked and not clicked.selected:
@@ -415,21 +477,50 @@ class DiagramFrame(ScrolledWindow):
             clicked.selected = True
             clicked.moving   = True
         self._clickedShape = cast(Shape, None)
-        for shape in self._selectedShapes:
-            parent = shape.parent
-            if parent is not None and parent.selected is True and not isinstance(shape, SizerShape):
-                continue
-            ox, oy = self._lastMousePosition
-            dx, dy = x - ox, y - oy
-            sx, sy = shape.GetPosition()
 
-            self._dfLogger.debug(f'{self._lastMousePosition=} {sx=} {dx=} {sy=} {dy=}')
+        self._dragPosition = (x, y)
 
-            shape.SetPosition(sx + dx, sy + dy)
+        if self._dragInterval == 0:
+            self._applyDrag()
+        elif self._dragFrame is None:
+            self._dragFrame = CallLater(self._dragInterval, self._onDragFrame)
 
-        self.Refresh(False)
+    def _onDragFrame(self):
+
+        self._dragFrame = None
+        if self:        # The frame may have been destroyed in the meantime
+            self._applyDrag()
+
+    def _applyDrag(self):
+        """
+        Move the selected shapes to the latest mouse position and redraw once
+        """
+        if self._dragFrame is not None:
+            self._dragFrame.Stop()
+            self._dragFrame = None
+        if self._dragPosition is None:
+            return
+
+        x, y   = self._dragPosition
+        ox, oy = self._lastMousePosition
+        dx, dy = x - ox, y - oy
+
+        self._dragPosition      = None
         self._lastMousePosition = (x, y)
 
+        with self._oglEventEngine.batch():
+            for shape in self._selectedShapes:
+                parent = shape.parent
+                if parent is not None and parent.selected is True and not isinstance(shape, SizerShape):
+                    continue
+                sx, sy = shape.GetPosition()
+
+                self._dfLogger.debug(f'{self._lastMousePosition=} {sx=} {dx=} {sy=} {dy=}')
+
+                shape.SetPosition(sx + dx, sy + dy)
+
+        self.Refresh(False)
+
     def OnMove(self, event: MouseEvent):
         """
         Callback for mouse movements.
@@ -516,37 +607,48 @@ class DiagramFrame(ScrolledWindow):
         Returns:  The shape that was found under the coordinates or None
         """
         self._dfLogger.debug(f'Find Shape: @ ({x},{y})')
-        found = None
-        shapes = self._diagram.shapes
-        # self.clsLogger.debug(f'{shapes=}')
-        shapes.reverse()    # to select the one at the top
-        for shape in shapes:
-            if shape.Inside(x, y):
-                self._dfLogger.debug(f"Found: {shape}")
-                found = shape
-                break   # only select the first one
+        found = self._diagram.FindShape(x, y)     # the diagram spatial index selects the one at the top
+        if found is not None:
+            self._dfLogger.debug(f"Found: {found}")
         return found
 
     def DeselectAllShapes(self):
         """
         Deselect all shapes in the frame.
         """
-        for shape in self._diagram.shapes:
+        for shape in self._selectedOrMoving():
             shape.selected = False
             shape.moving   = False
         self._selectedShapes = []
 
     def Refresh(self, eraseBackground: bool = True, rect: Rect = None):
         """
-        not used
+        Repaint the areas the shapes damaged since the last refresh.  When
+        no damage was reported we cannot tell what changed, so the whole
+        frame is redrawn.
+
         Args:
             eraseBackground:    if False, the stored background is used
-            rect:               not used
+            rect:               An additional client area to repaint
         """
-        if eraseBackground:
-            self.Redraw()
-        else:
-            self.RedrawWithBackground()
+        if rect is not None:
+            x, y = self.CalcUnscrolledPosition(rect.GetX(), rect.GetY())
+            left, top     = self._viewToDiagram(x, y)
+            right, bottom = self._viewToDiagram(x + rect.GetWidth(), y + rect.GetHeight())
+            self._diagram.AddDamage(BoundingBox((left - 1, top - 1, right + 1, bottom + 1)))
+
+        damage: DamageRegion = self._diagram.TakeDamage()
+        if damage.empty is True:
+            self._redrawFully(eraseBackground)
+            return
+
+        for _ in range(DiagramFrame.MAXIMUM_DAMAGE_PASSES):
+            if self._redrawDamage(damage, useBackground=not eraseBackground) is False:
+                self._redrawFully(eraseBackground)
+                return
+            damage = self._diagram.TakeDamage()
+            if damage.empty is True:
+                return
 
     def SaveBackground(self, dc: DC):
         """
@@ -590,7 +692,7 @@ class DiagramFrame(ScrolledWindow):
         if (bb.GetWidth(), bb.GetHeight()) != (w, h):
             bb = self.__backgroundBitmap = EmptyBitmap(w, h)
         dc.SelectObject(bb)
-        dc.SetBackground(Brush(self.GetBackgroundColour()))
+        dc.SetBackground(ResourcePool.brush(self.GetBackgroundColour()))
         dc.Clear()
         dc.SelectObject(NullBitmap)
 
@@ -615,7 +717,7 @@ class DiagramFrame(ScrolledWindow):
         if loadBackground:
             self.LoadBackground(dc, w, h)
         else:
-            dc.SetBackground(Brush(self.GetBackgroundColour()))
+            dc.SetBackground(ResourcePool.brush(self.GetBackgroundColour()))
             dc.Clear()
         self.PrepareDC(dc)
 
@@ -633,7 +735,7 @@ class DiagramFrame(ScrolledWindow):
         """
         self.Redraw(cast(DC, None), True, False, True)
 
-    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False):
+    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False, visibleOnly: bool = False):
         """
         Refresh the diagram.
         If a DC is given, use it. Otherwise, use a double buffered DC.
@@ -643,6 +745,8 @@ class DiagramFrame(ScrolledWindow):
             full:   If False, only draw the shape borders.
             saveBackground: If True, save the background
             useBackground:  If True, use the background
+            visibleOnly:    If True, only draw the shapes in the scrolled client area;  Always
+                            the case when we create the DC
         """
         needBlit = False
         w, h = self.GetSize()
@@ -653,7 +757,14 @@ class DiagramFrame(ScrolledWindow):
 
         dc.SetFont(self._defaultFont)
 
-        shapes = self._diagram.shapes
+        shapes: Collection[Shape]
+        if needBlit is True or visibleOnly is True:
+            shapes = self._visibleShapes(w, h)
+        else:
+            shapes = self._diagram.shapesView
+
+        savedTransform: Tuple = self._applyViewTransform(dc)
+        batch: BatchingDC = BatchingDC(dc)
         if full:
             # first time, need to create the background
             if saveBackground:
@@ -661,35 +772,39 @@ class DiagramFrame(ScrolledWindow):
                 for shape in shapes:
                     # if not shape.IsMoving():
                     if shape.moving is False:
-                        shape.Draw(dc)
+                        batch.draw(shape)
                 # save the background
-                self.SaveBackground(dc)
+                self._restoreViewTransform(batch.dc, savedTransform)
+                self.SaveBackground(batch.dc)
+                self._applyViewTransform(batch.dc)
                 # draw every moving shape
                 for shape in shapes:
                     # if shape.IsMoving():
                     if shape.moving is True:
-                        shape.Draw(dc)
+                        batch.draw(shape)
 
             # x, y = self.CalcUnScrolledPosition(0, 0)
             if useBackground:
                 # draw every moving shape
                 for shape in shapes:
                     if shape.moving is True:
-                        shape.Draw(dc)
+                        batch.draw(shape)
                 # TODO: This code belongs in OnPaint
                 # if self._prefs.backgroundGridEnabled is True:
                 #     self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
             else:  # don't use background
                 # draw all shapes
                 for shape in shapes:
-                    shape.Draw(dc)
+                    batch.draw(shape)
                 # TODO: This code belongs in OnPaint
                 # if self._prefs.backgroundGridEnabled is True:
                 #     self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
         else:  # not full
             for shape in shapes:
-                shape.DrawBorder(dc)
-                shape.DrawAnchors(dc)
+                shape.DrawBorder(batch)
+                shape.DrawAnchors(batch)
+        batch.flush()
+        self._restoreViewTransform(dc, savedTransform)
 
         if needBlit:
             client = ClientDC(self)
@@ -697,6 +812,13 @@ class DiagramFrame(ScrolledWindow):
             x, y = self.CalcUnscrolledPosition(0, 0)
             client.Blit(0, 0, w, h, dc, x, y)
 
+            if full is True:
+                self._bufferView = (x, y, w, h)
+            else:
+                self._bufferView = None
+            self._bufferHasGrid = False
+            self._diagram.TakeDamage()      # Everything was repainted
+
     # noinspection PyUnusedLocal
     def OnPaint(self, event: PaintEvent):
         """
@@ -708,7 +830,7 @@ class DiagramFrame(ScrolledWindow):
         dc = PaintDC(self)
         w, h = self.GetSize()
         mem = self.CreateDC(False, w, h)
-        mem.SetBackground(Brush(self.GetBackgroundColour()))
+        mem.SetBackground(ResourcePool.brush(self.GetBackgroundColour()))
         mem.Clear()
 
         x, y = self.CalcUnscrolledPosition(0, 0)
@@ -717,10 +839,14 @@ class DiagramFrame(ScrolledWindow):
         #
         if self._prefs.backGroundGridEnabled is True:
             self._drawGrid(memDC=mem, width=w, height=h, startX=x, startY=y)
-        self.Redraw(mem)
+        self.Redraw(mem, visibleOnly=True)
 
         dc.Blit(0, 0, w, h, mem, x, y)
 
+        self._bufferView    = (x, y, w, h)
+        self._bufferHasGrid = self._prefs.backGroundGridEnabled
+        self._diagram.TakeDamage()
+
     def DoZoomIn(self, ax, ay, width=0, height=0):
         """
         Do the "zoom in" fitted on the selected area or with a default factor
@@ -758,6 +884,11 @@ class DiagramFrame(ScrolledWindow):
         # maxZoomFactor = self.GetMaxLevelZoom() * self.GetDefaultZoomFactor()
         maxZoomFactor = self.maxZoomFactor
 
+        # the selected area is in diagram coordinates
+        ax, ay = self._diagramToView(ax, ay)
+        if self._scaledZoom is True:
+            width, height = width * self.currentZoom, height * self.currentZoom
+
         # transform event coordinates to get them relative to the upper left corner of
         # the virtual screen (avoid the case where that corner is on a shape and
         # get its coordinates relative to the client view).
@@ -854,13 +985,11 @@ class DiagramFrame(ScrolledWindow):
                     self._zoomLevel += 1
 
         # set the offsets between the model and the view
-        self.xOffSet = (self.xOffSet + dx) * zoomFactor
-        self.yOffSet = (self.yOffSet + dy) * zoomFactor
+        self._xOffset = (self._xOffset + dx) * zoomFactor
+        self._yOffset = (self._yOffset + dy) * zoomFactor
+        self._transformChanged()
 
-        # updates the shapes (view) position and dimensions from
-        # their models in the light of the new zoom factor and offsets.
-        for shape in self.diagram.shapes:
-            shape.UpdateFromModel()
+        self._updateShapesFromModel()
 
         # resize the virtual screen to match with the zoom
         virtualWidth  = round(virtualWidth * zoomFactor)
@@ -874,6 +1003,7 @@ class DiagramFrame(ScrolledWindow):
         scrollX = (virtualWidth - clientWidth) / 2 / xUnit
         scrollY = (virtualHeight - clientHeight) / 2 / yUnit
         self.Scroll(round(scrollX), round(scrollY))
+        self._refreshAfterZoom()
 
     def DoZoomOut(self, ax: int, ay: int):
         """
@@ -900,6 +1030,9 @@ class DiagramFrame(ScrolledWindow):
         clientWidth, clientHeight = self.GetClientSize()
         virtualWidth, virtualHeight = self.GetVirtualSize()
 
+        # the clicked point is in diagram coordinates
+        ax, ay = self._diagramToView(ax, ay)
+
         # Transform event coordinates to get them relative to the upper left corner of
         # the virtual screen (avoid the case where that corner is on a shape and
         # get its coordinates relative to the shape).
@@ -947,14 +1080,11 @@ class DiagramFrame(ScrolledWindow):
         # each shape on this diagram frame.
         # self.SetXOffset((self.GetXOffset() + dx) * zoomFactor)
         # self.SetYOffset((self.GetYOffset() + dy) * zoomFactor)
-        self.xOffSet = round((self.xOffSet + dx) * zoomFactor)
-        self.yOffSet = round((self.yOffSet + dy) * zoomFactor)
+        self._xOffset = round((self._xOffset + dx) * zoomFactor)
+        self._yOffset = round((self._yOffset + dy) * zoomFactor)
+        self._transformChanged()
 
-        # updates the shapes (view) position and dimensions from
-        # their model in the light of the new zoom factor and offsets.
-        # for shape in self.GetDiagram().GetShapes():
-        for shape in self.diagram.shapes:
-            shape.UpdateFromModel()
+        self._updateShapesFromModel()
 
         # resize the virtual screen to match with the zoom
         virtualWidth  = round(virtualWidth * zoomFactor)
@@ -970,6 +1100,7 @@ class DiagramFrame(ScrolledWindow):
         scrollY: int = (virtualHeight - clientHeight) / 2 / yUnit
 
         self.Scroll(round(scrollX), round(scrollY))
+        self._refreshAfterZoom()
 
     def SetInfinite(self, infinite: bool = False):
         """
@@ -1030,22 +1161,279 @@ class DiagramFrame(ScrolledWindow):
             self._selector.SetSize(x - x0, y - y0)
             self.Refresh(False)
 
+    def _updateShapesFromModel(self):
+        """
+        Starts a new zoom epoch;  The shapes (view) position and dimensions are
+        updated from their models the first time they are needed.  See
+        Shape.CheckZoom.  Not needed when the DC is scaled
+        """
+        if self._scaledZoom is True:
+            return
+
+        self._diagram.StartZoomEpoch(self._viewTransform)
+
+    def _refreshAfterZoom(self):
+        """
+        The working bitmap was drawn at the previous zoom.  Scaled shapes did not
+        change, so nothing reported damage and they are all repainted;  Otherwise,
+        the shapes now on screen are brought up to date
+        """
+        self._bufferView = None
+        if self._scaledZoom is True:
+            self.Refresh()
+        else:
+            w, h = self.GetSize()
+            self._visibleShapes(w, h)
+
+    def _transformChanged(self):
+        """
+        Call after changing the zoom stack, the offsets or the zoom mode
+        """
+        zoom: float = 1.0
+        for z in self._zoomStack:
+            zoom *= z
+        self._currentZoom   = zoom
+        self._zoomTransform = ViewTransform(scale=zoom, dx=self._xOffset, dy=self._yOffset)
+        if self._scaledZoom is True:
+            self._viewTransform = IDENTITY_TRANSFORM
+        else:
+            self._viewTransform = self._zoomTransform
+
+    def _logicalOrigin(self) -> Tuple[int, int]:
+        """
+        Returns:  The DC logical origin that applies the offsets at the current zoom
+        """
+        transform: ViewTransform = self._zoomTransform
+        return round(-transform.dx / transform.scale), round(-transform.dy / transform.scale)
+
+    def _viewToDiagram(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Args:
+            x:  abscissa on the virtual screen
+            y:  ordinate on the virtual screen
+
+        Returns:  The position in diagram (shape) coordinates
+        """
+        if self._scaledZoom is False:
+            return x, y
+        zoom: float = self.currentZoom
+        originX, originY = self._logicalOrigin()
+        return round(x / zoom + originX), round(y / zoom + originY)
+
+    def _diagramToView(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Args:
+            x:  abscissa in diagram (shape) coordinates
+            y:  ordinate in diagram (shape) coordinates
+
+        Returns:  The position on the virtual screen
+        """
+        if self._scaledZoom is False:
+            return x, y
+        zoom: float = self.currentZoom
+        originX, originY = self._logicalOrigin()
+        return round((x - originX) * zoom), round((y - originY) * zoom)
+
+    def _applyViewTransform(self, dc: DC) -> Tuple:
+        """
+        Scale the DC when the zoom is applied while painting
+
+        Args:
+            dc:  A DC prepared for the scrolled position
+
+        Returns:  What `_restoreViewTransform` needs to undo it
+        """
+        saved: Tuple = ()
+        if self._scaledZoom is True:
+            saved = (dc.GetUserScale(), dc.GetLogicalOrigin())
+            zoom: float = self.currentZoom
+            dc.SetUserScale(zoom, zoom)
+            dc.SetLogicalOrigin(*self._logicalOrigin())
+        return saved
+
+    def _restoreViewTransform(self, dc: DC, saved: Tuple):
+
+        if len(saved) > 0:
+            userScale, logicalOrigin = saved
+            dc.SetUserScale(*userScale)
+            dc.SetLogicalOrigin(*logicalOrigin)
+
     def _ConvertEventCoordinates(self, event):
         xView, yView = self.GetViewStart()
         xDelta, yDelta = self.GetScrollPixelsPerUnit()
         return event.GetX() + (xView * xDelta), event.GetY() + (yView * yDelta)
 
+    def _redrawFully(self, eraseBackground: bool):
+
+        if eraseBackground:
+            self.Redraw()
+        else:
+            self.RedrawWithBackground()
+
+    def _redrawDamage(self, damage: DamageRegion, useBackground: bool) -> bool:
+        """
+        Repaint only the damaged areas in the working bitmap and blit them.
+        This needs the working bitmap to hold a full drawing of the current view.
+
+        Args:
+            damage:         The areas to repaint, in diagram coordinates
+            useBackground:  If True, restore the stored background and only draw the moving shapes
+
+        Returns:  False if a full redraw is needed instead
+        """
+        w, h = self.GetSize()
+        x, y = self.CalcUnscrolledPosition(0, 0)
+        if damage.everything is True or self._bufferView != (x, y, w, h):
+            return False
+
+        rectangles: List[Rect] = []        # damaged client areas
+        area:       int        = 0
+        slack:      int        = ceil(self.currentZoom) if self._scaledZoom is True else 0     # rounding of scaled coordinates
+        for diagramBox in damage.boxes:
+            left, top     = self._diagramToView(diagramBox[0], diagramBox[1])
+            right, bottom = self._diagramToView(diagramBox[2], diagramBox[3])
+            left, top     = max(left - slack, x), max(top - slack, y)
+            right, bottom = min(right + slack, x + w - 1), min(bottom + slack, y + h - 1)
+            if left > right or top > bottom:
+                continue
+            rectangles.append(Rect(round(left - x), round(top - y), round(right - left + 1), round(bottom - top + 1)))
+            area += rectangles[-1].GetWidth() * rectangles[-1].GetHeight()
+
+        if len(rectangles) == 0:
+            return True         # Nothing on screen changed
+        if area > w * h * DiagramFrame.MAXIMUM_DAMAGE_RATIO:
+            return False
+
+        dc:     MemoryDC = MemoryDC()
+        region: Region   = Region()
+        dc.SelectObject(self.__workingBitmap)
+        for rectangle in rectangles:
+            region.Union(rectangle)
+        dc.SetDeviceClippingRegion(region)
+
+        if useBackground is True:
+            mem = MemoryDC()
+            mem.SelectObject(self.__backgroundBitmap)
+            for rectangle in rectangles:
+                dc.Blit(rectangle.GetX(), rectangle.GetY(), rectangle.GetWidth(), rectangle.GetHeight(), mem, rectangle.GetX(), rectangle.GetY())
+            mem.SelectObject(NullBitmap)
+        else:
+            dc.SetPen(TRANSPARENT_PEN)
+            dc.SetBrush(ResourcePool.brush(self.GetBackgroundColour()))
+            for rectangle in rectangles:
+                dc.DrawRectangle(rectangle)
+        self.PrepareDC(dc)
+
+        if useBackground is False and self._bufferHasGrid is True:
+            self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
+
+        dc.SetFont(self._defaultFont)
+        savedTransform: Tuple = self._applyViewTransform(dc)
+        batch:  BatchingDC  = BatchingDC(dc)
+        bounds: BoundingBox = cast(BoundingBox, damage.bounds)
+        for shape in self._diagram.FindShapesIntersecting(bounds):
+            if useBackground is False or shape.moving is True:
+                batch.draw(shape)
+        batch.flush()
+        self._restoreViewTransform(dc, savedTransform)
+
+        client = ClientDC(self)
+        for rectangle in rectangles:
+            client.Blit(rectangle.GetX(), rectangle.GetY(), rectangle.GetWidth(), rectangle.GetHeight(), dc, rectangle.GetX() + x, rectangle.GetY() + y)
+
+        dc.DestroyClippingRegion()
+        dc.SelectObject(NullBitmap)
+
+        return True
+
+    def _visibleShapes(self, width: int, height: int) -> Shapes:
+        """
+        Args:
+            width:  client width
+            height: client height
+
+        Returns:  The shapes that intersect the scrolled client area, in display order
+        """
+        x, y = self.CalcUnscrolledPosition(0, 0)
+        left, top     = self._viewToDiagram(x, y)
+        right, bottom = self._viewToDiagram(x + width, y + height)
+
+        return self._diagram.FindShapesIntersecting(BoundingBox((left - 1, top - 1, right + 1, bottom + 1)))
+
+    def _selectedOrMoving(self, keep: Set[int] | None = None) -> Shapes:
+        """
+        Deselecting a shape may detach its sizers, so we cannot do it while
+        iterating the diagram view;  Only the few shapes that need it are copied.
+
+        Args:
+            keep:  Identities of shapes to leave alone
+
+        Returns:  The selected or moving shapes
+        """
+        if keep is None:
+            keep = set()
+        return Shapes([shape for shape in self._diagram.shapesView if (shape.selected or shape.moving) and id(shape) not in keep])
+
     def _drawGrid(self, memDC: DC, width: int, height: int, startX: int, startY: int):
+        """
+        Tile the grid bitmap over the area;  The tile is opaque, it includes the
+        background color
+
+        Args:
+            memDC:   The DC to draw on
+            width:   The area width
+            height:  The area height
+            startX:  The area left, where the first vertical line is
+            startY:  The area top, where the first horizontal line is
+        """
+        tile:       Bitmap = self._getGridTile()
+        tileWidth:  int    = tile.GetWidth()
+        tileHeight: int    = tile.GetHeight()
 
-        # self.clsLogger.info(f'{width=} {height=} {startX=} {startY=}')
-        savePen = memDC.GetPen()
+        for x in range(startX, startX + width, tileWidth):
+            for y in range(startY, startY + height, tileHeight):
+                memDC.DrawBitmap(tile, x, y)
 
-        newPen: Pen = self._getGridPen()
-        memDC.SetPen(newPen)
+    def _getGridTile(self) -> Bitmap:
+        """
+        The preferences are only read again after one of them was written
+
+        Returns:  The grid tile, rendered again when its key changed
+        """
+        if self._gridTileChangeCount != self._prefs.changeCount:
+            self._gridTileChangeCount = self._prefs.changeCount
+            if self._darkMode is True:
+                gridLineColor: MiniOglColorEnum = self._prefs.darkModeGridLineColor
+            else:
+                gridLineColor = self._prefs.gridLineColor
+            self._gridTilePreferences = (self._prefs.backgroundGridInterval, gridLineColor, self._prefs.gridLineStyle)
+
+        key: Tuple = self._gridTilePreferences + (self._darkMode, self.currentZoom, self.GetBackgroundColour().GetRGBA())
+        if key != self._gridTileKey:
+            self._gridTileKey = key
+            self._gridTile    = self._renderGridTile()
+
+        return self._gridTile
+
+    def _renderGridTile(self) -> Bitmap:
+        """
+        Returns:  A square bitmap, a multiple of the grid interval wide, with the grid lines drawn on the background color
+        """
+        step: int = self._prefs.backgroundGridInterval
+        size: int = lcm(step, 16)
+        size *= ceil(DiagramFrame.GRID_TILE_MINIMUM_SIZE / size)
+
+        tile: Bitmap   = Bitmap(size, size)
+        mem:  MemoryDC = MemoryDC(tile)
+        mem.SetBackground(ResourcePool.brush(self.GetBackgroundColour()))
+        mem.Clear()
+
+        mem.SetPen(self._getGridPen())
+        self._drawHorizontalLines(memDC=mem, width=size, height=size, startX=0, startY=0)
+        self._drawVerticalLines(memDC=mem,   width=size, height=size, startX=0, startY=0)
+        mem.SelectObject(NullBitmap)
 
-        self._drawHorizontalLines(memDC=memDC, width=width, height=height, startX=startX, startY=startY)
-        self._drawVerticalLines(memDC=memDC,   width=width, height=height, startX=startX, startY=startY)
-        memDC.SetPen(savePen)
+        return tile
 
     def _drawHorizontalLines(self, memDC: DC, width: int, height: int, startX: int, startY: int):
 
@@ -1075,17 +1463,7 @@ class DiagramFrame(ScrolledWindow):
 
         gridLineStyle: PenStyle = MiniOglPenStyle.toWxPenStyle(self._prefs.gridLineStyle)
 
-        pen:           Pen    = Pen(PenInfo(gridLineColor).Style(gridLineStyle).Width(1))
-
-        return pen
-
-    def _isShapeInRectangle(self, rect: RectangleShape, x0: float, y0: float, w0: float, h0: float) -> bool:
-
-        ans: bool = False
-        if rect.Inside(x0, y0) and rect.Inside(x0 + w0, y0) and rect.Inside(x0, y0 + h0) and rect.Inside(x0 + w0, y0 + h0):
-            ans = True
-
-        return ans
+        return ResourcePool.pen(gridLineColor, width=1, style=gridLineStyle)
 
     def _setAppropriateSetBackground(self):
 
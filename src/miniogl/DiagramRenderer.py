@@ -0,0 +1,124 @@
+
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+
+from wx import BITMAP_TYPE_PNG
+from wx import FONTFAMILY_DEFAULT
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_NORMAL
+from wx import WHITE
+
+from wx import Bitmap
+from wx import Colour
+from wx import DC
+from wx import MemoryDC
+from wx import NullBitmap
+
+from miniogl.BatchingDC import BatchingDC
+from miniogl.Diagram import Diagram
+from miniogl.DiagramFrame import DiagramFrame
+from miniogl.ResourcePool import ResourcePool
+from miniogl.Shape import BoundingBox
+
+DEFAULT_MARGIN: int = 10
+
+
+class DiagramRenderer:
+    """
+    Draws a diagram into a bitmap without a window, with the shapes' own
+    `Draw` methods.  Used to export images and thumbnails;  Only a wx.App
+    is needed.
+
+    The diagram does not need a frame;  Add the shapes with
+    `withModelUpdate=False` to a `Diagram(panel=None)`.
+    """
+    def __init__(self, diagram: Diagram, backgroundColor: Colour = WHITE, margin: int = DEFAULT_MARGIN):
+        """
+
+        Args:
+            diagram:            The diagram to render
+            backgroundColor:    Painted under the shapes
+            margin:             Blank border around the shapes, in diagram coordinates
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagram:         Diagram = diagram
+        self._backgroundColor: Colour  = backgroundColor
+        self._margin:          int     = margin
+
+    def bounds(self) -> Optional[BoundingBox]:
+        """
+        Returns:  The area to render, the shapes plus the margin, or None for an empty diagram
+        """
+        box: Optional[BoundingBox] = self._diagram.GetBoundingBox()
+        if box is None:
+            return None
+
+        margin: int = self._margin
+        return BoundingBox((box[0] - margin, box[1] - margin, box[2] + margin, box[3] + margin))
+
+    def render(self, scale: float = 1.0, bounds: Optional[BoundingBox] = None) -> Bitmap:
+        """
+        Args:
+            scale:  Image pixels per diagram unit
+            bounds: The area of the diagram to render;  The default is the whole diagram
+
+        Returns:  The rendered image
+        """
+        if bounds is None:
+            bounds = self.bounds()
+            if bounds is None:
+                bounds = BoundingBox((0, 0, 1, 1))
+
+        width:  int = max(1, ceil((bounds[2] - bounds[0]) * scale))
+        height: int = max(1, ceil((bounds[3] - bounds[1]) * scale))
+
+        bitmap: Bitmap   = Bitmap(width, height)
+        dc:     MemoryDC = MemoryDC(bitmap)
+
+        self.renderOn(dc=dc, bounds=bounds, scale=scale)
+
+        dc.SelectObject(NullBitmap)
+        return bitmap
+
+    def renderOn(self, dc: DC, bounds: BoundingBox, scale: float = 1.0, origin: Optional[Tuple[int, int]] = None):
+        """
+        Clear the DC and draw the shapes that intersect the bounds
+
+        Args:
+            dc:     The DC to draw on
+            bounds: The area of the diagram to draw
+            scale:  Device pixels per diagram unit
+            origin: The diagram point that goes to the DC origin;  The default is the top left of the bounds
+        """
+        if origin is None:
+            origin = (bounds[0], bounds[1])
+
+        dc.SetBackground(ResourcePool.brush(self._backgroundColor))
+        dc.Clear()
+
+        dc.SetUserScale(scale, scale)
+        dc.SetLogicalOrigin(origin[0], origin[1])
+        dc.SetFont(ResourcePool.font(DiagramFrame.DEFAULT_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL))
+
+        batch: BatchingDC = BatchingDC(dc)
+        for shape in self._diagram.FindShapesIntersecting(bounds):
+            batch.draw(shape)
+        batch.flush()
+
+    def savePng(self, fileName: str, scale: float = 1.0) -> bool:
+        """
+        Args:
+            fileName:   Where to write the image
+            scale:      Image pixels per diagram unit
+
+        Returns:  `True` if the file was written
+        """
+        bitmap: Bitmap = self.render(scale=scale)
+
+        return bitmap.SaveFile(fileName, BITMAP_TYPE_PNG)
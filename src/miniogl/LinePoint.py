@@ -14,6 +14,8 @@ class LinePoint(PointShape):
     """
     This is a point guiding a line.
     """
+    __slots__ = ('_lines', )
+
     def __init__(self, x: int, y: int, parent=None):
         """
 
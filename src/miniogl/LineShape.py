@@ -2,6 +2,7 @@
 from typing import cast
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import Tuple
 from typing import Union
 from typing import TYPE_CHECKING
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
 
 from miniogl.LinePoint import ControlPoints
 
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shape
 from miniogl.AnchorPoint import AnchorPoint
 from miniogl.ControlPoint import ControlPoint
@@ -69,6 +71,7 @@ class LineShape(Shape, Common):
     @sourceAnchor.setter
     def sourceAnchor(self, theNewValue: AnchorPoint):
         self._srcAnchor = theNewValue
+        self._indicateGeometryChanged()
 
     @property
     def destinationAnchor(self) -> AnchorPoint:
@@ -77,6 +80,7 @@ class LineShape(Shape, Common):
     @destinationAnchor.setter
     def destinationAnchor(self, theNewValue: AnchorPoint):
         self._dstAnchor = theNewValue
+        self._indicateGeometryChanged()
 
     @property
     def segments(self) -> Segments:
@@ -115,6 +119,7 @@ class LineShape(Shape, Common):
             state:  True for a spline
         """
         self._spline = state
+        self._indicateAppearanceChanged()
 
     @property
     def selected(self) -> bool:
@@ -123,6 +128,7 @@ class LineShape(Shape, Common):
     @selected.setter
     def selected(self, state: bool):
         self._selected = state
+        self._indicateAppearanceChanged()
 
         for cp in self._controls:
             ctrl: ControlPoint = cast(ControlPoint, cp)
@@ -216,6 +222,7 @@ class LineShape(Shape, Common):
         else:
             self._controls.append(control)
         control.AddLine(self)
+        self._indicateGeometryChanged()
         # add the point to the diagram so that it can be selected
         if self._diagram is not None:
             self._diagram.AddShape(control)
@@ -347,6 +354,7 @@ class LineShape(Shape, Common):
         """
         if control in self._controls:
             self._controls.remove(control)
+            self._indicateGeometryChanged()
 
     # noinspection PyUnusedLocal
     def _RemoveAnchor(self, anchor):
@@ -408,6 +416,28 @@ class LineShape(Shape, Common):
 
         return False
 
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+        The box around all the line points, widened by the click tolerance
+        or the arrow size, so that the arrow head is inside
+
+        Returns:  The (left, top, right, bottom) box in diagram coordinates or None
+        if the line is not yet anchored
+        """
+        if self._srcAnchor is None or self._dstAnchor is None:
+            return None
+
+        xs: List[int] = []
+        ys: List[int] = []
+        for point in self._mergeControlPoints():
+            x, y = point.GetPosition()
+            xs.append(x)
+            ys.append(y)
+
+        padding: int = max(round(Common.CLICK_TOLERANCE), self._arrowSize)
+
+        return BoundingBox((min(xs) - padding, min(ys) - padding, max(xs) + padding, max(ys) + padding))
+
     def _mergeControlPoints(self) -> ControlPoints:
         """
         points: ControlPoints = [self._srcAnchor] + self._controls + [self._dstAnchor]
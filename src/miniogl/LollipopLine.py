@@ -1,3 +1,4 @@
+from typing import Optional
 from typing import cast
 
 from logging import Logger
@@ -9,10 +10,12 @@ from wx import DC
 
 from codeallyadvanced.ui.AttachmentSide import AttachmentSide
 
+from miniogl.Common import Common
 from miniogl.Common import CommonLine
 from miniogl.Common import CommonPoint
 
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shape
 
 
@@ -39,6 +42,7 @@ class LollipopLine(Shape):
     @destinationAnchor.setter
     def destinationAnchor(self, theNewValue: SelectAnchorPoint):
         self._destinationAnchor = theNewValue
+        self._indicateGeometryChanged()
 
     def lineCoordinates(self) -> CommonLine:
 
@@ -49,6 +53,24 @@ class LollipopLine(Shape):
 
         return CommonLine(CommonPoint(xSrc, ySrc), CommonPoint(xDest, yDest))
 
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+
+        Returns:  The box around the lollipop line and its circle, widened by the click tolerance
+        """
+        if self._destinationAnchor is None:
+            return None
+
+        line:      CommonLine = self.lineCoordinates()
+        tolerance: int        = round(Common.CLICK_TOLERANCE) + LollipopLine.LOLLIPOP_CIRCLE_RADIUS
+
+        return BoundingBox((
+            min(line.start.x, line.end.x) - tolerance,
+            min(line.start.y, line.end.y) - tolerance,
+            max(line.start.x, line.end.x) + tolerance,
+            max(line.start.y, line.end.y) + tolerance
+        ))
+
     def Draw(self, dc: DC, withChildren: bool = True):
 
         if self._selected:
@@ -79,7 +101,7 @@ class LollipopLine(Shape):
 
         diagram = self.diagram
         panel   = diagram.panel   # to enable debugging and unit tests
-        ratio = panel.currentZoom
+        ratio   = panel.viewTransform.scale
 
         lollipopLength: int = LollipopLine.LOLLIPOP_LINE_LENGTH * ratio
         self.lollipopLogger.debug(f'({xDest},{yDest}) {lollipopLength=}')
@@ -1,8 +1,12 @@
 
+from typing import Dict
+from typing import Tuple
+
 from enum import Enum
 
 from wx import Colour
-from wx import ColourDatabase
+
+from miniogl.ResourcePool import ResourcePool
 
 
 class MiniOglColorEnum(Enum):
@@ -39,17 +43,27 @@ class MiniOglColorEnum(Enum):
 
     @staticmethod
     def toWxColor(colorEnum: 'MiniOglColorEnum') -> Colour:
-        cdb: ColourDatabase = ColourDatabase()
-
-        cdb.AddColour(MiniOglColorEnum.ALICE_BLUE.value,   Colour(240, 248, 255))
-        cdb.AddColour(MiniOglColorEnum.GAINSBORO.value,    Colour(218, 218, 218))
-        cdb.AddColour(MiniOglColorEnum.LIGHT_YELLOW.value, Colour(255, 255, 224))
-        cdb.AddColour(MiniOglColorEnum.MINT_CREAM.value,   Colour(245, 255, 250))
-        cdb.AddColour(MiniOglColorEnum.AF_BLUE.value,      Colour(0, 48, 143))
+        """
+        Args:
+            colorEnum:  The color to convert
 
-        c: Colour = cdb.Find(colorEnum.value)
+        Returns:  The shared wx color from the ResourcePool;  Copy it before modifying it
+        """
+        c: Colour = ResourcePool.colour(colorEnum.value, CUSTOM_COLORS.get(colorEnum.value))
         if c.IsOk() is False:
-            c = cdb.Find(MiniOglColorEnum.BLACK.value)
+            c = ResourcePool.colour(MiniOglColorEnum.BLACK.value)
             print('Cannot find color use default')
 
         return c
+
+
+#
+# The colors that are not in the wx color database
+#
+CUSTOM_COLORS: Dict[str, Tuple[int, int, int]] = {
+    MiniOglColorEnum.ALICE_BLUE.value:   (240, 248, 255),
+    MiniOglColorEnum.GAINSBORO.value:    (218, 218, 218),
+    MiniOglColorEnum.LIGHT_YELLOW.value: (255, 255, 224),
+    MiniOglColorEnum.MINT_CREAM.value:   (245, 255, 250),
+    MiniOglColorEnum.AF_BLUE.value:      (0, 48, 143),
+}
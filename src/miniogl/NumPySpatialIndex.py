@@ -0,0 +1,180 @@
+
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from miniogl.DamageRegion import DamageRegion
+from miniogl.Shape import BoundingBox
+from miniogl.Shape import Shape
+from miniogl.SpatialIndex import SpatialIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None        # type: ignore
+
+
+class NumPySpatialIndex(SpatialIndex):
+    """
+    An optional spatial index for very large diagrams;  The grid `SpatialIndex`
+    stays the default.  The diagram only uses this one when the
+    `numpySpatialIndex` preference is set and NumPy is installed.
+
+    The bounding boxes of all the shapes are kept in four contiguous NumPy
+    arrays (left, top, right and bottom) with one row per shape.  A point or a
+    box query is a single vectorised comparison over every row instead of a
+    walk over the grid cells and a loop over the candidates.
+
+    This is only a copy of the boxes for hit testing and culling.  The shapes
+    and their models still own their coordinates, so zooming and snapping do
+    not go through the arrays.
+
+    Geometry changes, dependencies and damage are tracked exactly like in
+    `SpatialIndex`;  Only the storage and the queries differ.  Rows of removed
+    shapes are reused.
+
+    NumPy is an optional dependency;  Check `available` before creating one.
+    """
+    INITIAL_CAPACITY: int = 1024
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Returns:  True when NumPy can be imported
+        """
+        return numpy is not None
+
+    def __init__(self, damage: DamageRegion | None = None):
+        """
+
+        Args:
+            damage:    Where to record the areas that need a repaint
+        """
+        assert NumPySpatialIndex.available(), 'The NumPy spatial index needs NumPy'
+
+        super().__init__(damage=damage)
+
+        self._nsiLogger: Logger = getLogger(__name__)
+
+        capacity: int = NumPySpatialIndex.INITIAL_CAPACITY
+
+        self._left   = numpy.zeros(capacity)
+        self._top    = numpy.zeros(capacity)
+        self._right  = numpy.zeros(capacity)
+        self._bottom = numpy.zeros(capacity)
+        self._used   = numpy.zeros(capacity, dtype=bool)      # False for free rows
+
+        self._rowOf:     Dict[int, int] = {}       # by shape identity
+        self._shapeIdAt: List[int]      = []       # by row
+        self._freeRows:  List[int]      = []
+
+    def shapesAt(self, x: int, y: int) -> List[Shape]:
+        """
+        See `SpatialIndex.shapesAt`
+
+        Args:
+            x:  abscissa
+            y:  ordinate
+
+        Returns:  The shapes that may contain the point
+        """
+        self.refresh()
+
+        mask = self._used & (self._left <= x) & (x <= self._right) & (self._top <= y) & (y <= self._bottom)
+
+        return self._shapesOf(mask)
+
+    def shapesIntersecting(self, box: BoundingBox) -> List[Shape]:
+        """
+        See `SpatialIndex.shapesIntersecting`
+
+        Args:
+            box:  The (left, top, right, bottom) query box
+
+        Returns:  The shapes that may be inside or overlap the box
+        """
+        self.refresh()
+
+        left, top, right, bottom = box
+        mask = self._used & (self._left <= right) & (left <= self._right) & (self._top <= bottom) & (top <= self._bottom)
+
+        return self._shapesOf(mask)
+
+    def clear(self):
+        """
+        Remove all the shapes from the index
+        """
+        super().clear()
+        self._used[:] = False
+        self._rowOf.clear()
+        self._shapeIdAt.clear()
+        self._freeRows.clear()
+
+    def _shapesOf(self, mask) -> List[Shape]:
+        """
+        Args:
+            mask:  Selects rows
+
+        Returns:  The shapes of the selected rows and the shapes without a bounding box
+        """
+        shapes:    Dict[int, Shape] = self._shapes
+        shapeIdAt: List[int]        = self._shapeIdAt
+
+        found: List[Shape] = [shapes[shapeIdAt[row]] for row in numpy.flatnonzero(mask).tolist()]
+        found.extend(shapes[shapeId] for shapeId in self._unbounded)
+
+        return found
+
+    def _bucket(self, shapeId: int, shape: Shape):
+
+        box = shape.GetBoundingBox()
+        if box is None:
+            self._unbounded.add(shapeId)
+            return
+
+        self._boxes[shapeId] = box
+
+        row: int = self._allocateRow(shapeId)
+        self._left[row], self._top[row], self._right[row], self._bottom[row] = box
+        self._used[row] = True
+
+    def _unBucket(self, shapeId: int):
+
+        super()._unBucket(shapeId)
+
+        row = self._rowOf.pop(shapeId, None)
+        if row is not None:
+            self._used[row] = False
+            self._freeRows.append(row)
+
+    def _allocateRow(self, shapeId: int) -> int:
+
+        if len(self._freeRows) > 0:
+            row: int = self._freeRows.pop()
+            self._shapeIdAt[row] = shapeId
+        else:
+            row = len(self._shapeIdAt)
+            if row == len(self._used):
+                self._grow()
+            self._shapeIdAt.append(shapeId)
+
+        self._rowOf[shapeId] = row
+
+        return row
+
+    def _grow(self):
+        """
+        Double the capacity of the arrays
+        """
+        capacity: int = 2 * len(self._used)
+        self._nsiLogger.debug(f'Growing to {capacity} rows')
+
+        self._left   = numpy.resize(self._left, capacity)
+        self._top    = numpy.resize(self._top, capacity)
+        self._right  = numpy.resize(self._right, capacity)
+        self._bottom = numpy.resize(self._bottom, capacity)
+        used         = numpy.zeros(capacity, dtype=bool)
+        used[:len(self._used)] = self._used
+        self._used   = used
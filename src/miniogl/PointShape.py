@@ -1,10 +1,12 @@
 
+from typing import Optional
 from typing import cast
 
 from wx import Colour
 from wx import DC
 from wx import Pen
 
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shape
 
 DEFAULT_POINT_SHAPE_WIDTH: int = 3
@@ -17,6 +19,8 @@ class PointShape(Shape):
     A point, which is drawn as a little square (3 pixels wide).
 
     """
+    __slots__ = ('_selectionZone', '_visibleWhenSelected', '_penSaveColor')
+
     def __init__(self, x: int, y: int, parent=None):
         """
 
@@ -106,6 +110,15 @@ class PointShape(Shape):
         zone = self._selectionZone
         return (ax - zone < x < ax + zone) and (ay - zone < y < ay + zone)
 
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+
+        Returns:  The selection zone around the point
+        """
+        ax, ay = self.GetPosition()
+        zone = self._selectionZone
+        return BoundingBox((ax - zone, ay - zone, ax + zone, ay + zone))
+
     def _resetPenColor(self, dc: DC):
 
         pen: Pen = dc.GetPen()
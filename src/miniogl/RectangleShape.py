@@ -1,12 +1,15 @@
 
+from typing import Optional
 from typing import Tuple
 from typing import cast
 
 from wx import DC
 
+from miniogl.Shape import BoundingBox
 from miniogl.Shape import Shape
 from miniogl.MiniOglUtils import sign
 from miniogl.SizerShape import SizerShape
+from miniogl.ViewTransform import ViewTransform
 
 from miniogl.models.RectangleShapeModel import RectangleShapeModel
 
@@ -15,6 +18,10 @@ class RectangleShape(Shape):
     """
     A rectangle shape.
     """
+    __slots__ = (
+        '_width', '_height', '_drawFrame', '_resizable', '_topLeftSizer', '_topRightSizer', '_botLeftSizer', '_botRightSizer',
+    )
+
     def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0, parent=None):
         """
 
@@ -56,6 +63,7 @@ class RectangleShape(Shape):
     @selected.setter
     def selected(self, state: bool):
         self._selected = state
+        self._indicateAppearanceChanged()
         if self._resizable:
             self.ShowSizers(state)
 
@@ -98,6 +106,7 @@ class RectangleShape(Shape):
         if height < 0:
             y -= height
         self._x, self._y = x, y
+        self._indicateGeometryChanged()
 
     def Draw(self, dc: DC, withChildren: bool = False):
         """
@@ -169,6 +178,27 @@ class RectangleShape(Shape):
         else:
             return False
 
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+        Matches the area checked by `Inside`, including the minimum 4 pixel
+        selection size
+
+        Returns:  The (left, top, right, bottom) box in diagram coordinates
+        """
+        sx, sy = self.GetPosition()
+        width, height = self.GetSize()
+        width  = sign(width)  * max(abs(width),  4)
+        height = sign(height) * max(abs(height), 4)
+        topLeftX: int = sx - self._ox
+        topLeftY: int = sy - self._oy
+
+        return BoundingBox((
+            min(topLeftX, topLeftX + width),
+            min(topLeftY, topLeftY + height),
+            max(topLeftX, topLeftX + width),
+            max(topLeftY, topLeftY + height)
+        ))
+
     def GetSize(self) -> Tuple[int, int]:
         """
         Get the size of the rectangle.
@@ -176,6 +206,8 @@ class RectangleShape(Shape):
         Returns:
             A tuple of width, height
         """
+        if self._diagram is not None and self._zoomEpoch != self._diagram.zoomEpoch:
+            self.CheckZoom()
         return self._width, self._height
 
     def GetHeight(self):
@@ -227,7 +259,10 @@ class RectangleShape(Shape):
         @param  width
         @param height
         """
+        if self._diagram is not None and self._zoomEpoch != self._diagram.zoomEpoch:
+            self.CheckZoom()
         self._width, self._height = width, height
+        self._indicateGeometryChanged()
 
         if self.HasDiagramFrame():
             self.UpdateModel()
@@ -299,11 +334,10 @@ class RectangleShape(Shape):
         width, height = self.model.GetSize()
 
         #  get the diagram frame ratio between the shape and the model
-        ratio = self.diagram.panel.currentZoom
+        transform: ViewTransform = self.diagram.panel.viewTransform
 
         # set the new size to the shape.
-        self._width  = round(width * ratio)
-        self._height = round(height * ratio)
+        self._width, self._height = transform.toViewSize(width, height)
 
     def UpdateModel(self):
         """
@@ -317,10 +351,10 @@ class RectangleShape(Shape):
 
         # get the ratio between the model and the shape (view) from
         # the diagram frame where the shape is displayed.
-        ratio = self.diagram.panel.currentZoom
+        transform: ViewTransform = self.diagram.panel.viewTransform
 
         # set the new size to the model.
-        self.model.SetSize(round(width//ratio), round(height//ratio))
+        self.model.SetSize(*transform.toModelSize(width, height))
 
     def __str__(self) -> str:
         return f'RectangleShape-{self._id}'
@@ -0,0 +1,150 @@
+
+from typing import Hashable
+from typing import Tuple
+from typing import Union
+
+from collections import OrderedDict
+
+from logging import Logger
+from logging import getLogger
+
+from wx import BRUSHSTYLE_SOLID
+from wx import PENSTYLE_SOLID
+
+from wx import Brush
+from wx import Colour
+from wx import ColourDatabase
+from wx import Font
+from wx import Pen
+
+ColourSpec = Union[Colour, str]
+RGB        = Tuple[int, int, int]
+
+
+class ResourcePool:
+    """
+    The pens, brushes, fonts and colours that miniogl and ogl draw with.
+    Equal requests get the same object back, so drawing does not allocate
+    GDI objects and thousands of shapes share a handful of fonts.
+
+    Each kind of resource is kept in its own least recently used cache of
+    at most `MAXIMUM_ENTRIES` entries.
+
+    The returned objects are shared;  Never modify them, ask the pool for
+    a different one instead.
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    MAXIMUM_ENTRIES: int = 128
+
+    _pens:    'OrderedDict[Hashable, Pen]'    = OrderedDict()
+    _brushes: 'OrderedDict[Hashable, Brush]'  = OrderedDict()
+    _fonts:   'OrderedDict[Hashable, Font]'   = OrderedDict()
+    _colours: 'OrderedDict[Hashable, Colour]' = OrderedDict()
+
+    _colourDatabase: ColourDatabase = None
+
+    @classmethod
+    def pen(cls, colour: ColourSpec, width: int = 1, style: int = PENSTYLE_SOLID) -> Pen:
+        """
+        Args:
+            colour: A colour or a colour name
+            width:  The pen width
+            style:  A wx pen style
+
+        Returns:  The shared pen
+        """
+        key: Hashable = (cls._colourKey(colour), width, style)
+        pen: Pen      = cls._lookup(cls._pens, key)
+        if pen is None:
+            pen = cls._store(cls._pens, key, Pen(colour, width, style))
+        return pen
+
+    @classmethod
+    def brush(cls, colour: ColourSpec, style: int = BRUSHSTYLE_SOLID) -> Brush:
+        """
+        Args:
+            colour: A colour or a colour name
+            style:  A wx brush style
+
+        Returns:  The shared brush
+        """
+        key:   Hashable = (cls._colourKey(colour), style)
+        brush: Brush    = cls._lookup(cls._brushes, key)
+        if brush is None:
+            brush = cls._store(cls._brushes, key, Brush(colour, style))
+        return brush
+
+    @classmethod
+    def font(cls, pointSize: int, family: int, style: int, weight: int) -> Font:
+        """
+        Args:
+            pointSize:  The font size in points
+            family:     A wx font family
+            style:      A wx font style
+            weight:     A wx font weight
+
+        Returns:  The shared font
+        """
+        key:  Hashable = (pointSize, family, style, weight)
+        font: Font     = cls._lookup(cls._fonts, key)
+        if font is None:
+            font = cls._store(cls._fonts, key, Font(pointSize, family, style, weight))
+        return font
+
+    @classmethod
+    def colour(cls, name: str, rgb: RGB | None = None) -> Colour:
+        """
+        Args:
+            name:   A colour name
+            rgb:    The colour value when the name is not a standard wx colour name
+
+        Returns:  The shared colour;  Not Ok() if the name is unknown
+        """
+        colour: Colour = cls._lookup(cls._colours, name)
+        if colour is None:
+            if rgb is None:
+                colour = cls._getColourDatabase().Find(name)
+            else:
+                colour = Colour(*rgb)
+            colour = cls._store(cls._colours, name, colour)
+        return colour
+
+    @classmethod
+    def clear(cls):
+        cls._pens.clear()
+        cls._brushes.clear()
+        cls._fonts.clear()
+        cls._colours.clear()
+
+    @classmethod
+    def _lookup(cls, cache: 'OrderedDict', key: Hashable):
+
+        resource = cache.get(key)
+        if resource is not None:
+            cache.move_to_end(key)
+        return resource
+
+    @classmethod
+    def _store(cls, cache: 'OrderedDict', key: Hashable, resource):
+
+        cache[key] = resource
+        if len(cache) > ResourcePool.MAXIMUM_ENTRIES:
+            cache.popitem(last=False)
+        return resource
+
+    @classmethod
+    def _colourKey(cls, colour: ColourSpec) -> Hashable:
+        if isinstance(colour, str):
+            return colour
+        return colour.GetRGBA()
+
+    @classmethod
+    def _getColourDatabase(cls) -> ColourDatabase:
+        """
+        The database needs a wx.App, so it is created on first use
+        """
+        if cls._colourDatabase is None:
+            cls._colourDatabase = ColourDatabase()
+        return cls._colourDatabase
+
@@ -3,6 +3,7 @@ from typing import ClassVar
 from typing import Generator
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import cast
 from typing import Tuple
 
@@ -18,11 +19,16 @@ from wx import RED
 from wx import RED_PEN
 from wx import WHITE_BRUSH
 
+from miniogl.ViewTransform import ViewTransform
+
 from miniogl.models.ShapeModel import ShapeModel
 
 from ogl.preferences.OglPreferences import OglPreferences
 
 
+BoundingBox = NewType('BoundingBox', Tuple[int, int, int, int])    # left, top, right, bottom
+
+
 def infiniteSequence() -> Generator[int, None, None]:
     num = 0
     while True:
@@ -34,10 +40,21 @@ class Shape:
     """
     Shape is the basic graphical block. It is also the view in
     an MVC pattern, so it has a relative model (ShapeModel).
+
+    Diagrams create many small shapes, so the attributes are slots;  Subclasses
+    that do not declare `__slots__` still get a `__dict__`.
     """
+    __slots__ = (
+        '_x', '_y', '_ox', '_oy', '_parent', '_selected', '_visible', '_draggable', '_moving', '_protected',
+        '_anchors', '_children', '_privateChildren', '_pen', '_brush', '_model', '_diagram', '_zoomEpoch', '_id',
+    )
+
+    clsLogger: Logger = getLogger(__name__)
 
     idGenerator: ClassVar = infiniteSequence()
 
+    clsDrawBatched: bool = True     # False for shapes that need the real DC; See BatchingDC
+
     def __init__(self, x: int = 0, y: int = 0, parent=None):
         """
         If a parent is given, the position is relative to the parent's origin.
@@ -47,8 +64,6 @@ class Shape:
             y: position of the shape on the diagram
             parent:
         """
-        self._shapeLogger: Logger = getLogger(__name__)
-
         self._x: int = x    # shape position (view)
         self._y: int = y    # shape position (view)
         self._ox: int = 0   # origin position (view)
@@ -73,6 +88,7 @@ class Shape:
         from miniogl.Diagram import Diagram
 
         self._diagram: Diagram = cast(Diagram, None)       # associated diagram
+        self._zoomEpoch: int   = 0                         # the diagram zoom our view coordinates are for;  See CheckZoom
 
         self._id = next(Shape.idGenerator)     # unique ID number
 
@@ -121,7 +137,9 @@ class Shape:
         Args:
             state: `True` if it is selected else `False`
         """
-        self._selected = state
+        if state != self._selected:
+            self._selected = state
+            self._indicateAppearanceChanged()
 
     @property
     def model(self):
@@ -170,7 +188,9 @@ class Shape:
 
     @visible.setter
     def visible(self, value: bool):
-        self._visible = value
+        if value != self._visible:
+            self._visible = value
+            self._indicateAppearanceChanged()
 
     @property
     def parent(self):
@@ -179,6 +199,7 @@ class Shape:
     @parent.setter
     def parent(self, parent: 'Shape'):
         self._parent = parent
+        self._indicateGeometryChanged()
 
     @property
     def protected(self) -> bool:
@@ -209,6 +230,7 @@ class Shape:
             newBrush: The brush used to draw the shape.
         """
         self._brush = newBrush
+        self._indicateAppearanceChanged()
 
     @property
     def pen(self):
@@ -224,6 +246,7 @@ class Shape:
             pen: The pen used to draw the shape.
         """
         self._pen = pen
+        self._indicateAppearanceChanged()
 
     @property
     def anchors(self):
@@ -257,6 +280,13 @@ class Shape:
         """
         return self._children[:]
 
+    @property
+    def zoomEpoch(self) -> int:
+        """
+        Returns:  The diagram zoom epoch the shape (view) coordinates were last updated for
+        """
+        return self._zoomEpoch
+
     @property
     def diagram(self):
         """
@@ -275,6 +305,7 @@ class Shape:
 
         """
         self._ox, self._oy = x, y
+        self._indicateGeometryChanged()
 
     def GetOrigin(self):
         """
@@ -295,15 +326,16 @@ class Shape:
         child.parent = self
         self._children.append(child)
 
-    def GetAllChildren(self):
+    def GetAllChildren(self) -> 'Shapes':
         """
         Get all the children of this shape, recursively.
 
-        @return Shape []
+        Returns:  A flat list;  Each child comes before its own children
         """
-        shapes = []
+        shapes: Shapes = Shapes([])
         for child in self._children:
-            shapes.append(child.GetAllChildren())
+            shapes.append(child)
+            shapes.extend(child.GetAllChildren())
         return shapes
 
     def AddAnchor(self, x: int, y: int, anchorType=None):
@@ -387,7 +419,8 @@ class Shape:
         Args:
             diagram:
         """
-        self._diagram = diagram
+        self._diagram   = diagram
+        self._zoomEpoch = diagram.zoomEpoch     # created for the current zoom
         # add the anchors and the children
         # map(lambda x: diagram.AddShape(x), self._anchors + self._children + self._privateChildren)
 
@@ -400,7 +433,7 @@ class Shape:
         children: List[Shape] = self._anchors + self._children + self._privateChildren
         for child in children:
             diagram.AddShape(child)
-            self._shapeLogger.debug(f'Attach: {child} has diagram {hasDiagram(child)}')
+            Shape.clsLogger.debug(f'Attach: {child} has diagram {hasDiagram(child)}')
 
     def Detach(self):
         """
@@ -444,6 +477,8 @@ class Shape:
             dc:             wxPython device context
             withChildren:   draw the children or not
         """
+        if self._diagram is not None and self._zoomEpoch != self._diagram.zoomEpoch:
+            self.CheckZoom()
 
         if self._visible:
             dc.SetPen(self._pen)
@@ -498,6 +533,8 @@ class Shape:
         Returns: An x,y tuple
 
         """
+        if self._diagram is not None and self._zoomEpoch != self._diagram.zoomEpoch:
+            self.CheckZoom()
         if self._parent is not None:
             x, y = self._parent.GetPosition()
             return self._x + x, self._y + y
@@ -513,6 +550,16 @@ class Shape:
         """
         return 0, 0
 
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+        The box must enclose every point for which `Inside` answers `True`.
+        The diagram uses it to index the shape.  A shape that does not know its
+        extent returns `None` and is always hit tested.
+
+        Returns:  The (left, top, right, bottom) box in diagram coordinates or None
+        """
+        return None
+
     def ConvertCoordToRelative(self, x, y):
         """
         Convert absolute coordinates to relative ones.
@@ -554,6 +601,8 @@ class Shape:
             x:  x position to move shape to
             y:  y position to move shape to
         """
+        if self._diagram is not None and self._zoomEpoch != self._diagram.zoomEpoch:
+            self.CheckZoom()
         if self._draggable:
             if self._parent is None:
                 self._x = x
@@ -562,6 +611,7 @@ class Shape:
             else:
                 # Shape.clsLogger.debug(f'_parent: {self._parent}')
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
+            self._indicateGeometryChanged()
             #  if the shape is attached to a diagramFrame, it means that
             #  the model will be initialized correctly.
             # (Avoid a null pointer error).
@@ -580,6 +630,7 @@ class Shape:
         if self._draggable:
             self._x = x
             self._y = y
+            self._indicateGeometryChanged()
 
     def SetSize(self, w: int, h: int):
         """
@@ -600,16 +651,10 @@ class Shape:
         # Get the coordinates of the model (ShapeModel)
         mx, my = self.model.GetPosition()
 
-        # Get the offsets and the ratio between the shape (view) and the
-        # shape model (ShapeModel) given by the frame where the shape
-        # is displayed.
-        ratio = self.diagram.panel.currentZoom
-        dx: int = round(self.diagram.panel.xOffSet)
-        dy: int = round(self.diagram.panel.yOffSet)
-
-        # calculation of the shape (view) coordinates in the light of the offsets and ratio
-        x: int = round(ratio * mx) + dx
-        y: int = round(ratio * my) + dy
+        # calculation of the shape (view) coordinates in the light of the offsets and
+        # ratio given by the frame where the shape is displayed
+        transform: ViewTransform = self.diagram.panel.viewTransform
+        x, y = transform.toView(mx, my)
 
         # assign the new coordinates to the shape (view). DON'T USE SetPosition(),
         # because there is a call to UpdateModel() in that method.
@@ -618,6 +663,29 @@ class Shape:
         else:
             self._x = x
             self._y = y
+        self._indicateGeometryChanged()
+
+    def CheckZoom(self):
+        """
+        Zooming does not update every shape from its model right away;  It starts
+        a new diagram zoom epoch instead.  A shape catches up here the first time
+        it is drawn, hit tested or asked for its position or size after that.
+
+        The parent catches up first, then the shape and then its children, so
+        relative coordinates always use an up-to-date parent.
+        """
+        diagram = self._diagram
+        if diagram is None or self._zoomEpoch == diagram.zoomEpoch:
+            return
+        if self._parent is not None:
+            self._parent.CheckZoom()
+            if self._zoomEpoch == diagram.zoomEpoch:
+                return      # the parent brought us up to date
+
+        self._zoomEpoch = diagram.zoomEpoch
+        self.UpdateFromModel()
+        for child in self._anchors + self._children + self._privateChildren:
+            child.CheckZoom()
 
     def UpdateModel(self):
         """
@@ -635,26 +703,20 @@ class Shape:
         diagram = self.diagram
         panel: DiagramFrame   = diagram.panel   # to enable debugging and unit tests
 
-        ratio = panel.currentZoom
-        dx    = panel.xOffSet
-        dy    = panel.yOffSet
+        transform: ViewTransform = panel.viewTransform
 
         #  get the coordinates of this shape
         x, y = self.GetPosition()
 
         # calculation of the model coordinates in the light of the
         # offsets and ratio and assignment.
-        mx = round((x - dx) // ratio)
-        my = round((y - dy) // ratio)
-        model.SetPosition(mx, my)
+        model.SetPosition(*transform.toModel(x, y))
 
         # change also the position of the model of the children,
         # because when we move the parent children set position is not called
         # and so their update model is not called
-        for child in self._anchors:
-            cx, cy = child.GetPosition()
-            cmx = round((cx - dx) // ratio)
-            cmy = round((cy - dy) // ratio)
+        anchorPositions = transform.toModelPoints([child.GetPosition() for child in self._anchors])
+        for child, (cmx, cmy) in zip(self._anchors, anchorPositions):
             child.model.SetPosition(cmx, cmy)
 
     def HasDiagramFrame(self):
@@ -668,6 +730,20 @@ class Shape:
         else:
             return False
 
+    def _indicateGeometryChanged(self):
+        """
+        Tell the diagram that the position or the size of this shape changed
+        """
+        if self._diagram is not None:
+            self._diagram.InvalidateShape(self)
+
+    def _indicateAppearanceChanged(self):
+        """
+        Tell the diagram that this shape must be repainted although it did not move
+        """
+        if self._diagram is not None:
+            self._diagram.RepaintShape(self)
+
     def _addPrivateText(self, x: int, y: int, text: str, font: Font = None):
         """
         Add a text shape, putting it in the private children of the shape.
@@ -0,0 +1,329 @@
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from miniogl.Shape import BoundingBox
+from miniogl.Shape import Shape
+
+from miniogl.DamageRegion import DamageRegion
+
+Cell  = NewType('Cell', Tuple[int, int])
+Cells = NewType('Cells', List[Cell])
+
+
+class SpatialIndex:
+    """
+    A uniform grid that buckets shapes by their bounding boxes.  It
+    answers "which shapes might be under this point" without visiting
+    every shape of a diagram.
+
+    Shapes are keyed by identity, never by `__eq__`.  Geometry changes are
+    recorded lazily;  An invalidated shape is re-bucketed on the next query.
+    Since a shape position may be derived from other shapes (its parent, or
+    the anchors of a line) invalidating a shape also invalidates the shapes
+    that depend on it.
+
+    Shapes that do not report a bounding box are always returned as
+    candidates.  Shapes that span too many cells are kept in a separate
+    list, so that very long lines do not bloat the grid.
+
+    When given a damage region, the index records in it the old and the new
+    bounding box of every shape that is invalidated, added or removed.
+    """
+    DEFAULT_CELL_SIZE: int = 128
+    MAXIMUM_CELLS:     int = 256
+
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE, damage: DamageRegion | None = None):
+        """
+
+        Args:
+            cellSize:  The width and height of a grid cell in pixels
+            damage:    Where to record the areas that need a repaint
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cellSize: int                 = cellSize
+        self._damage:   DamageRegion | None = damage
+
+        self._shapes:    Dict[int, Shape]       = {}
+        self._boxes:     Dict[int, BoundingBox] = {}
+        self._cells:     Dict[Cell, Set[int]]   = {}
+        self._cellsOf:   Dict[int, Cells]       = {}
+        self._unbounded: Set[int]               = set()     # Shapes without a bounding box
+        self._large:     Set[int]               = set()     # Shapes that span more than MAXIMUM_CELLS
+        self._dirty:     Set[int]               = set()     # Shapes whose bounding box is stale
+
+        self._precedentsOf: Dict[int, Tuple[int, ...]] = {}     # The shapes a shape's geometry depends on
+        self._dependents:   Dict[int, Set[int]]        = {}     # The reverse mapping
+
+    @property
+    def cellSize(self) -> int:
+        return self._cellSize
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __contains__(self, shape) -> bool:
+        return id(shape) in self._shapes
+
+    def insert(self, shape: Shape):
+        """
+        Add a shape to the index.  Inserting a shape already in the index
+        only invalidates it.
+
+        Args:
+            shape:  The shape to index
+        """
+        shapeId: int = id(shape)
+
+        self._shapes[shapeId] = shape
+        self.invalidate(shape)
+
+    def remove(self, shape: Shape):
+        """
+        Remove a shape from the index.  Unknown shapes are ignored.
+
+        Args:
+            shape:  The shape to remove
+        """
+        shapeId: int = id(shape)
+        if shapeId not in self._shapes:
+            return
+
+        self._damageOf(shapeId)
+        self._unBucket(shapeId)
+        self._unRegisterPrecedents(shapeId)
+
+        del self._shapes[shapeId]
+        self._dirty.discard(shapeId)
+
+    def invalidate(self, shape: Shape):
+        """
+        Indicate that the geometry of a shape has changed.  The shapes that
+        depend on it are invalidated as well.
+
+        Args:
+            shape:  The shape that moved or was resized
+        """
+        stack: List[int] = [id(shape)]
+        while stack:
+            shapeId: int = stack.pop()
+            if shapeId in self._dirty or shapeId not in self._shapes:
+                continue
+            self._damageOf(shapeId)
+            self._dirty.add(shapeId)
+            dependents: Set[int] = self._dependents.get(shapeId, set())
+            stack.extend(dependents)
+
+    def damage(self, shape: Shape):
+        """
+        Record the current bounding box of a shape whose appearance, but not its
+        geometry, changed.  Unknown shapes are ignored.
+
+        Args:
+            shape:  The shape to repaint
+        """
+        shapeId: int = id(shape)
+        if shapeId in self._shapes and shapeId not in self._dirty:
+            self._damageOf(shapeId)
+
+    def clear(self):
+        """
+        Remove all the shapes from the index
+        """
+        if self._damage is not None and len(self._shapes) > 0:
+            self._damage.addEverything()
+        self._shapes.clear()
+        self._boxes.clear()
+        self._cells.clear()
+        self._cellsOf.clear()
+        self._unbounded.clear()
+        self._large.clear()
+        self._dirty.clear()
+        self._precedentsOf.clear()
+        self._dependents.clear()
+
+    def shapesAt(self, x: int, y: int) -> List[Shape]:
+        """
+        The returned shapes are candidates;  Their bounding box contains the
+        point, or they have no bounding box.  The caller still has to hit test
+        them.  The order is unspecified.
+
+        Args:
+            x:  abscissa
+            y:  ordinate
+
+        Returns:  The shapes that may contain the point
+        """
+        self.refresh()
+
+        cellSize:   int      = self._cellSize
+        candidates: Set[int] = set(self._unbounded)
+        candidates.update(self._cells.get(Cell((x // cellSize, y // cellSize)), ()))
+        candidates.update(self._large)
+
+        shapes: List[Shape] = []
+        for shapeId in candidates:
+            box = self._boxes.get(shapeId)
+            if box is None or (box[0] <= x <= box[2] and box[1] <= y <= box[3]):
+                shapes.append(self._shapes[shapeId])
+
+        return shapes
+
+    def shapesIntersecting(self, box: BoundingBox) -> List[Shape]:
+        """
+        The returned shapes are candidates;  Their bounding box intersects the
+        input box, or they have no bounding box.  The order is unspecified.
+
+        Args:
+            box:  The (left, top, right, bottom) query box
+
+        Returns:  The shapes that may be inside or overlap the box
+        """
+        self.refresh()
+
+        cellSize: int = self._cellSize
+        left, top, right, bottom = box
+
+        firstColumn: int = int(left // cellSize)
+        lastColumn:  int = int(right // cellSize)
+        firstRow:    int = int(top // cellSize)
+        lastRow:     int = int(bottom // cellSize)
+
+        candidates: Set[int] = set(self._unbounded)
+        candidates.update(self._large)
+        if (lastColumn - firstColumn + 1) * (lastRow - firstRow + 1) > len(self._cells):
+            # A big query;  Cheaper to scan the occupied cells
+            for cell, bucket in self._cells.items():
+                column, row = cell
+                if firstColumn <= column <= lastColumn and firstRow <= row <= lastRow:
+                    candidates.update(bucket)
+        else:
+            for column in range(firstColumn, lastColumn + 1):
+                for row in range(firstRow, lastRow + 1):
+                    candidates.update(self._cells.get(Cell((column, row)), ()))
+
+        shapes: List[Shape] = []
+        for shapeId in candidates:
+            shapeBox = self._boxes.get(shapeId)
+            if shapeBox is None or (shapeBox[0] <= right and left <= shapeBox[2] and shapeBox[1] <= bottom and top <= shapeBox[3]):
+                shapes.append(self._shapes[shapeId])
+
+        return shapes
+
+    def refresh(self):
+        """
+        Re-bucket the invalidated shapes;  Queries do this on demand
+        """
+        while self._dirty:
+            shapeId: int   = self._dirty.pop()
+            shape:   Shape = self._shapes[shapeId]
+
+            self._unBucket(shapeId)
+            self._unRegisterPrecedents(shapeId)
+            self._registerPrecedents(shapeId, shape)
+            self._bucket(shapeId, shape)
+            self._damageOf(shapeId)
+
+    def _bucket(self, shapeId: int, shape: Shape):
+
+        box = shape.GetBoundingBox()
+        if box is None:
+            self._unbounded.add(shapeId)
+            return
+
+        self._boxes[shapeId] = box
+
+        cellSize: int = self._cellSize
+        left, top, right, bottom = box
+
+        firstColumn: int = int(left // cellSize)
+        lastColumn:  int = int(right // cellSize)
+        firstRow:    int = int(top // cellSize)
+        lastRow:     int = int(bottom // cellSize)
+
+        if (lastColumn - firstColumn + 1) * (lastRow - firstRow + 1) > SpatialIndex.MAXIMUM_CELLS:
+            self._large.add(shapeId)
+            return
+
+        cells: Cells = Cells([])
+        for column in range(firstColumn, lastColumn + 1):
+            for row in range(firstRow, lastRow + 1):
+                cell: Cell = Cell((column, row))
+                self._cells.setdefault(cell, set()).add(shapeId)
+                cells.append(cell)
+
+        self._cellsOf[shapeId] = cells
+
+    def _damageOf(self, shapeId: int):
+        """
+        Record the indexed bounding box of a shape in the damage region
+        """
+        if self._damage is None:
+            return
+        if shapeId in self._unbounded:
+            self._damage.addEverything()
+        elif shapeId in self._boxes:
+            self._damage.add(self._boxes[shapeId])
+
+    def _unBucket(self, shapeId: int):
+
+        self._boxes.pop(shapeId, None)
+        self._unbounded.discard(shapeId)
+        self._large.discard(shapeId)
+
+        for cell in self._cellsOf.pop(shapeId, []):
+            bucket: Set[int] = self._cells[cell]
+            bucket.discard(shapeId)
+            if len(bucket) == 0:
+                del self._cells[cell]
+
+    def _registerPrecedents(self, shapeId: int, shape: Shape):
+
+        precedents: Tuple[int, ...] = tuple(id(precedent) for precedent in self._precedents(shape))
+
+        self._precedentsOf[shapeId] = precedents
+        for precedentId in precedents:
+            self._dependents.setdefault(precedentId, set()).add(shapeId)
+
+    def _unRegisterPrecedents(self, shapeId: int):
+
+        for precedentId in self._precedentsOf.pop(shapeId, ()):
+            dependents: Set[int] = self._dependents[precedentId]
+            dependents.discard(shapeId)
+            if len(dependents) == 0:
+                del self._dependents[precedentId]
+
+    def _precedents(self, shape: Shape) -> List[Shape]:
+        """
+        Shape positions are relative to their parent;  A line position is
+        derived from its anchors and control points.
+
+        Args:
+            shape:
+
+        Returns:  The shapes whose geometry the input shape depends on
+        """
+        from miniogl.LineShape import LineShape         # avoid circular import
+        from miniogl.LollipopLine import LollipopLine
+
+        precedents: List[Shape] = []
+        if shape.parent is not None:
+            precedents.append(shape.parent)
+
+        if isinstance(shape, LineShape):
+            precedents.extend(shape.GetControlPoints())
+            if shape.sourceAnchor is not None:
+                precedents.append(shape.sourceAnchor)
+            if shape.destinationAnchor is not None:
+                precedents.append(shape.destinationAnchor)
+        elif isinstance(shape, LollipopLine):
+            if shape.destinationAnchor is not None:
+                precedents.append(shape.destinationAnchor)
+
+        return precedents
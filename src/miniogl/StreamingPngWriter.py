@@ -0,0 +1,76 @@
+
+from typing import BinaryIO
+
+from struct import pack
+
+from zlib import Z_SYNC_FLUSH
+from zlib import compressobj
+from zlib import crc32
+
+PNG_SIGNATURE: bytes = b'\x89PNG\r\n\x1a\n'
+
+BYTES_PER_PIXEL:  int = 3       # RGB, 8 bits per channel
+COLOR_TYPE_RGB:   int = 2
+NO_FILTER:        bytes = b'\x00'
+
+
+class StreamingPngWriter:
+    """
+    Writes an RGB PNG a band of rows at a time, so the whole image never
+    has to be in memory.  Rows must be written top to bottom;  `close` must
+    be called after the last one.
+    """
+    def __init__(self, output: BinaryIO, width: int, height: int, compressionLevel: int = 6):
+        """
+
+        Args:
+            output:             A binary file opened for writing
+            width:              Image width in pixels
+            height:             Image height in pixels
+            compressionLevel:   zlib compression level
+        """
+        self._output:      BinaryIO = output
+        self._width:       int      = width
+        self._height:      int      = height
+        self._rowsWritten: int      = 0
+
+        self._compressor = compressobj(compressionLevel)
+
+        self._output.write(PNG_SIGNATURE)
+        self._writeChunk(b'IHDR', pack('>IIBBBBB', width, height, 8, COLOR_TYPE_RGB, 0, 0, 0))
+
+    @property
+    def rowsWritten(self) -> int:
+        return self._rowsWritten
+
+    def writeRows(self, pixels: bytes, rowCount: int):
+        """
+        Args:
+            pixels:     rowCount rows of width RGB pixels, top to bottom
+            rowCount:   The number of rows in pixels
+        """
+        rowLength: int = self._width * BYTES_PER_PIXEL
+        assert len(pixels) == rowLength * rowCount, 'Band does not match the image width'
+        assert self._rowsWritten + rowCount <= self._height, 'Too many rows'
+
+        raw: bytearray = bytearray()
+        for row in range(rowCount):
+            raw += NO_FILTER
+            raw += pixels[row * rowLength:(row + 1) * rowLength]
+
+        self._writeChunk(b'IDAT', self._compressor.compress(bytes(raw)) + self._compressor.flush(Z_SYNC_FLUSH))
+        self._rowsWritten += rowCount
+
+    def close(self):
+
+        assert self._rowsWritten == self._height, 'Not every row was written'
+
+        self._writeChunk(b'IDAT', self._compressor.flush())
+        self._writeChunk(b'IEND', b'')
+
+    def _writeChunk(self, chunkType: bytes, data: bytes):
+
+        self._output.write(pack('>I', len(data)))
+        self._output.write(chunkType)
+        self._output.write(data)
+        self._output.write(pack('>I', crc32(chunkType + data) & 0xFFFFFFFF))
@@ -0,0 +1,374 @@
+
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import TextIO
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from base64 import b64encode
+
+from io import BytesIO
+
+from math import atan2
+from math import cos
+from math import pi
+from math import radians
+from math import sin
+from math import sqrt
+
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+
+from wx import BITMAP_TYPE_PNG
+from wx import BLACK
+from wx import BLACK_PEN
+from wx import BRUSHSTYLE_TRANSPARENT
+from wx import FONTSTYLE_ITALIC
+from wx import FONTSTYLE_SLANT
+from wx import FONTWEIGHT_BOLD
+from wx import PENSTYLE_DOT
+from wx import PENSTYLE_DOT_DASH
+from wx import PENSTYLE_LONG_DASH
+from wx import PENSTYLE_SHORT_DASH
+from wx import PENSTYLE_TRANSPARENT
+from wx import SOLID
+from wx import TRANSPARENT
+from wx import WHITE
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import DC
+from wx import Font
+from wx import MemoryDC
+from wx import NORMAL_FONT
+from wx import Pen
+
+Point = Tuple[int, int]
+
+DASH_ARRAYS = {
+    PENSTYLE_DOT:        '1 2',
+    PENSTYLE_LONG_DASH:  '8 4',
+    PENSTYLE_SHORT_DASH: '4 4',
+    PENSTYLE_DOT_DASH:   '8 3 1 3',
+}
+
+
+def svgColour(colour: Colour) -> str:
+    """
+    Returns:  The colour as #rrggbb
+    """
+    return f'#{colour.Red():02x}{colour.Green():02x}{colour.Blue():02x}'
+
+
+class SvgDC:
+    """
+    A DC that writes what is drawn on it as SVG elements to a text stream.
+    It has the subset of the wx DC API that the miniogl and ogl shapes draw
+    with, so their `Draw` methods work on it unchanged.
+
+    Text is measured with a real DC, so it lays out as it does on screen.
+    Coordinates are written as they are drawn;  `SvgDiagramExporter` puts
+    the viewBox around them.
+    """
+    def __init__(self, output: TextIO, measuringDC: DC | None = None):
+        """
+
+        Args:
+            output:         Where the elements go
+            measuringDC:    Measures text;  The default is a MemoryDC on a small bitmap
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._output: TextIO = output
+        if measuringDC is None:
+            measuringDC = MemoryDC(Bitmap(1, 1))
+        self._measuringDC: DC = measuringDC
+
+        self._pen:            Pen    = BLACK_PEN
+        self._brush:          Brush  = WHITE_BRUSH
+        self._background:     Brush  = WHITE_BRUSH
+        self._font:           Font   = NORMAL_FONT
+        self._textForeground: Colour = BLACK
+        self._textBackground: Colour = WHITE
+        self._backgroundMode: int    = TRANSPARENT
+
+        self._clipId:    int = 0
+        self._openClips: int = 0
+
+    #
+    # State
+    #
+    def SetPen(self, pen: Pen):
+        self._pen = pen
+
+    def GetPen(self) -> Pen:
+        return Pen(self._pen)
+
+    def SetBrush(self, brush: Brush):
+        self._brush = brush
+
+    def GetBrush(self) -> Brush:
+        return Brush(self._brush)
+
+    def SetBackground(self, brush: Brush):
+        self._background = brush
+
+    def SetFont(self, font: Font):
+        self._font = font
+        self._measuringDC.SetFont(font)
+
+    def GetFont(self) -> Font:
+        return self._font
+
+    def SetTextForeground(self, colour: Colour):
+        self._textForeground = colour
+
+    def GetTextForeground(self) -> Colour:
+        return self._textForeground
+
+    def SetTextBackground(self, colour: Colour):
+        self._textBackground = colour
+
+    def SetBackgroundMode(self, mode: int):
+        self._backgroundMode = mode
+
+    def GetUserScale(self) -> Tuple[float, float]:
+        return 1.0, 1.0
+
+    #
+    # Text measurement
+    #
+    def GetTextExtent(self, text: str):
+        return self._measuringDC.GetTextExtent(text)
+
+    def GetFullTextExtent(self, text: str, font: Font | None = None):
+        return self._measuringDC.GetFullTextExtent(text, font)
+
+    def GetPartialTextExtents(self, text: str):
+        return self._measuringDC.GetPartialTextExtents(text)
+
+    def GetMultiLineTextExtent(self, text: str):
+        return self._measuringDC.GetMultiLineTextExtent(text)
+
+    def GetCharHeight(self) -> int:
+        return self._measuringDC.GetCharHeight()
+
+    def GetCharWidth(self) -> int:
+        return self._measuringDC.GetCharWidth()
+
+    #
+    # Clipping
+    #
+    def SetClippingRegion(self, *args):
+        """
+        Clipping regions nest as SVG groups;  Each one must be destroyed
+        """
+        if len(args) == 1:
+            rect = args[0]
+            x, y, width, height = rect.GetX(), rect.GetY(), rect.GetWidth(), rect.GetHeight()
+        else:
+            x, y, width, height = args
+
+        self._clipId += 1
+        self._write(f'<clipPath id="clip{self._clipId}"><rect x="{x}" y="{y}" width="{width}" height="{height}"/></clipPath>')
+        self._write(f'<g clip-path="url(#clip{self._clipId})">')
+        self._openClips += 1
+
+    def DestroyClippingRegion(self):
+        if self._openClips > 0:
+            self._write('</g>')
+            self._openClips -= 1
+
+    def close(self):
+        """
+        Close the clipping groups a shape left open
+        """
+        while self._openClips > 0:
+            self.DestroyClippingRegion()
+
+    #
+    # Primitives
+    #
+    def Clear(self):
+        self._write(f'<rect x="0" y="0" width="100%" height="100%" {self._fill(self._background)} stroke="none"/>')
+
+    def DrawLine(self, *args):
+        if len(args) == 2:
+            (x1, y1), (x2, y2) = args
+        else:
+            x1, y1, x2, y2 = args
+        self._write(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" {self._stroke()}/>')
+
+    def DrawLines(self, points: Sequence, xoffset: int = 0, yoffset: int = 0):
+        self._write(f'<polyline points="{self._points(points, xoffset, yoffset)}" fill="none" {self._stroke()}/>')
+
+    def DrawRectangle(self, *args):
+        if len(args) == 1:
+            rect = args[0]
+            x, y, width, height = rect.GetX(), rect.GetY(), rect.GetWidth(), rect.GetHeight()
+        else:
+            x, y, width, height = args
+        self._write(f'<rect x="{x}" y="{y}" width="{width}" height="{height}" {self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawPolygon(self, points: Sequence, xoffset: int = 0, yoffset: int = 0, fill_style: int = 0):
+        self._write(f'<polygon points="{self._points(points, xoffset, yoffset)}" {self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawCircle(self, x: int, y: int, radius: int):
+        self._write(f'<circle cx="{x}" cy="{y}" r="{radius}" {self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawEllipse(self, x: int, y: int, width: int, height: int):
+        rx: float = width / 2
+        ry: float = height / 2
+        self._write(f'<ellipse cx="{x + rx}" cy="{y + ry}" rx="{rx}" ry="{ry}" {self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawArc(self, xStart: int, yStart: int, xEnd: int, yEnd: int, xCenter: int, yCenter: int):
+        """
+        Counterclockwise from the start to the end, filled as a pie like wx does
+        """
+        radius: float = sqrt((xStart - xCenter) ** 2 + (yStart - yCenter) ** 2)
+        if (xStart, yStart) == (xEnd, yEnd):
+            self.DrawCircle(xCenter, yCenter, round(radius))
+            return
+
+        startAngle: float = atan2(yCenter - yStart, xStart - xCenter)
+        endAngle:   float = atan2(yCenter - yEnd, xEnd - xCenter)
+        largeArc:   int   = 1 if (endAngle - startAngle) % (2 * pi) > pi else 0
+
+        self._write(f'<path d="M {xCenter} {yCenter} L {xStart} {yStart} A {radius} {radius} 0 {largeArc} 0 {xEnd} {yEnd} Z" '
+                    f'{self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawEllipticArc(self, x: int, y: int, width: int, height: int, start: float, end: float):
+        """
+        The angles are in degrees, counterclockwise from 3 o'clock
+        """
+        rx: float = width / 2
+        ry: float = height / 2
+        cx: float = x + rx
+        cy: float = y + ry
+
+        x1: float = cx + rx * cos(radians(start))
+        y1: float = cy - ry * sin(radians(start))
+        x2: float = cx + rx * cos(radians(end))
+        y2: float = cy - ry * sin(radians(end))
+
+        largeArc: int = 1 if (end - start) % 360 > 180 else 0
+
+        self._write(f'<path d="M {cx} {cy} L {x1} {y1} A {rx} {ry} 0 {largeArc} 0 {x2} {y2} Z" {self._fill(self._brush)} {self._stroke()}/>')
+
+    def DrawSpline(self, points: Sequence):
+        """
+        The same quadratic B-spline as wx:  The midpoints of the segments are on
+        the curve, the inner points are its control points
+        """
+        coordinates: List[Point] = [(point[0], point[1]) for point in points]
+        if len(coordinates) < 3:
+            self.DrawLines(coordinates)
+            return
+
+        def middle(p1: Point, p2: Point) -> Tuple[float, float]:
+            return (p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2
+
+        (x0, y0) = coordinates[0]
+        (mx, my) = middle(coordinates[0], coordinates[1])
+
+        path: List[str] = [f'M {x0} {y0}', f'L {mx} {my}']
+        for control, following in zip(coordinates[1:-1], coordinates[2:]):
+            mx, my = middle(control, following)
+            path.append(f'Q {control[0]} {control[1]} {mx} {my}')
+        (xn, yn) = coordinates[-1]
+        path.append(f'L {xn} {yn}')
+
+        self._write(f'<path d="{" ".join(path)}" fill="none" {self._stroke()}/>')
+
+    def DrawText(self, text: str, *args):
+        """
+        wx places the top left of the text;  SVG places the baseline
+        """
+        if len(args) == 1:
+            x, y = args[0]
+        else:
+            x, y = args
+
+        for line in text.split('\n'):
+            width, height, descent, externalLeading = self._measuringDC.GetFullTextExtent(line)
+            if self._backgroundMode == SOLID:
+                self._write(f'<rect x="{x}" y="{y}" width="{width}" height="{height}" fill="{svgColour(self._textBackground)}" stroke="none"/>')
+            self._write(f'<text x="{x}" y="{y + height - descent}" {self._fontAttributes()} fill="{svgColour(self._textForeground)}" '
+                        f'xml:space="preserve">{escape(line)}</text>')
+            y += height
+
+    def DrawBitmap(self, bitmap: Bitmap, x: int, y: int, useMask: bool = False):
+
+        stream: BytesIO = BytesIO()
+        bitmap.ConvertToImage().SaveFile(stream, BITMAP_TYPE_PNG)
+        data: str = b64encode(stream.getvalue()).decode('ascii')
+
+        self._write(f'<image x="{x}" y="{y}" width="{bitmap.GetWidth()}" height="{bitmap.GetHeight()}" href="data:image/png;base64,{data}"/>')
+
+    #
+    # The list calls, for code written for BatchingDC
+    #
+    def DrawLineList(self, lines: Iterable, pens: Iterable):
+        for line, pen in zip(lines, pens):
+            self.SetPen(pen)
+            self.DrawLine(*line)
+
+    def DrawRectangleList(self, rectangles: Iterable, pens: Iterable, brushes: Iterable):
+        for rectangle, pen, brush in zip(rectangles, pens, brushes):
+            self.SetPen(pen)
+            self.SetBrush(brush)
+            self.DrawRectangle(*rectangle)
+
+    def DrawPolygonList(self, polygons: Iterable, pens: Iterable, brushes: Iterable):
+        for polygon, pen, brush in zip(polygons, pens, brushes):
+            self.SetPen(pen)
+            self.SetBrush(brush)
+            self.DrawPolygon(polygon)
+
+    def DrawTextList(self, texts: Iterable, coords: Iterable, foregrounds: Iterable):
+        for text, (x, y), foreground in zip(texts, coords, foregrounds):
+            self.SetTextForeground(foreground)
+            self.DrawText(text, x, y)
+
+    def _write(self, element: str):
+        self._output.write(element)
+        self._output.write('\n')
+
+    def _stroke(self) -> str:
+
+        pen: Pen = self._pen
+        if pen.GetStyle() == PENSTYLE_TRANSPARENT:
+            return 'stroke="none"'
+
+        attributes: str = f'stroke="{svgColour(pen.GetColour())}" stroke-width="{max(1, pen.GetWidth())}"'
+        dashArray: str | None = DASH_ARRAYS.get(pen.GetStyle())
+        if dashArray is not None:
+            attributes = f'{attributes} stroke-dasharray="{dashArray}"'
+
+        return attributes
+
+    def _fill(self, brush: Brush) -> str:
+
+        if brush.GetStyle() == BRUSHSTYLE_TRANSPARENT:
+            return 'fill="none"'
+        return f'fill="{svgColour(brush.GetColour())}"'
+
+    def _fontAttributes(self) -> str:
+
+        font: Font = self._font
+
+        attributes: str = f'font-family={quoteattr(font.GetFaceName() or "sans-serif")} font-size="{font.GetPointSize()}pt"'
+        if font.GetWeight() == FONTWEIGHT_BOLD:
+            attributes = f'{attributes} font-weight="bold"'
+        if font.GetStyle() in (FONTSTYLE_ITALIC, FONTSTYLE_SLANT):
+            attributes = f'{attributes} font-style="italic"'
+
+        return attributes
+
+    def _points(self, points: Sequence, xoffset: int, yoffset: int) -> str:
+        return ' '.join(f'{point[0] + xoffset},{point[1] + yoffset}' for point in points)
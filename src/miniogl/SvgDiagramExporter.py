@@ -0,0 +1,84 @@
+
+from typing import Optional
+from typing import TextIO
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+from wx import FONTFAMILY_DEFAULT
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_NORMAL
+from wx import WHITE
+
+from wx import Colour
+
+from miniogl.Diagram import Diagram
+from miniogl.DiagramFrame import DiagramFrame
+from miniogl.DiagramRenderer import DEFAULT_MARGIN
+from miniogl.ResourcePool import ResourcePool
+from miniogl.Shape import BoundingBox
+from miniogl.SvgDC import SvgDC
+from miniogl.SvgDC import svgColour
+
+SVG_NAMESPACE: str = 'http://www.w3.org/2000/svg'
+
+
+class SvgDiagramExporter:
+    """
+    Writes a diagram as SVG.  The shapes are drawn back to front on an
+    `SvgDC` with their own `Draw` methods;  Every element goes straight to
+    the output, so memory use does not depend on the size of the diagram.
+    """
+    def __init__(self, diagram: Diagram, backgroundColor: Colour = WHITE, margin: int = DEFAULT_MARGIN):
+        """
+
+        Args:
+            diagram:            The diagram to export
+            backgroundColor:    Painted under the shapes
+            margin:             Blank border around the shapes, in diagram coordinates
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagram:         Diagram = diagram
+        self._backgroundColor: Colour  = backgroundColor
+        self._margin:          int     = margin
+
+    def save(self, fileName: str, scale: float = 1.0):
+        """
+        Args:
+            fileName:   Where to write the SVG
+            scale:      Size of the drawing in pixels per diagram unit
+        """
+        with open(fileName, 'w', encoding='utf-8') as output:
+            self.write(output=output, scale=scale)
+
+    def write(self, output: TextIO, scale: float = 1.0, measuringDC: Optional[DC] = None):
+        """
+        Args:
+            output:         Where to write the SVG
+            scale:          Size of the drawing in pixels per diagram unit
+            measuringDC:    Measures text;  See SvgDC
+        """
+        box: Optional[BoundingBox] = self._diagram.GetBoundingBox()
+        if box is None:
+            box = BoundingBox((0, 0, 1, 1))
+
+        margin: int = self._margin
+        left, top     = box[0] - margin, box[1] - margin
+        width, height = box[2] - box[0] + 2 * margin, box[3] - box[1] + 2 * margin
+
+        output.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        output.write(f'<svg xmlns="{SVG_NAMESPACE}" width="{round(width * scale)}" height="{round(height * scale)}" '
+                     f'viewBox="{left} {top} {width} {height}">\n')
+
+        dc: SvgDC = SvgDC(output=output, measuringDC=measuringDC)
+
+        output.write(f'<rect x="{left}" y="{top}" width="{width}" height="{height}" fill="{svgColour(self._backgroundColor)}"/>\n')
+
+        dc.SetFont(ResourcePool.font(DiagramFrame.DEFAULT_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL))
+        for shape in self._diagram.shapesView:
+            shape.Draw(dc)
+            dc.close()
+
+        output.write('</svg>\n')
@@ -0,0 +1,64 @@
+
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+from collections import OrderedDict
+
+from wx import DC
+
+TextExtent = Tuple[int, int]        # width, height
+
+
+class TextExtentCache:
+    """
+    Remembers how big strings are in a font.  Text measurement is the most
+    expensive thing the shapes do while drawing, and most diagrams redraw
+    the same names, fields and methods in the same couple of fonts.
+
+    Entries are keyed on the description of the DC font, the DC user scale
+    and the string.  The cache is shared by the whole process and keeps at
+    most `MAXIMUM_ENTRIES` least recently used extents.
+
+    `hits` and `misses` count the lookups since the last `clear`.
+    """
+    MAXIMUM_ENTRIES: int = 4096
+
+    hits:   int = 0
+    misses: int = 0
+
+    _extents: 'OrderedDict[Hashable, TextExtent]' = OrderedDict()
+
+    @classmethod
+    def textExtent(cls, dc: DC, text: str) -> TextExtent:
+        """
+        Use instead of `dc.GetTextExtent`
+
+        Args:
+            dc:     The DC with the font to measure in
+            text:   The string to measure
+
+        Returns:  The width and height of the string in logical units
+        """
+        key:    Hashable   = (dc.GetFont().GetNativeFontInfoDesc(), tuple(dc.GetUserScale()), text)
+        extent: Optional[TextExtent] = cls._extents.get(key)
+        if extent is None:
+            cls.misses += 1
+            width, height = dc.GetTextExtent(text)
+
+            cls._extents[key] = (width, height)
+            if len(cls._extents) > TextExtentCache.MAXIMUM_ENTRIES:
+                cls._extents.popitem(last=False)
+
+            return width, height
+
+        cls.hits += 1
+        cls._extents.move_to_end(key)
+
+        return extent
+
+    @classmethod
+    def clear(cls):
+        cls._extents.clear()
+        cls.hits   = 0
+        cls.misses = 0
@@ -4,7 +4,6 @@ from logging import getLogger
 
 from wx import BLACK
 from wx import RED
-from wx import Size
 from wx import WHITE
 from wx import PENSTYLE_SOLID
 from wx import PENSTYLE_DOT
@@ -16,8 +15,10 @@ from wx import Pen
 
 from wx import DC
 
+from miniogl.ResourcePool import ResourcePool
 from miniogl.Shape import Shape
 from miniogl.RectangleShape import RectangleShape
+from miniogl.TextExtentCache import TextExtentCache
 
 from miniogl.models.TextShapeModel import TextShapeModel
 
@@ -33,11 +34,13 @@ TEXT_WIDTH_ADJUSTMENT:  int = 24
 
 
 class TextShape(RectangleShape):
-
-    clsLogger: Logger = getLogger(__name__)
     """
     A text shape that can be attached to another shape standalone).
     """
+    __slots__ = ('_text', '_textColor', '_textBackgroundColor', '_redColor', '_font', '_selectedPen')
+
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, x: int, y: int, text: str, parent=None, font: Font = None):
         """
 
@@ -60,7 +63,7 @@ class TextShape(RectangleShape):
 
         self._redColor:    Colour = RED
         self._font:        Font   = font
-        self._selectedPen: Pen = Pen(colour=RED, width=1, style=PENSTYLE_DOT)
+        self._selectedPen: Pen    = ResourcePool.pen(RED, width=1, style=PENSTYLE_DOT)
 
         self._model: TextShapeModel = TextShapeModel(self)
 
@@ -76,7 +79,8 @@ class TextShape(RectangleShape):
         """
         # RectangleShape.Attach(self, diagram)
         super().Attach(diagram)
-        self._textBackgroundColor = self._diagram.panel.GetBackgroundColour()
+        if self._diagram.panel is not None:         # Diagrams rendered offscreen have no frame
+            self._textBackgroundColor = self._diagram.panel.GetBackgroundColour()
 
     @property
     def text(self) -> str:
@@ -93,7 +97,9 @@ class TextShape(RectangleShape):
         Args:
               newValue
         """
-        self._text = newValue
+        if newValue != self._text:
+            self._text = newValue
+            self._indicateAppearanceChanged()
 
     @property
     def color(self) -> Colour:
@@ -110,7 +116,9 @@ class TextShape(RectangleShape):
         Args:
              color
         """
-        self._textColor = color
+        if color != self._textColor:
+            self._textColor = color
+            self._indicateAppearanceChanged()
 
     @property
     def font(self) -> Font:
@@ -183,14 +191,14 @@ class TextShape(RectangleShape):
         # RectangleShape.UpdateFromModel(self)
         super().UpdateFromModel()
         # get the diagram frame ratio between the shape and the model
-        ratio = self.diagram.panel.currentZoom
+        ratio: float = self.diagram.panel.viewTransform.scale
 
         fontSize = round(self.model.GetFontSize() * ratio)
         TextShape.clsLogger.debug(f'UpdateFromModel - ratio: {ratio}')
 
-        # set the new font size
-        if self._font is not None:
-            self._font.SetPointSize(fontSize)
+        # set the new font size;  The font may be shared, so get another one
+        if self._font is not None and self._font.GetPointSize() != fontSize:
+            self._font = ResourcePool.font(fontSize, self._font.GetFamily(), self._font.GetStyle(), self._font.GetWeight())
 
     def UpdateModel(self):
         """
@@ -202,7 +210,7 @@ class TextShape(RectangleShape):
 
         # get the ratio between the model and the shape (view) from
         # the diagram frame where the shape is displayed.
-        ratio = self.diagram.panel.currentZoom
+        ratio: float = self.diagram.panel.viewTransform.scale
 
         # TextShape.clsLogger.debug(f'UpdateModel - ratio: {ratio}')
         if self.font is not None:
@@ -230,11 +238,11 @@ class TextShape(RectangleShape):
 
     def _computeTextSize(self, dc: DC):
 
-        textSize:       Size = dc.GetTextExtent(self.text)
-        adjustedWidth:  int  = textSize.GetWidth()  + TEXT_WIDTH_ADJUSTMENT
-        adjustedHeight: int  = textSize.GetHeight() + TEXT_HEIGHT_ADJUSTMENT
+        textWidth, textHeight = TextExtentCache.textExtent(dc, self.text)
+        adjustedWidth:  int = textWidth  + TEXT_WIDTH_ADJUSTMENT
+        adjustedHeight: int = textHeight + TEXT_HEIGHT_ADJUSTMENT
 
-        self.clsLogger.debug(f'{textSize=} {adjustedWidth=} {adjustedHeight=}')
+        self.clsLogger.debug(f'{textWidth=} {textHeight=} {adjustedWidth=} {adjustedHeight=}')
         self.SetSize(width=adjustedWidth, height=adjustedHeight)
 
     def _drawText(self, dc: DC):
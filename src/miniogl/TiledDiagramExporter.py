@@ -0,0 +1,200 @@
+
+from typing import Callable
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+from math import floor
+
+from multiprocessing import get_context
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+
+from wx import WHITE
+
+from wx import Bitmap
+from wx import Colour
+from wx import MemoryDC
+from wx import NullBitmap
+
+from miniogl.Diagram import Diagram
+from miniogl.DiagramRenderer import DEFAULT_MARGIN
+from miniogl.DiagramRenderer import DiagramRenderer
+from miniogl.Shape import BoundingBox
+from miniogl.StreamingPngWriter import BYTES_PER_PIXEL
+from miniogl.StreamingPngWriter import StreamingPngWriter
+
+DEFAULT_TILE_SIZE: int = 1024
+
+Tile     = NewType('Tile', Tuple[int, int, int, int])     # x, y, width, height in image pixels
+TileRows = NewType('TileRows', List[List[Tile]])
+
+DiagramFactory = Callable[[], Diagram]
+
+
+def tileRows(width: int, height: int, tileSize: int) -> TileRows:
+    """
+    Args:
+        width:      Image width in pixels
+        height:     Image height in pixels
+        tileSize:   Largest tile side in pixels
+
+    Returns:  The tiles covering the image, a row at a time, top to bottom
+    """
+    rows: TileRows = TileRows([])
+    for y in range(0, height, tileSize):
+        tileHeight: int = min(tileSize, height - y)
+        rows.append([Tile((x, y, min(tileSize, width - x), tileHeight)) for x in range(0, width, tileSize)])
+
+    return rows
+
+
+def renderTile(renderer: DiagramRenderer, tile: Tile, origin: Tuple[int, int], scale: float) -> bytes:
+    """
+    Args:
+        renderer:   Draws the diagram
+        tile:       The part of the image to render
+        origin:     The diagram point at the top left of the image
+        scale:      Image pixels per diagram unit
+
+    Returns:  The RGB pixels of the tile
+    """
+    x, y, width, height = tile
+
+    bitmap: Bitmap   = Bitmap(width, height)
+    dc:     MemoryDC = MemoryDC(bitmap)
+
+    dc.SetDeviceOrigin(-x, -y)
+    bounds: BoundingBox = BoundingBox((
+        floor(origin[0] + x / scale) - 1,            floor(origin[1] + y / scale) - 1,
+        ceil(origin[0] + (x + width) / scale) + 1,   ceil(origin[1] + (y + height) / scale) + 1
+    ))
+    renderer.renderOn(dc=dc, bounds=bounds, scale=scale, origin=origin)
+    dc.SelectObject(NullBitmap)
+
+    return bytes(bitmap.ConvertToImage().GetData())
+
+
+class TiledDiagramExporter:
+    """
+    Exports diagrams too big for a single bitmap.  The image is rendered a
+    tile at a time, with only the shapes that intersect the tile, and
+    streamed to the PNG file a row of tiles at a time.
+
+    Tiles can be rendered by worker processes.  Shapes hold wx objects and
+    cannot be sent to them, so each worker builds its own copy of the
+    diagram with a factory;  It must be a picklable module level function.
+    """
+    def __init__(self, diagram: Diagram, tileSize: int = DEFAULT_TILE_SIZE, backgroundColor: Colour = WHITE, margin: int = DEFAULT_MARGIN):
+        """
+
+        Args:
+            diagram:            The diagram to export
+            tileSize:           Largest tile side in pixels
+            backgroundColor:    Painted under the shapes
+            margin:             Blank border around the shapes, in diagram coordinates
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._tileSize:        int             = tileSize
+        self._backgroundColor: Colour          = backgroundColor
+        self._margin:          int             = margin
+        self._renderer:        DiagramRenderer = DiagramRenderer(diagram=diagram, backgroundColor=backgroundColor, margin=margin)
+
+    def savePng(self, fileName: str, scale: float = 1.0, processes: int = 0, diagramFactory: Optional[DiagramFactory] = None) -> Tuple[int, int]:
+        """
+        Args:
+            fileName:       Where to write the image
+            scale:          Image pixels per diagram unit
+            processes:      Number of worker processes;  0 renders in this process
+            diagramFactory: Builds the diagram in the workers;  Needed when processes is not 0
+
+        Returns:  The image width and height
+        """
+        bounds: Optional[BoundingBox] = self._renderer.bounds()
+        if bounds is None:
+            bounds = BoundingBox((0, 0, 1, 1))
+
+        width:  int = max(1, ceil((bounds[2] - bounds[0]) * scale))
+        height: int = max(1, ceil((bounds[3] - bounds[1]) * scale))
+        origin: Tuple[int, int] = (bounds[0], bounds[1])
+        rows:   TileRows        = tileRows(width=width, height=height, tileSize=self._tileSize)
+
+        self.logger.info(f'Exporting {width}x{height} in {len(rows) * len(rows[0])} tiles to {fileName}')
+        with open(fileName, 'wb') as output:
+            writer: StreamingPngWriter = StreamingPngWriter(output=output, width=width, height=height)
+            if processes > 0:
+                assert diagramFactory is not None, 'Worker processes need a diagram factory'
+                self._renderInWorkers(writer, rows, origin, scale, processes, diagramFactory)
+            else:
+                for row in rows:
+                    pixels: List[bytes] = [renderTile(self._renderer, tile, origin, scale) for tile in row]
+                    writer.writeRows(self._stitch(row, pixels), rowCount=row[0][3])
+            writer.close()
+
+        return width, height
+
+    def _renderInWorkers(self, writer: StreamingPngWriter, rows: TileRows, origin: Tuple[int, int], scale: float, processes: int, diagramFactory: DiagramFactory):
+        """
+        The next row of tiles is rendered while the current one is written, so
+        at most two rows are in memory
+        """
+        backgroundColor: Tuple[int, int, int] = self._backgroundColor.Get(includeAlpha=False)
+
+        with ProcessPoolExecutor(max_workers=processes, mp_context=get_context('spawn'),
+                                 initializer=_initializeWorker, initargs=(diagramFactory, backgroundColor, self._margin)) as executor:
+
+            def submit(row: List[Tile]) -> List[Future]:
+                return [executor.submit(_renderTileInWorker, tile, origin, scale) for tile in row]
+
+            pending: List[Future] = submit(rows[0])
+            for index, row in enumerate(rows):
+                current: List[Future] = pending
+                if index + 1 < len(rows):
+                    pending = submit(rows[index + 1])
+                writer.writeRows(self._stitch(row, [future.result() for future in current]), rowCount=row[0][3])
+
+    def _stitch(self, row: List[Tile], pixels: List[bytes]) -> bytes:
+        """
+        Args:
+            row:    A row of tiles
+            pixels: The RGB pixels of each tile
+
+        Returns:  The image rows covered by the tiles
+        """
+        band: bytearray = bytearray()
+        for y in range(row[0][3]):
+            for tile, tilePixels in zip(row, pixels):
+                rowLength: int = tile[2] * BYTES_PER_PIXEL
+                band += tilePixels[y * rowLength:(y + 1) * rowLength]
+
+        return bytes(band)
+
+
+#
+# Worker process state;  Set up once per process by the pool initializer
+#
+_workerApp = None
+_workerRenderer: Optional[DiagramRenderer] = None
+
+
+def _initializeWorker(diagramFactory: DiagramFactory, backgroundColor: Tuple[int, int, int], margin: int):
+
+    from wx import App
+
+    global _workerApp
+    global _workerRenderer
+
+    _workerApp      = App()
+    _workerRenderer = DiagramRenderer(diagram=diagramFactory(), backgroundColor=Colour(*backgroundColor), margin=margin)
+
+
+def _renderTileInWorker(tile: Tile, origin: Tuple[int, int], scale: float) -> bytes:
+    assert _workerRenderer is not None, 'Worker was not initialized'
+    return renderTile(_workerRenderer, tile, origin, scale)
@@ -0,0 +1,116 @@
+
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from dataclasses import dataclass
+
+try:
+    import numpy
+except ImportError:
+    numpy = None        # type: ignore
+
+ViewPoint  = Tuple[int, int]
+ViewPoints = List[ViewPoint]
+
+NUMPY_MINIMUM_POINTS: int = 32      # Fewer points are converted faster one by one than through NumPy arrays
+
+
+@dataclass(frozen=True)
+class ViewTransform:
+    """
+    How the model (ShapeModel) coordinates map to the shape (view) coordinates:
+
+        view = model * scale + offset
+
+    The diagram frame builds a new one only when its zoom or offsets change;  The
+    shapes read it once per update instead of asking the frame for each value.
+    The conversions round like the shapes always did, so a round trip through
+    the model is stable.
+    """
+    scale: float = 1.0
+    dx:    float = 0        # abscissa offset between the view and the model
+    dy:    float = 0        # ordinate offset between the view and the model
+
+    def toView(self, x: float, y: float) -> ViewPoint:
+        """
+        Args:
+            x:  model abscissa
+            y:  model ordinate
+
+        Returns:  The shape (view) position
+        """
+        return round(self.scale * x) + round(self.dx), round(self.scale * y) + round(self.dy)
+
+    def toModel(self, x: float, y: float) -> ViewPoint:
+        """
+        Args:
+            x:  shape (view) abscissa
+            y:  shape (view) ordinate
+
+        Returns:  The model position
+        """
+        return round((x - self.dx) // self.scale), round((y - self.dy) // self.scale)
+
+    def toViewSize(self, width: float, height: float) -> ViewPoint:
+        """
+        Args:
+            width:   model width
+            height:  model height
+
+        Returns:  The shape (view) size
+        """
+        return round(width * self.scale), round(height * self.scale)
+
+    def toModelSize(self, width: float, height: float) -> ViewPoint:
+        """
+        Args:
+            width:   shape (view) width
+            height:  shape (view) height
+
+        Returns:  The model size
+        """
+        return round(width // self.scale), round(height // self.scale)
+
+    def toViewPoints(self, points: Iterable[Tuple[float, float]]) -> ViewPoints:
+        """
+        `toView` for many points at once;  With NumPy when it is installed and
+        there are enough points
+
+        Args:
+            points:  model positions
+
+        Returns:  The shape (view) positions, in the same order
+        """
+        points = list(points)
+        if numpy is not None and len(points) >= NUMPY_MINIMUM_POINTS:
+            view = numpy.rint(numpy.array(points, dtype=float) * self.scale) + (round(self.dx), round(self.dy))
+            return [(x, y) for x, y in view.astype(int).tolist()]
+
+        scale: float = self.scale
+        dx:    int   = round(self.dx)
+        dy:    int   = round(self.dy)
+        return [(round(scale * x) + dx, round(scale * y) + dy) for x, y in points]
+
+    def toModelPoints(self, points: Iterable[Tuple[float, float]]) -> ViewPoints:
+        """
+        `toModel` for many points at once;  With NumPy when it is installed and
+        there are enough points
+
+        Args:
+            points:  shape (view) positions
+
+        Returns:  The model positions, in the same order
+        """
+        points = list(points)
+        if numpy is not None and len(points) >= NUMPY_MINIMUM_POINTS:
+            model = numpy.floor_divide(numpy.array(points, dtype=float) - (self.dx, self.dy), self.scale)
+            return [(x, y) for x, y in model.astype(int).tolist()]
+
+        scale: float = self.scale
+        dx:    float = self.dx
+        dy:    float = self.dy
+        return [(round((x - dx) // scale), round((y - dy) // scale)) for x, y in points]
+
+
+IDENTITY_TRANSFORM: ViewTransform = ViewTransform()
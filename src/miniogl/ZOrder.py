@@ -0,0 +1,117 @@
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from itertools import chain
+
+from miniogl.Shape import Shape
+
+
+class ZOrder:
+    """
+    The display list of a diagram.  Iterating it yields the shapes back to
+    front, that is in drawing order.
+
+    Shapes only ever go to one of the two ends of the list, so it is kept as
+    two insertion ordered dictionaries keyed by identity.  Raised shapes are
+    appended to `_raised`;  Lowered shapes are appended to `_lowered` which
+    is read backwards.  Every shape also gets an integer z key;  Front keys
+    count up from 0 and back keys count down, so comparing keys gives the
+    display order without walking the list.
+
+    Adding, removing, raising and lowering a shape are O(1).
+    """
+    def __init__(self):
+
+        self._raised:  Dict[int, Shape] = {}
+        self._lowered: Dict[int, Shape] = {}
+        self._keys:    Dict[int, int]   = {}
+
+        self._frontKey: int = 0
+        self._backKey:  int = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, shape) -> bool:
+        return id(shape) in self._keys
+
+    def __iter__(self) -> Iterator[Shape]:
+        return chain(reversed(self._lowered.values()), self._raised.values())
+
+    def __reversed__(self) -> Iterator[Shape]:
+        return chain(reversed(self._raised.values()), self._lowered.values())
+
+    def key(self, shape: Shape) -> int:
+        """
+        Args:
+            shape:  A shape in the list
+
+        Returns:  The z key of the shape;  Higher keys are drawn later
+        """
+        return self._keys[id(shape)]
+
+    def add(self, shape: Shape):
+        """
+        Put a shape in front of all the others.  Adding a shape already in
+        the list does nothing.
+
+        Args:
+            shape:  The shape to add
+        """
+        if id(shape) not in self._keys:
+            self._toFront(shape)
+
+    def remove(self, shape: Shape):
+        """
+        Remove a shape from the list.  Unknown shapes are ignored.
+
+        Args:
+            shape:  The shape to remove
+        """
+        shapeId: int = id(shape)
+
+        self._raised.pop(shapeId, None)
+        self._lowered.pop(shapeId, None)
+        self._keys.pop(shapeId, None)
+
+    def clear(self):
+        self._raised.clear()
+        self._lowered.clear()
+        self._keys.clear()
+
+    def raiseToFront(self, shapes: List[Shape]):
+        """
+        Move the shapes to the end of the list;  They keep their relative order.
+        Shapes not in the list are ignored.
+
+        Args:
+            shapes:  Shapes in the list
+        """
+        for shape in shapes:
+            if shape not in self:
+                continue
+            self.remove(shape)
+            self._toFront(shape)
+
+    def lowerToBack(self, shapes: List[Shape]):
+        """
+        Move the shapes to the start of the list;  They keep their relative order.
+        Shapes not in the list are ignored.
+
+        Args:
+            shapes:  Shapes in the list
+        """
+        for shape in reversed(shapes):
+            if shape not in self:
+                continue
+            self.remove(shape)
+            self._backKey -= 1
+            self._lowered[id(shape)] = shape
+            self._keys[id(shape)]    = self._backKey
+
+    def _toFront(self, shape: Shape):
+        self._frontKey += 1
+        self._raised[id(shape)] = shape
+        self._keys[id(shape)]   = self._frontKey
@@ -6,6 +6,7 @@ class ShapeModel:
     """
     This class is the shape model('view' in an MVC pattern).
     """
+    __slots__ = ('_views', '_x', '_y')
 
     def __init__(self, viewShape=None):
         """
@@ -6,6 +6,8 @@ class TextShapeModel(RectangleShapeModel):
     """
     This class is the model of a TextShape ('view' in an MVC pattern).
     """
+    __slots__ = ('_fontSize', )
+
     def __init__(self, viewShape=None):
         """
         Used when the model is created first without any view.
@@ -76,6 +76,7 @@ class RotatableShape(RectangleShape):
         self._scale = scale
         self._ox, self._oy = self._sox * scale, self._soy * scale
         self._width, self._height = self._sw * scale, self._sh * scale
+        self._indicateGeometryChanged()
 
     def GetScale(self):
         """
@@ -99,6 +100,7 @@ class RotatableShape(RectangleShape):
             self._sox, self._soy = x / scale, y / scale
         else:
             self._sox, self._soy = 0, 0
+        self._indicateGeometryChanged()
 
     def _InitRotations(self):
         """
@@ -139,6 +141,7 @@ class RotatableShape(RectangleShape):
                 child.SetDraggable(False)
         self._width, self._height = VShape.convert(1, self._width, self._height)
         self._ox, self._oy = VShape.convert(1, self._ox, self._oy)
+        self._indicateGeometryChanged()
 
     def Draw(self, dc, withChildren=True):
         """
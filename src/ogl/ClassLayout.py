@@ -0,0 +1,31 @@
+
+from typing import Tuple
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ClassLayoutRow:
+    """
+    A line of text in a class
+    """
+    text:     str  = ''
+    y:        int  = 0          # From the top of the class
+    width:    int  = 0
+    centered: bool = False      # Header rows are centered, members start at the margin
+    nameFont: bool = False      # Drawn with the class name font
+
+
+@dataclass(frozen=True)
+class ClassLayout:
+    """
+    Where everything in a class goes, relative to its top left corner.
+    `OglClass.Draw` replays it and `OglClass.autoResize` sizes the class
+    from it.
+    """
+    rows:         Tuple[ClassLayoutRow, ...] = ()
+    separators:   Tuple[int, ...]            = ()   # y of the lines across the class
+    headerWidth:  int = 0
+    fieldsWidth:  int = 0
+    methodsWidth: int = 0
+    height:       int = 0
@@ -5,6 +5,9 @@ from typing import Tuple
 
 from wx import DC
 
+from miniogl.TextExtentCache import TextExtentCache
+
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.OglObject import OglObject
 
 from pyutmodelv2.PyutActor import PyutActor
@@ -57,6 +60,11 @@ class OglActor(OglObject):
             withChildren:   Draw the children or not
 
         """
+        detailLevel: OglDetailLevel = self._detailLevel()
+        if detailLevel is not OglDetailLevel.FULL:
+            self._drawSimplified(dc, detailLevel, self.pyutObject.name)
+            return
+
         OglObject.Draw(self, dc)
         dc.SetFont(self._defaultFont)
         # Gets the minimum bounding box for the shape
@@ -88,7 +96,7 @@ class OglActor(OglObject):
             x:
         """
 
-        textWidth, textHeight = dc.GetTextExtent(self.pyutObject.name)
+        textWidth, textHeight = TextExtentCache.textExtent(dc, self.pyutObject.name)
 
         y = round(centerY + 0.5 * height - MARGIN - 0.1 * actorHeight)
 
@@ -29,6 +29,7 @@ from wx import Font
 from pyutmodelv2.PyutLink import PyutLink
 
 from miniogl.LineShape import Segments
+from miniogl.ResourcePool import ResourcePool
 
 from ogl.OglAssociationLabel import OglAssociationLabel
 from ogl.OglLink import OglLink
@@ -71,7 +72,7 @@ class OglAssociation(OglLink):
 
         super().__init__(srcShape, pyutLink, dstShape, srcPos=srcPos, dstPos=dstPos)
 
-        self._defaultFont: Font = Font(self._preferences.associationTextFontSize, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+        self._defaultFont: Font = ResourcePool.font(self._preferences.associationTextFontSize, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
 
         self._associationName:        OglAssociationLabel = cast(OglAssociationLabel, None)
         self._sourceCardinality:      OglAssociationLabel = cast(OglAssociationLabel, None)
@@ -8,6 +8,7 @@ from miniogl.TextShape import TextShape
 from wx import Font
 
 from ogl.EventEngineMixin import EventEngineMixin
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.events.OglEvents import OglEventType
 
 
@@ -23,6 +24,10 @@ class OglAssociationLabel(TextShape, EventEngineMixin):
 
     def Draw(self, dc: DC, withChildren: bool = True):
 
+        if self._diagram is not None and self._diagram.panel is not None:
+            if OglDetailLevel.fromZoom(self._diagram.panel.currentZoom) is not OglDetailLevel.FULL:
+                return      # Too small to read when zoomed out
+
         super().Draw(dc=dc, withChildren=withChildren)
 
         if self.moving is True:
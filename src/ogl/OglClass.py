@@ -1,4 +1,5 @@
 
+from typing import List
 from typing import Tuple
 from typing import cast
 
@@ -16,7 +17,6 @@ from wx import Font
 from wx import ClientDC
 from wx import MouseEvent
 from wx import Point
-from wx import Brush
 from wx import Colour
 
 from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
@@ -28,8 +28,13 @@ from pyutmodelv2.PyutObject import PyutObject
 from pyutmodelv2.PyutClass import PyutClass
 
 from miniogl.MiniOglColorEnum import MiniOglColorEnum
+from miniogl.ResourcePool import ResourcePool
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
+from miniogl.TextExtentCache import TextExtentCache
 
+from ogl.ClassLayout import ClassLayout
+from ogl.ClassLayout import ClassLayoutRow
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.OglDimensions import OglDimensions
 from ogl.OglObject import OglObject
 from ogl.OglObject import DEFAULT_FONT_SIZE
@@ -67,6 +72,9 @@ class OglClass(OglObject):
     For more instructions about how to create an OGL object, refer
     to the `OglObject` class.
     """
+    clsRenderCacheable: bool = True
+    clsDrawBatched:     bool = False    # The render cache needs the raster DC
+
     def __init__(self, pyutClass: PyutClass | None, w: int = 0, h: int = 0):
         """
 
@@ -94,19 +102,22 @@ class OglClass(OglObject):
 
         super().__init__(pyutObject, width=width, height=height)
 
-        self._nameFont:  Font             = Font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD)
+        self._nameFont:  Font             = ResourcePool.font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD)
         oglTextColor:    MiniOglColorEnum = self._oglPreferences.classTextColor
         self._textColor: Colour           = Colour(MiniOglColorEnum.toWxColor(oglTextColor))
 
         oglBackgroundColor: MiniOglColorEnum = self._oglPreferences.classBackGroundColor
         backgroundColor:    Colour           = Colour(MiniOglColorEnum.toWxColor(oglBackgroundColor))
 
-        self.brush = Brush(backgroundColor)
+        self.brush = ResourcePool.brush(backgroundColor)
 
         self.logger:    Logger = getLogger(__name__)
 
         self._menuHandler: OglClassMenuHandler = cast(OglClassMenuHandler, None)
 
+        self._layout:         ClassLayout | None = None
+        self._layoutCacheKey: Tuple              = ()
+
     def handleSelectAnchorPointSelection(self, event: MouseEvent):
         """
         May be called (inexcusably bad form) by the selection anchor point left down handler
@@ -123,25 +134,37 @@ class OglClass(OglObject):
             self.eventEngine.sendEvent(OglEventType.CreateLollipopInterface, implementor=self, attachmentPoint=selectData.selectAnchorPoint)
 
     def GetTextWidth(self, dc, text):
-        width = dc.GetTextExtent(text)[0]
+        width = TextExtentCache.textExtent(dc, text)[0]
         return width
 
     def GetTextHeight(self, dc, text):
-        height = dc.GetTextExtent(text)[1]
+        height = TextExtentCache.textExtent(dc, text)[1]
         return height
 
     def Draw(self, dc, withChildren=False):
         """
-        Paint handler, draws the content of the shape.
-
-        WARNING: Every change here must be reported in autoResize pyutMethod
+        Paint handler, draws the content of the shape.  An unchanged class is
+        copied from its render cache;  When zoomed out only a box is drawn.
 
         Args:
             dc: device context to draw to
             withChildren: A boolean indicating whether to draw this figure's children
         """
+        detailLevel: OglDetailLevel = self._detailLevel()
+        if detailLevel is OglDetailLevel.FULL:
+            self._drawCached(dc, self._drawClass)
+        else:
+            self._drawSimplified(dc, detailLevel, self.pyutObject.name)
+
+    def _drawClass(self, dc: DC):
+        """
+        Draws the content of the shape by replaying its layout.
 
-        pyutObject: PyutClass = cast(PyutClass, self.pyutObject)
+        Args:
+            dc: device context to draw to
+        """
+        pyutObject: PyutClass   = cast(PyutClass, self.pyutObject)
+        layout:     ClassLayout = self._getLayout(dc)
 
         # Draw rectangle shape
         super().Draw(dc)
@@ -150,62 +173,41 @@ class OglClass(OglObject):
         x, y = self.GetPosition()           # Get position
         dc.SetClippingRegion(x, y, w, h)
 
-        # Draw header
-        (headerX, headerY, headerW, headerH) = self._drawClassHeader(dc, True)
-        y = headerY + headerH
-
-        if pyutObject.showFields is True:
-            # Draw line
-            dc.DrawLine(x, y, x + w, y)
-
-            # Draw fields
-            (fieldsX, fieldsY, fieldsW, fieldsH) = self._drawClassFields(dc, True, initialY=y)
-            y = fieldsY + fieldsH
-        # Draw line
-        dc.DrawLine(x, y, x + w, y)
-        #
-        # Method needs to be called even though returned values not used  -- TODO look at refactoring
-        #
-        if pyutObject.showMethods is True:
-            (methodsX, methodsY, methodsW, methodsH) = self._drawClassMethods(dc=dc, initialY=y)
-            # noinspection PyUnusedLocal
-            y = methodsY + methodsH
-            if methodsW > self._width:
-                self._width = methodsW
+        for separatorY in layout.separators:
+            dc.DrawLine(x, y + separatorY, x + w, y + separatorY)
+
+        dc.SetTextForeground(self._textColor)
+        for row in layout.rows:
+            if row.nameFont is True:
+                dc.SetFont(self._nameFont)
+            else:
+                dc.SetFont(self._defaultFont)
+            if row.centered is True:
+                dc.DrawText(row.text, x + (w - row.width) // 2, y + row.y)
+            else:
+                dc.DrawText(row.text, x + MARGIN, y + row.y)
+        dc.SetFont(self._defaultFont)
+
+        if pyutObject.showMethods is True and layout.methodsWidth > self._width:
+            self._width = layout.methodsWidth
+            self._indicateGeometryChanged()
 
         dc.DestroyClippingRegion()
 
     def autoResize(self):
         """
-        Auto-resize the class
-
-        WARNING: Every change here must be reported in DRAW pyutMethod
+        Auto-resize the class;  Called after the class was edited, so the layout is measured again
         """
-        # Init
-        pyutObject: PyutClass = cast(PyutClass, self.pyutObject)
-        umlFrame = self.diagram.panel
-        dc = ClientDC(umlFrame)
-
-        # Get header size
-        (headerX, headerY, headerW, headerH) = self._drawClassHeader(dc, False, calcWidth=True)
-        y = headerY + headerH
-
-        # Get the size of the field's portion of the display
-        if pyutObject.showFields is True:
-            (fieldsX, fieldsY, fieldsW, fieldsH) = self._drawClassFields(dc, False, initialY=y)
-            y = fieldsY + fieldsH
-        else:
-            fieldsW, fieldsH = 0, 0
+        self.indicateContentChanged()
 
-        # Get method's size
-        if pyutObject.showMethods is True:
-            (methodX, methodY, methodW, methodH) = self._drawClassMethods(dc=dc, initialY=y)
-            y = methodY + methodH
-        else:
-            methodW, methodH = 0, 0
+        pyutObject: PyutClass   = cast(PyutClass, self.pyutObject)
+        layout:     ClassLayout = self._getLayout()
 
-        w = max(headerW, fieldsW, methodW)
-        h = y - headerY
+        # The fields never had their width computed;  The current width stands in for them
+        fieldsW: int = self._width if pyutObject.showFields is True else 0
+
+        w = max(layout.headerWidth, fieldsW, layout.methodsWidth)
+        h = layout.height
         w += 2 * MARGIN
 
         minDimensions: OglDimensions = self._oglPreferences.classDimensions
@@ -234,6 +236,52 @@ class OglClass(OglObject):
 
         self._menuHandler.popupMenu(event=event)
 
+    def _renderCacheKey(self) -> Tuple:
+        """
+        Returns:  What the class drawing depends on
+        """
+        return super()._renderCacheKey() + self._layoutKey()
+
+    def _layoutKey(self) -> Tuple:
+        """
+        Computed on every draw, so nothing is formatted and no preference is parsed.
+        pyutmodelv2 has no revision counter;  The key holds the class level values
+        and a fingerprint of the displayed values of every field and method, so
+        that members edited in place are redrawn.  Any preference write changes
+        the layout.
+
+        Returns:  What the class layout depends on
+        """
+        pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
+
+        return (
+            self._revision, self._oglPreferences.changeCount,
+            pyutClass.name, pyutClass.stereotype, pyutClass.displayStereoType,
+            pyutClass.showFields, pyutClass.showMethods,
+            pyutClass.displayParameters, pyutClass.displayConstructor, pyutClass.displayDunderMethods,
+            tuple((f.name, f.type, f.visibility, f.defaultValue) for f in pyutClass.fields),
+            tuple(
+                (m.name, m.visibility, m.returnType, tuple((p.name, p.type, p.defaultValue) for p in m.parameters))
+                for m in pyutClass.methods
+            ),
+        )
+
+    def _getLayout(self, dc: DC | None = None) -> ClassLayout:
+        """
+        Args:
+            dc:  Measures the text if the layout is out of date;  A client DC on the diagram frame when not given
+
+        Returns:  The layout for the current contents of the class
+        """
+        layoutKey: Tuple = self._layoutKey()
+        if self._layout is None or layoutKey != self._layoutCacheKey:
+            if dc is None:
+                dc = ClientDC(self.diagram.panel)
+            self._layout         = self._computeLayout(dc)
+            self._layoutCacheKey = layoutKey
+
+        return self._layout
+
     def _didWeClickOnSelectAnchorPoint(self, clickPoint: Point) -> ClickedOnSelectAnchorPointData:
         """
 
@@ -275,202 +323,100 @@ class OglClass(OglObject):
             ans = True
         return ans
 
-    def _drawClassHeader(self, dc: DC, draw: bool = False, initialX=None, initialY=None, calcWidth: bool = False):
+    def _computeLayout(self, dc: DC) -> ClassLayout:
         """
-        Calculate the class header position and size and display it if
-        a draw is True
+        Measures the header, the fields and the methods
 
         Args:
-            dc:
-            draw:
-            initialX:
-            initialY:
-            calcWidth:
+            dc:  Measures the text
 
-        Returns: tuple (x, y, w, h) = position and size of the header
+        Returns:  The class layout
         """
-        # Init
-        dc.SetFont(self._defaultFont)
-        dc.SetTextForeground(self._textColor)
+        pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
 
-        x, y = self.GetPosition()
-        if initialX is not None:
-            x = initialX
-        if initialY is not None:
-            y = initialY
-        w = self._width
-        h = 0
-        if calcWidth:
-            w = 0
+        rows:       List[ClassLayoutRow] = []
+        separators: List[int]            = []
 
+        dc.SetFont(self._defaultFont)
         # define space between the text and line
-        lth = dc.GetTextExtent("*")[1] // 2
+        lth: int = TextExtentCache.textExtent(dc, "*")[1] // 2
 
-        # from where begin the text
-        h += lth
-
-        # draw a pyutClass name
-        name: str = self.pyutObject.name
+        # The header;  The name is measured with its font, its height with the default one
+        h: int = lth
+        name: str = pyutClass.name
         dc.SetFont(self._nameFont)
         nameWidth: int = self.GetTextWidth(dc, name)
-        if draw:
-            dc.DrawText(name, x + (w - nameWidth) // 2, y + h)
-        if calcWidth:
-            w = max(nameWidth, w)
+        rows.append(ClassLayoutRow(text=name, y=h, width=nameWidth, centered=True, nameFont=True))
         dc.SetFont(self._defaultFont)
-        h += self.GetTextHeight(dc, str(name))
+        h += self.GetTextHeight(dc, name)
         h += lth
-        #
-        # Draw the stereotype value
-        #
-        pyutClass: PyutClass = self.pyutObject
-        stereo: PyutStereotype = pyutClass.stereotype
 
+        stereo: PyutStereotype = pyutClass.stereotype
         if pyutClass.displayStereoType is True and stereo is not None and stereo != PyutStereotype.NO_STEREOTYPE:
             stereoTypeValue: str = f'<<{stereo.value}>>'
         else:
             stereoTypeValue = ''
 
-        stereoTypeValueWidth = self.GetTextWidth(dc, stereoTypeValue)
-        if draw:
-            dc.DrawText(stereoTypeValue, x + (w - stereoTypeValueWidth) // 2, y + h)
-        if calcWidth:
-            w = max(stereoTypeValueWidth, w)
-        h += self.GetTextHeight(dc, str(stereoTypeValue))
+        stereoTypeValueWidth: int = self.GetTextWidth(dc, stereoTypeValue)
+        rows.append(ClassLayoutRow(text=stereoTypeValue, y=h, width=stereoTypeValueWidth, centered=True))
+        h += self.GetTextHeight(dc, stereoTypeValue)
         h += lth
+        headerWidth: int = max(nameWidth, stereoTypeValueWidth)
 
-        # Return sizes
-        return x, y, w, h
-
-    def _drawClassFields(self, dc, draw=False, initialX=None, initialY=None, calcWidth=False):
-        """
-        Calculate the class fields position and size and display it if
-        a draw is True
-
-        Args:
-            dc:
-            draw:
-            initialX:
-            initialY:
-            calcWidth:
-
-        Returns: A tuple (x, y, w, h) = position and size of the field
-        """
-        # Init
-        dc.SetFont(self._defaultFont)
-        dc.SetTextForeground(self._textColor)
-
-        x, y = self.GetPosition()
-        if initialX is not None:
-            x = initialX
-        if initialY is not None:
-            y = initialY
-        w = self._width
-        h = 0
-        if calcWidth:
-            w = 0
-
-        # Define the space between the text and the line
-        lth: int = dc.GetTextExtent("*")[1] // 2
-
-        # Add space
-        pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
-        if len(pyutClass.fields) > 0:
-            h += lth
-
-        # draw pyutClass fields
+        fieldsWidth: int = 0
         if pyutClass.showFields is True:
+            separators.append(h)
+            if len(pyutClass.fields) > 0:
+                h += lth
             for field in pyutClass.fields:
-                if draw:
-                    dc.DrawText(str(field), x + MARGIN, y + h)
-                if calcWidth:
-                    w = max(w, self.GetTextWidth(dc, str(field)))
-
-                h += self.GetTextHeight(dc, str(field))
-
-        # Add space
-        if len(pyutClass.fields) > 0:
-            h += lth
-
-        # Return sizes
-        return x, y, w, h
-
-    def _drawClassMethods(self, dc, initialY=None) -> Tuple[int, int, int, int]:
-        """
-        Calculate the class methods position and size and display it if
-        a showMethods is True
-
-        Args:
-            dc:
-            initialY:
-
-        Returns: tuple (x, y, w, h) which is position and size of the method's portion of the OglClass
-        """
-
-        dc.SetFont(self._defaultFont)
-        dc.SetTextForeground(self._textColor)
-
-        x, y = self.GetPosition()
-
-        if initialY is not None:
-            y = initialY
-        w: int = 0
-        h: int = 0
-
-        # Define the space between the text and the line
-        lth = dc.GetTextExtent("*")[1] // 2
-
-        # Add space
-        pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
-        if len(pyutClass.methods) > 0:
-            h += lth
-
-        # draw pyutClass methods
+                fieldText:  str = str(field)
+                fieldWidth: int = self.GetTextWidth(dc, fieldText)
+                rows.append(ClassLayoutRow(text=fieldText, y=h, width=fieldWidth))
+                fieldsWidth = max(fieldsWidth, fieldWidth)
+                h += self.GetTextHeight(dc, fieldText)
+            if len(pyutClass.fields) > 0:
+                h += lth
+        separators.append(h)
+
+        methodsWidth: int = 0
         self.logger.debug(f"showMethods => {pyutClass.showMethods}")
         if pyutClass.showMethods is True:
+            if len(pyutClass.methods) > 0:
+                h += lth
             for method in pyutClass.methods:
                 if self._eligibleToDraw(pyutClass=pyutClass, pyutMethod=method) is True:
-
-                    self._drawMethod(dc, method, pyutClass, x, y, h)
-
-                    pyutMethod: PyutMethod = cast(PyutMethod, method)
-                    if pyutClass.displayParameters == PyutDisplayParameters.WITH_PARAMETERS or self._oglPreferences.showParameters is True:
-                        w = max(w, self.GetTextWidth(dc, str(pyutMethod.methodWithParameters())))
-                    else:
-                        w = max(w, self.GetTextWidth(dc, str(pyutMethod.methodWithoutParameters())))
-                    h += self.GetTextHeight(dc, str(method))
-
-        # Add space
-        if len(pyutClass.methods) > 0:
-            h += lth
-
-        # Return sizes
-        return x, y, w, h
-
-    def _drawMethod(self, dc: DC, pyutMethod: PyutMethod, pyutClass: PyutClass, x: int, y: int, h: int):
+                    methodText:  str = self._methodText(method, pyutClass)
+                    methodWidth: int = self.GetTextWidth(dc, methodText)
+                    rows.append(ClassLayoutRow(text=methodText, y=h, width=methodWidth))
+                    methodsWidth = max(methodsWidth, methodWidth)
+                    h += self.GetTextHeight(dc, methodText)
+            if len(pyutClass.methods) > 0:
+                h += lth
+
+        return ClassLayout(rows=tuple(rows), separators=tuple(separators),
+                           headerWidth=headerWidth, fieldsWidth=fieldsWidth, methodsWidth=methodsWidth, height=h)
+
+    def _methodText(self, pyutMethod: PyutMethod, pyutClass: PyutClass) -> str:
         """
         If the preference is not set at the individual class level, then defer to global preference; Otherwise,
         respect the class level preference
 
         Args:
-            dc:
             pyutMethod:
             pyutClass:
-            x:
-            y:
-            h:
+
+        Returns:  The method as it is displayed
         """
         self.logger.debug(f'{pyutClass.displayParameters=} - {self._oglPreferences.showParameters=}')
-        dc.SetTextForeground(self._textColor)
         if pyutClass.displayParameters == PyutDisplayParameters.UNSPECIFIED:
             if self._oglPreferences.showParameters is True:
-                dc.DrawText(pyutMethod.methodWithParameters(), x + MARGIN, y + h)
+                return pyutMethod.methodWithParameters()
             else:
-                dc.DrawText(pyutMethod.methodWithoutParameters(), x + MARGIN, y + h)
+                return pyutMethod.methodWithoutParameters()
         elif pyutClass.displayParameters == PyutDisplayParameters.WITH_PARAMETERS:
-            dc.DrawText(pyutMethod.methodWithParameters(), x + MARGIN, y + h)
+            return pyutMethod.methodWithParameters()
         elif pyutClass.displayParameters == PyutDisplayParameters.WITHOUT_PARAMETERS:
-            dc.DrawText(pyutMethod.methodWithoutParameters(), x + MARGIN, y + h)
+            return pyutMethod.methodWithoutParameters()
         else:
             assert False, 'Internal error unknown pyutMethod parameter display type'
 
@@ -0,0 +1,67 @@
+from enum import Enum
+
+from ogl.preferences.OglPreferences import OglPreferences
+
+
+class OglDetailLevel(Enum):
+    """
+    How much of a shape is drawn.  Below the `lodNameOnlyZoom` preference
+    shapes are drawn as a box with their name;  Below `lodBoxOnlyZoom` as a
+    plain box.  Association labels are only drawn in full detail.
+    """
+    FULL      = 'Full'
+    NAME_ONLY = 'Name Only'
+    BOX_ONLY  = 'Box Only'
+
+    @classmethod
+    def fromZoom(cls, zoom: float) -> 'OglDetailLevel':
+        """
+        Every shape asks during a paint, all with the same zoom;  So only the
+        first one compares it with the thresholds.
+
+        Args:
+            zoom:  The current zoom of the diagram frame
+
+        Returns:  The detail level to draw with
+        """
+        return DetailLevelCache.detailLevel(zoom)
+
+
+class DetailLevelCache:
+    """
+    The threshold preferences, read again only when the preferences change,
+    and the detail level of the last zoom asked for
+    """
+    preferences:  OglPreferences | None = None
+    changeCount:  int   = -1
+    boxOnlyZoom:  float = 0.0
+    nameOnlyZoom: float = 0.0
+
+    lastZoom:        float          = -1.0
+    lastDetailLevel: OglDetailLevel = OglDetailLevel.FULL
+
+    @classmethod
+    def detailLevel(cls, zoom: float) -> OglDetailLevel:
+
+        if cls.preferences is None:
+            cls.preferences = OglPreferences()
+
+        if cls.changeCount != cls.preferences.changeCount:
+            cls.changeCount  = cls.preferences.changeCount
+            cls.boxOnlyZoom  = cls.preferences.lodBoxOnlyZoom
+            cls.nameOnlyZoom = cls.preferences.lodNameOnlyZoom
+            cls.lastZoom     = -1.0
+        elif zoom == cls.lastZoom:
+            return cls.lastDetailLevel
+
+        if zoom < cls.boxOnlyZoom:
+            detailLevel: OglDetailLevel = OglDetailLevel.BOX_ONLY
+        elif zoom < cls.nameOnlyZoom:
+            detailLevel = OglDetailLevel.NAME_ONLY
+        else:
+            detailLevel = OglDetailLevel.FULL
+
+        cls.lastZoom        = zoom
+        cls.lastDetailLevel = detailLevel
+
+        return detailLevel
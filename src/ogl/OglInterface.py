@@ -14,6 +14,7 @@ from wx import WHITE_BRUSH
 
 from pyutmodelv2.PyutLink import PyutLink
 
+from miniogl.ResourcePool import ResourcePool
 from miniogl.TextShape import TextShape
 
 from ogl.OglLink import OglLink
@@ -41,7 +42,7 @@ class OglInterface(OglLink):
         """
         super().__init__(srcShape, pyutLink, dstShape, srcPos=srcPos, dstPos=dstPos)
 
-        self.pen:    Pen       = Pen("BLACK", 1, PENSTYLE_LONG_DASH)
+        self.pen:    Pen       = ResourcePool.pen("BLACK", 1, PENSTYLE_LONG_DASH)
         self.brush:  Brush     = WHITE_BRUSH
         self._label: TextShape = self.AddText(0, 0, "")
 
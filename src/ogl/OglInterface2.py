@@ -1,4 +1,5 @@
 
+from typing import Optional
 from typing import Tuple
 
 from logging import Logger
@@ -7,13 +8,18 @@ from logging import getLogger
 from wx import DC
 from wx import FONTSTYLE_NORMAL
 from wx import FONTWEIGHT_NORMAL
+from wx import Bitmap
 from wx import Font
+from wx import MemoryDC
 
 from codeallyadvanced.ui.AttachmentSide import AttachmentSide
 
 from miniogl.Common import Common
+from miniogl.ResourcePool import ResourcePool
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
 from miniogl.LollipopLine import LollipopLine
+from miniogl.Shape import BoundingBox
+from miniogl.TextExtentCache import TextExtentCache
 
 from pyutmodelv2.PyutInterface import PyutInterface
 from pyutmodelv2.PyutObject import PyutObject
@@ -32,6 +38,8 @@ class OglInterface2(LollipopLine, Common):
 
     INTERFACE_FONT_SIZE: int = 12   # TODO:  Make this a preference
 
+    clsMeasuringDC: MemoryDC | None = None     # measures the name outside of Draw;  See GetBoundingBox
+
     def __init__(self, pyutInterface: PyutInterface,  destinationAnchor: SelectAnchorPoint):
 
         LollipopLine.__init__(self, destinationAnchor=destinationAnchor)
@@ -45,7 +53,7 @@ class OglInterface2(LollipopLine, Common):
         fontStyle:  OglTextFontFamily = preferences.textFontFamily
         fontFamily: int              = OglUtils.oglFontFamilyToWxFontFamily(fontStyle)
 
-        self._defaultFont: Font = Font(OglInterface2.INTERFACE_FONT_SIZE, fontFamily, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+        self._defaultFont: Font = ResourcePool.font(OglInterface2.INTERFACE_FONT_SIZE, fontFamily, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
 
     @property
     def pyutInterface(self) -> PyutInterface:
@@ -77,18 +85,29 @@ class OglInterface2(LollipopLine, Common):
     def Draw(self, dc: DC, withChildren: bool = True):
 
         super().Draw(dc=dc, withChildren=withChildren)
-        dc.SetFont(self._defaultFont)
 
         xFaceName: str = self.pyutInterface.name
         self.logger.debug(f'{xFaceName=} {self._pyutInterface.id=}')
 
-        extentSize: Tuple[int, int] = dc.GetTextExtent(xFaceName)  # width, height
+        x, y, _, _ = self._nameRectangle(dc)
 
-        pixelSize: Tuple[int, int] = self._defaultFont.GetPixelSize()
+        dc.DrawText(xFaceName, x, y)
 
-        textPosition: OglPosition = self._determineInterfaceNamePosition(self._destinationAnchor, pixelSize=pixelSize, textSize=extentSize)
+    def GetBoundingBox(self) -> Optional[BoundingBox]:
+        """
+        The name is drawn away from the lollipop;  It must be in the box, so
+        that it is repainted when the interface moves and drawn when only the
+        name is on screen
+
+        Returns:  The box around the lollipop and the name
+        """
+        box: Optional[BoundingBox] = super().GetBoundingBox()
+        if box is None:
+            return None
 
-        dc.DrawText(xFaceName, textPosition.x, textPosition.y)
+        x, y, width, height = self._nameRectangle(self._measuringDC())
+
+        return BoundingBox((min(box[0], x), min(box[1], y), max(box[2], x + width), max(box[3], y + height)))
 
     def Inside(self, clickPointX, clickPointY) -> bool:
         """
@@ -153,6 +172,34 @@ class OglInterface2(LollipopLine, Common):
             ans = True
         return ans
 
+    def _nameRectangle(self, dc: DC) -> Tuple[int, int, int, int]:
+        """
+        Sets the interface font on the DC
+
+        Args:
+            dc:  The DC to measure the name with
+
+        Returns:  The x, y, width and height of the interface name
+        """
+        dc.SetFont(self._defaultFont)
+
+        extentSize: Tuple[int, int] = TextExtentCache.textExtent(dc, self.pyutInterface.name)  # width, height
+        pixelSize:  Tuple[int, int] = self._defaultFont.GetPixelSize()
+
+        textPosition: OglPosition = self._determineInterfaceNamePosition(self._destinationAnchor, pixelSize=pixelSize, textSize=extentSize)
+
+        return textPosition.x, textPosition.y, extentSize[0], extentSize[1]
+
+    @classmethod
+    def _measuringDC(cls) -> DC:
+        """
+        Returns:  A DC that is only used to measure text;  Created on first use, since it needs a wx.App
+        """
+        if cls.clsMeasuringDC is None:
+            cls.clsMeasuringDC = MemoryDC(Bitmap(1, 1))
+
+        return cls.clsMeasuringDC
+
     def _determineInterfaceNamePosition(self, destinationAnchor: SelectAnchorPoint, pixelSize: Tuple[int, int], textSize: Tuple[int, int]) -> OglPosition:
 
         oglPosition:     OglPosition     = OglPosition()
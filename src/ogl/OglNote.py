@@ -4,10 +4,12 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from wx import Brush
 from wx import Colour
 from wx import DC
 
+from miniogl.ResourcePool import ResourcePool
+
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.OglObject import OglObject
 
 from ogl.preferences.OglPreferences import OglPreferences
@@ -55,7 +57,7 @@ class OglNote(OglObject):
         super().__init__(pyutObject, width=width, height=height)
 
         self.logger: Logger = getLogger(__name__)
-        self.brush = Brush(Colour(255, 255, 230))
+        self.brush = ResourcePool.brush(Colour(255, 255, 230))
 
     def Draw(self, dc: DC, withChildren: bool = False):
         """
@@ -65,6 +67,11 @@ class OglNote(OglObject):
             dc:     device context to draw to
             withChildren:   Redraw children or not
         """
+        detailLevel: OglDetailLevel = self._detailLevel()
+        if detailLevel is not OglDetailLevel.FULL:
+            self._drawSimplified(dc, detailLevel)     # The content is not readable, not even a part of it
+            return
+
         super().Draw(dc)
         dc.SetFont(self._defaultFont)
 
@@ -1,8 +1,8 @@
 
 from wx import PENSTYLE_LONG_DASH
 
-from wx import Pen
 
+from miniogl.ResourcePool import ResourcePool
 from miniogl.Shape import Shape
 
 from pyutmodelv2.PyutLink import PyutLink
@@ -29,7 +29,7 @@ class OglNoteLink(OglLink):
         """
         super().__init__(srcShape, pyutLink, dstShape)
         self.drawArrow = False
-        self.pen = Pen("BLACK", 1, PENSTYLE_LONG_DASH)
+        self.pen = ResourcePool.pen("BLACK", 1, PENSTYLE_LONG_DASH)
 
     def __str__(self) -> str:
         return self.__repr__()
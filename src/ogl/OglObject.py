@@ -1,9 +1,11 @@
 
 from typing import List
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
 
+from wx import DC
 from wx import MouseEvent
 from wx import Font
 from wx import FONTFAMILY_SWISS
@@ -11,11 +13,16 @@ from wx import FONTSTYLE_NORMAL
 from wx import FONTWEIGHT_NORMAL
 
 from miniogl.RectangleShape import RectangleShape
+from miniogl.ResourcePool import ResourcePool
 from miniogl.ShapeEventHandler import ShapeEventHandler
+from miniogl.TextExtentCache import TextExtentCache
 
 from ogl.EventEngineMixin import EventEngineMixin
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.OglLink import OglLink
 from ogl.OglUtils import OglUtils
+from ogl.RenderCache import RenderCache
+from ogl.RenderCache import RenderFunction
 
 from ogl.events.OglEvents import OglEventType
 
@@ -37,6 +44,11 @@ class OglObject(RectangleShape, ShapeEventHandler, EventEngineMixin):
 
     clsLogger: Logger = getLogger(__name__)
 
+    clsRenderCacheable: bool = False     # Subclasses that can draw through a RenderCache set this
+
+    clsRenderCacheEnabled:     bool = True      # The preference, read again when the preferences change
+    clsPreferencesChangeCount: int  = -1        # The preferences change count it was read at
+
     def __init__(self, pyutObject=None, width: int = 0, height: int = 0):
         """
 
@@ -46,18 +58,21 @@ class OglObject(RectangleShape, ShapeEventHandler, EventEngineMixin):
             height:     Initial height
         """
         self._pyutObject = pyutObject
+        self._revision: int = 0     # bumped when what the shape draws changes;  See indicateContentChanged
 
         super().__init__(0, 0, width, height)
 
         EventEngineMixin.__init__(self)
 
-        self._defaultFont: Font           = Font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+        self._defaultFont: Font           = ResourcePool.font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
         self._prefs:       OglPreferences = OglPreferences()
 
         # TODO This is also used by sequence diagrams to store OglSDMessage links
         self._oglLinks: List[OglLink] = []     # Connected links
         self._modifyCommand = None
 
+        self._renderCache: RenderCache = RenderCache()
+
     @property
     def pyutObject(self):
         return self._pyutObject
@@ -113,6 +128,14 @@ class OglObject(RectangleShape, ShapeEventHandler, EventEngineMixin):
         """
         pass
 
+    def indicateContentChanged(self):
+        """
+        Call after changing the displayed model values in place;  `autoResize`
+        does it.  The render cache is keyed on a revision number, plus whatever
+        model values a subclass adds to `_renderCacheKey`.
+        """
+        self._indicateAppearanceChanged()
+
     def SetPosition(self, x: int, y: int):
         """
         Define new position for the object
@@ -124,6 +147,80 @@ class OglObject(RectangleShape, ShapeEventHandler, EventEngineMixin):
         RectangleShape.SetPosition(self, x, y)
         self._indicateDiagramModified()
 
+    def _drawCached(self, dc: DC, render: RenderFunction):
+        """
+        Draw through the shape's bitmap cache when the shape is cacheable and
+        the preference is on;  Otherwise, just render
+
+        Args:
+            dc:      The DC to draw on
+            render:  Draws the shape content on the DC it is given
+        """
+        if OglObject.clsPreferencesChangeCount != self._prefs.changeCount:
+            OglObject.clsPreferencesChangeCount = self._prefs.changeCount
+            OglObject.clsRenderCacheEnabled     = self._prefs.renderCacheEnabled
+
+        if self.clsRenderCacheable is False or OglObject.clsRenderCacheEnabled is False:
+            render(dc)
+        else:
+            x, y = self.GetTopLeft()
+            w, h = self.GetSize()
+            self._renderCache.draw(dc=dc, x=x, y=y, width=w, height=h, key=self._renderCacheKey(), render=render)
+
+    def _drawSimplified(self, dc: DC, detailLevel: OglDetailLevel, name: str = ''):
+        """
+        Draw the shape as a filled box, with its name when the detail level allows.
+        Used instead of the full drawing when the diagram is zoomed out.
+
+        Args:
+            dc:             The DC to draw on
+            detailLevel:    NAME_ONLY or BOX_ONLY
+            name:           The name to center in the box
+        """
+        super().Draw(dc)
+        if self._visible is False:
+            return
+
+        x, y = self.GetTopLeft()
+        w, h = self.GetSize()
+        if self._drawFrame is False:
+            dc.DrawRectangle(x, y, w, h)
+
+        if detailLevel is OglDetailLevel.NAME_ONLY and name != '':
+            dc.SetFont(self._defaultFont)
+            textWidth, textHeight = TextExtentCache.textExtent(dc, name)
+
+            dc.SetClippingRegion(x, y, w, h)
+            dc.DrawText(name, x + (w - textWidth) // 2, y + (h - textHeight) // 2)
+            dc.DestroyClippingRegion()
+
+    def _detailLevel(self) -> OglDetailLevel:
+        """
+        Returns:  How much to draw at the current zoom
+        """
+        return OglDetailLevel.fromZoom(self._currentZoom())
+
+    def _currentZoom(self) -> float:
+        if self._diagram is not None and self._diagram.panel is not None:
+            return self._diagram.panel.currentZoom
+        else:
+            return 1.0
+
+    def _renderCacheKey(self) -> Tuple:
+        """
+        Computed on every draw, so it only holds cheap attribute reads;  The
+        revision stands for the appearance setters and the model.  Subclasses
+        add what else their drawing depends on
+
+        Returns:  What the pixels of any OglObject depend on
+        """
+        return self._revision, self._width, self._height, self._currentZoom(), self._selected, self._visible, self._drawFrame
+
+    def _indicateAppearanceChanged(self):
+
+        self._revision += 1
+        super()._indicateAppearanceChanged()
+
     def _indicateDiagramModified(self):
         if self.eventEngine is not None:  # we might not be associated with a diagram yet
             self.eventEngine.sendEvent(OglEventType.DiagramFrameModified)
@@ -24,6 +24,7 @@ from wx import MouseEvent
 
 from miniogl.DiagramFrame import DiagramFrame
 
+from ogl.OglDetailLevel import OglDetailLevel
 from ogl.OglObject import OglObject
 from ogl.OglTextFontFamily import OglTextFontFamily
 
@@ -161,6 +162,11 @@ class OglText(OglObject):
             dc:     device context to draw to
             withChildren:   Redraw children or not
         """
+        detailLevel: OglDetailLevel = self._detailLevel()
+        if detailLevel is not OglDetailLevel.FULL:
+            self._drawSimplified(dc, detailLevel)     # The content is not readable, not even a part of it
+            return
+
         if self._selected:
             dc.SetTextForeground(self._redColor)
 
@@ -259,6 +265,7 @@ class OglText(OglObject):
     def __updateDisplay(self):
 
         self.autoResize()
+        self._indicateAppearanceChanged()
 
         frame: DiagramFrame = self._diagram.panel
         frame.Refresh()
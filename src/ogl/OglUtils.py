@@ -2,9 +2,13 @@
 from logging import Logger
 from logging import getLogger
 from logging import DEBUG
+from typing import Hashable
 from typing import List
+from typing import Optional
 from typing import Tuple
 
+from collections import OrderedDict
+
 from wx import DC
 from wx import FONTFAMILY_DEFAULT
 from wx import FONTFAMILY_MODERN
@@ -23,6 +27,10 @@ class OglUtils:
 
     clsLogger: Logger = getLogger(__name__)
 
+    MAXIMUM_WRAPPED_TEXTS: int = 256
+
+    _wrappedTexts: 'OrderedDict[Hashable, List[str]]' = OrderedDict()
+
     @staticmethod
     def snapCoordinatesToGrid(x: int, y: int, gridInterval: int) -> Tuple[int, int]:
 
@@ -80,7 +88,12 @@ class OglUtils:
         """
         Split the `text` into lines that fit into `textWidth` pixels.
 
-        Note:  This is a copy of the one in Pyut.  Duplicated here in order to remove the LineSplitter dependency.
+        Each paragraph is measured once with `GetPartialTextExtents`;  The
+        break points come from the cumulative widths.  The result is kept
+        for the text, the DC font and the width, so unchanged text is not
+        measured again.
+
+        Note:  This started as a copy of the one in Pyut.  Duplicated here in order to remove the LineSplitter dependency.
 
         Args:
             text:       The text to split
@@ -90,27 +103,53 @@ class OglUtils:
         Returns:
             A list of strings that are no wider than the input pixel `width`
         """
-        splitLines: List[str] = text.splitlines()
-        newLines:   List[str] = []
+        key:      Hashable            = (text, dc.GetFont().GetNativeFontInfoDesc(), tuple(dc.GetUserScale()), textWidth)
+        cached:   Optional[List[str]] = OglUtils._wrappedTexts.get(key)
+        if cached is not None:
+            OglUtils._wrappedTexts.move_to_end(key)
+            return list(cached)
 
-        for line in splitLines:
-            words:     List[str] = line.split()
-            lineWidth: int       = 0
-            newLine:   str       = ""
-            for wordX in words:
-                word: str = f'{wordX} '
-
-                extentSize: Tuple[int, int] = dc.GetTextExtent(word)        # width, height
-                wordWidth:  int             = extentSize[0]
-                if lineWidth + wordWidth <= textWidth:
-                    newLine = f'{newLine}{word}'
-                    lineWidth += wordWidth
-                else:
-                    newLines.append(newLine[:-1])   # remove last space
-                    newLine = word
-                    lineWidth = wordWidth
-
-            newLines.append(newLine[:-1])
+        newLines: List[str] = []
+        for line in text.splitlines():
+            newLines.extend(cls._wrapParagraph(line, dc, textWidth))
+
+        OglUtils._wrappedTexts[key] = newLines
+        if len(OglUtils._wrappedTexts) > OglUtils.MAXIMUM_WRAPPED_TEXTS:
+            OglUtils._wrappedTexts.popitem(last=False)
+
+        return list(newLines)
+
+    @classmethod
+    def _wrapParagraph(cls, line: str, dc: DC, textWidth: int) -> List[str]:
+        """
+        Every word is followed by a space that counts toward the line
+        width;  A word that does not fit on its own gets its own line.
+
+        Args:
+            line:       A paragraph without line breaks
+            dc:         Device Context
+            textWidth:  The width of the text in pixels
+
+        Returns:  The lines of the paragraph
+        """
+        words: List[str] = line.split()
+        if len(words) == 0:
+            return ['']
+
+        widths: List[int] = dc.GetPartialTextExtents(f'{" ".join(words)} ')   # Width up to and including each character
+
+        newLines:   List[str] = []
+        firstWord:  int       = 0       # of the current line
+        lineStart:  int       = 0       # Width before the current line
+        wordEnd:    int       = -1      # Index of the space after the previous word
+        for index, word in enumerate(words):
+            wordEnd += len(word) + 1
+            if widths[wordEnd] - lineStart > textWidth:
+                newLines.append(' '.join(words[firstWord:index]))
+                firstWord = index
+                lineStart = widths[wordEnd - len(word) - 1] if wordEnd > len(word) else 0
+
+        newLines.append(' '.join(words[firstWord:]))
 
         return newLines
 
@@ -0,0 +1,78 @@
+
+from typing import Callable
+from typing import Hashable
+
+from logging import Logger
+from logging import getLogger
+
+from wx import Bitmap
+from wx import DC
+from wx import MemoryDC
+from wx import NullBitmap
+
+RenderFunction = Callable[[DC], None]
+
+
+class RenderCache:
+    """
+    An offscreen bitmap of what a shape draws inside its own rectangle.
+    As long as the key the shape computes does not change, drawing the
+    shape is a single bitmap copy;  Moving a shape does not change its key.
+
+    The key must capture everything that changes the pixels: size, zoom,
+    selection, colours, fonts and the displayed model values.
+
+    Only unscaled raster DCs use the cache;  Other DCs, for example the
+    ones that write vector files or export at another scale, get the shape
+    drawn directly.
+    """
+    hits:   int = 0
+    misses: int = 0
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._bitmap: Bitmap   = NullBitmap
+        self._key:    Hashable = None
+
+    def invalidate(self):
+        self._bitmap = NullBitmap
+        self._key    = None
+
+    def draw(self, dc: DC, x: int, y: int, width: int, height: int, key: Hashable, render: RenderFunction):
+        """
+        Draw the cached bitmap at (x, y);  Re-render it first if the key changed.
+
+        Args:
+            dc:      The DC to draw on
+            x:       Left of the shape in logical coordinates
+            y:       Top of the shape in logical coordinates
+            width:   Width of the shape rectangle
+            height:  Height of the shape rectangle
+            key:     What the drawing depends on
+            render:  Draws the shape at (x, y) on the DC it is given
+        """
+        if not isinstance(dc, MemoryDC) or tuple(dc.GetUserScale()) != (1.0, 1.0) or width <= 0 or height <= 0:
+            render(dc)
+            return
+
+        if key != self._key or not self._bitmap.IsOk():
+            RenderCache.misses += 1
+            self._bitmap = self._render(x=x, y=y, width=width, height=height, render=render)
+            self._key    = key
+        else:
+            RenderCache.hits += 1
+
+        dc.DrawBitmap(self._bitmap, x, y)
+
+    def _render(self, x: int, y: int, width: int, height: int, render: RenderFunction) -> Bitmap:
+
+        bitmap: Bitmap   = Bitmap(width, height)
+        mem:    MemoryDC = MemoryDC(bitmap)
+
+        mem.SetDeviceOrigin(-x, -y)     # The shape draws at its usual logical position
+        render(mem)
+        mem.SelectObject(NullBitmap)
+
+        return bitmap
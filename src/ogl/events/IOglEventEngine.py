@@ -1,8 +1,11 @@
 from typing import Callable
+from typing import Iterator
 
 from abc import ABC
 from abc import abstractmethod
 
+from contextlib import contextmanager
+
 from wx import PyEventBinder
 
 from ogl.events.OglEvents import OglEventType
@@ -20,3 +23,11 @@ class IOglEventEngine(ABC):
     @abstractmethod
     def sendEvent(self, eventType: OglEventType, **kwargs):
         pass
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Engines that can coalesce events override this;  By default the events
+        sent in the block go out as usual
+        """
+        yield
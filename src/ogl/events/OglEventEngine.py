@@ -1,10 +1,14 @@
 
 from typing import Callable
+from typing import Iterator
 from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
+from contextlib import contextmanager
+
+from wx import CallAfter
 from wx import Point
 from wx import PostEvent
 from wx import Window
@@ -44,12 +48,20 @@ class OglEventEngine(IOglEventEngine):
     it open to other implementations;
 
     Get one of these for each Window you want to listen on
+
+    DiagramFrameModified only says that something changed, so repeated ones
+    are coalesced;  However many are sent during one turn of the event loop,
+    a single event is posted at the end of it.
     """
     def __init__(self, listeningWindow: Window):
 
         self._listeningWindow: Window = listeningWindow
         self.logger: Logger = getLogger(__name__)
 
+        self._modifiedPending: bool = False     # A DiagramFrameModified event is about to be posted
+        self._batchDepth:      int  = 0
+        self._batchModified:   bool = False     # A DiagramFrameModified event was sent during the batch
+
     def registerListener(self, event: PyEventBinder, callback: Callable):
         self._listeningWindow.Bind(event, callback)
 
@@ -77,6 +89,25 @@ class OglEventEngine(IOglEventEngine):
             eMsg: str = f'Invalid keyword parameter. `{ke}`'
             raise InvalidKeywordException(eMsg)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Hold back the DiagramFrameModified events sent in the block;  At its end a
+        single one is sent if there were any.  Batches can be nested.
+
+            with eventEngine.batch():
+                for shape in shapes:
+                    shape.SetPosition(x, y)
+        """
+        self._batchDepth += 1
+        try:
+            yield
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0 and self._batchModified is True:
+                self._batchModified = False
+                self._sendDiagramFrameModifiedEvent()
+
     def _sendSelectedShapeEvent(self, **kwargs):
 
         shape:    Shape = kwargs[SELECTED_SHAPE_PARAMETER]
@@ -95,8 +126,20 @@ class OglEventEngine(IOglEventEngine):
         PostEvent(dest=self._listeningWindow, event=cutOglClassEvent)
 
     def _sendDiagramFrameModifiedEvent(self):
-        eventToPost: DiagramFrameModifiedEvent = DiagramFrameModifiedEvent()
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+
+        if self._batchDepth > 0:
+            self._batchModified = True
+        elif self._modifiedPending is False:
+            self._modifiedPending = True
+            CallAfter(self._postDiagramFrameModifiedEvent)
+
+    def _postDiagramFrameModifiedEvent(self):
+
+        self._modifiedPending = False
+
+        if self._listeningWindow:       # The window may have been destroyed before CallAfter ran us
+            eventToPost: DiagramFrameModifiedEvent = DiagramFrameModifiedEvent()
+            PostEvent(dest=self._listeningWindow, event=eventToPost)
 
     def _sendRequestLollipopLocationEvent(self, **kwargs):
 
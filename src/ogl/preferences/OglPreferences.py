@@ -56,6 +56,12 @@ diagramProperties: ValueDescriptions = ValueDescriptions(
         KeyName('snapToGrid'):              ValueDescription(defaultValue='True',  deserializer=SecureConversions.secureBoolean),
         KeyName('showParameters'):          ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
         KeyName('backgroundGridInterval'):  ValueDescription(defaultValue='25',    deserializer=SecureConversions.secureInteger),
+        KeyName('renderCacheEnabled'):      ValueDescription(defaultValue='True',  deserializer=SecureConversions.secureBoolean),
+        KeyName('lodNameOnlyZoom'):         ValueDescription(defaultValue='0.5',   deserializer=SecureConversions.secureFloat),
+        KeyName('lodBoxOnlyZoom'):          ValueDescription(defaultValue='0.3',   deserializer=SecureConversions.secureFloat),
+        KeyName('dragFramesPerSecond'):     ValueDescription(defaultValue='60',    deserializer=SecureConversions.secureInteger),
+        KeyName('scaledZoom'):              ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('numpySpatialIndex'):       ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
 
         KeyName('gridLineStyle'):           ValueDescription(defaultValue=DEFAULT_GRID_LINE_STYLE,   enumUseValue=True, deserializer=MiniOglPenStyle),
 
@@ -111,6 +117,22 @@ sections: Sections = Sections(
 class OglPreferences(DynamicConfiguration, metaclass=SingletonV3):
 
     def __init__(self):
-        self._logger: Logger = getLogger(__name__)
+        self._logger:      Logger = getLogger(__name__)
+        self._changeCount: int    = 0
 
         super().__init__(baseFileName=f'{PREFERENCES_FILE_NAME}', moduleName=MODULE_NAME, sections=sections)
+
+    @property
+    def changeCount(self) -> int:
+        """
+        Lets caches built from preference values notice that a preference was written
+
+        Returns:  The number of preference writes since we were created
+        """
+        return self._changeCount
+
+    def __setattr__(self, key: str, value):
+
+        super().__setattr__(key, value)
+        if not key.startswith('_'):
+            self._changeCount += 1
@@ -14,6 +14,7 @@ from wx import MouseEvent
 from wx import PENSTYLE_SOLID
 from wx import Pen
 
+from miniogl.ResourcePool import ResourcePool
 from miniogl.ShapeEventHandler import ShapeEventHandler
 from miniogl.TextShape import TextShape
 
@@ -39,7 +40,7 @@ class OglInstanceName(TextShape, ShapeEventHandler, EventEngineMixin):
             parent:
         """
         self.logger:        Logger = getLogger(__name__)
-        self._defaultFont:  Font   = Font(OglInstanceName.TEXT_SHAPE_FONT_SIZE, FONTFAMILY_TELETYPE, FONTSTYLE_ITALIC, FONTWEIGHT_NORMAL)
+        self._defaultFont:  Font   = ResourcePool.font(OglInstanceName.TEXT_SHAPE_FONT_SIZE, FONTFAMILY_TELETYPE, FONTSTYLE_ITALIC, FONTWEIGHT_NORMAL)
 
         super().__init__(x, y, instanceName, parent=parent, font=self._defaultFont)
         EventEngineMixin.__init__(self)
@@ -80,6 +81,7 @@ class OglInstanceName(TextShape, ShapeEventHandler, EventEngineMixin):
 
         """
         self._selected = state
+        self._indicateAppearanceChanged()
 
     def Draw(self, dc: DC, withChildren: bool = True):
         """
@@ -96,7 +98,7 @@ class OglInstanceName(TextShape, ShapeEventHandler, EventEngineMixin):
                 self.DrawBorder(dc=dc)
             else:
                 dc.SetTextForeground(self._textColor)
-                pen: Pen = Pen(colour=BLACK, width=1, style=PENSTYLE_SOLID)
+                pen: Pen = ResourcePool.pen(BLACK, width=1, style=PENSTYLE_SOLID)
 
                 dc.SetPen(pen)
                 self.DrawBorder(dc=dc)
@@ -20,6 +20,7 @@ from pyutmodelv2.PyutSDInstance import PyutSDInstance
 
 from miniogl.Shape import Shape
 from miniogl.MiniOglUtils import sign
+from miniogl.ResourcePool import ResourcePool
 from miniogl.SizerShape import SizerShape
 from miniogl.ShapeEventHandler import ShapeEventHandler
 
@@ -137,9 +138,9 @@ class OglSDInstance(Shape, ShapeEventHandler, EventEngineMixin):
         savePen: Pen = dc.GetPen()
 
         if self._selected is True:
-            drawPen: Pen = Pen(RED, style=PENSTYLE_LONG_DASH)
+            drawPen: Pen = ResourcePool.pen(RED, style=PENSTYLE_LONG_DASH)
         else:
-            drawPen = Pen(LIGHT_GREY, style=PENSTYLE_LONG_DASH)
+            drawPen = ResourcePool.pen(LIGHT_GREY, style=PENSTYLE_LONG_DASH)
 
         dc.SetPen(drawPen)
 
@@ -168,6 +169,7 @@ class OglSDInstance(Shape, ShapeEventHandler, EventEngineMixin):
             height: The new height
         """
         self._size = InstanceSize((width, height))
+        self._indicateGeometryChanged()
         self._instanceName.SetSize(width=width, height=INSTANCE_NAME_HEIGHT)
 
         # Set lifeline
@@ -314,6 +316,7 @@ class OglSDInstance(Shape, ShapeEventHandler, EventEngineMixin):
         if height < 0:
             y -= height
         self._x, self._y = x, y
+        self._indicateGeometryChanged()
 
     def OnLeftUp(self, event):
         """
@@ -5,9 +5,8 @@ from logging import getLogger
 from wx import BLACK
 from wx import DC
 from wx import PENSTYLE_SHORT_DASH
-from wx import Pen
-
 from miniogl.LineShape import LineShape
+from miniogl.ResourcePool import ResourcePool
 
 from ogl.sd.OglSDAnchorPoint import OglSDAnchorPoint
 
@@ -18,7 +17,7 @@ class OglSDLifeLine(LineShape):
 
         super().__init__(srcAnchor=srcAnchor, dstAnchor=dstAnchor)
 
-        self._lifeLinePen = Pen(BLACK, width=1, style=PENSTYLE_SHORT_DASH)
+        self._lifeLinePen = ResourcePool.pen(BLACK, width=1, style=PENSTYLE_SHORT_DASH)
 
         self.oglLifeLineLogger: Logger = getLogger(__name__)
 
@@ -0,0 +1,129 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from json import dumps
+from json import loads
+
+from os import environ
+from os import pathsep
+
+from subprocess import check_output
+
+from sys import argv
+from sys import executable
+
+from tracemalloc import start
+from tracemalloc import stop
+from tracemalloc import get_traced_memory
+
+from gc import collect
+
+from miniogl.AnchorPoint import AnchorPoint
+from miniogl.ControlPoint import ControlPoint
+from miniogl.LinePoint import LinePoint
+from miniogl.RectangleShape import RectangleShape
+from miniogl.SizerShape import SizerShape
+from miniogl.TextShape import TextShape
+
+from miniogl.models.ShapeModel import ShapeModel
+
+DEFAULT_COUNT: int = 10000
+
+JSON_OPTION: str = '--json'
+
+Factory = Callable[[int], object]
+
+BytesPerInstance = Dict[str, float]     # by class name
+
+
+class ShapeMemoryBenchmark:
+    """
+    Reports the bytes allocated per instance of the classes that diagrams with
+    many links create the most of.  The size includes what each instance owns,
+    e.g. its model and its empty lists, but not the objects shared by all of
+    them, like pens and loggers.
+
+    To compare with another version of the classes, check it out somewhere and
+    pass its source directory;  It is measured in a separate interpreter.  Run
+    it from the project root:
+
+        git worktree add /tmp/before <commit>
+        python -m tests.miniogl.ShapeMemoryBenchmark /tmp/before/src
+    """
+    def __init__(self, count: int = DEFAULT_COUNT):
+        """
+        Args:
+            count:  How many instances of each class to create
+        """
+        self._count:  int            = count
+        self._parent: RectangleShape = RectangleShape(0, 0, 100, 100)
+
+    def run(self) -> BytesPerInstance:
+        """
+        Returns:  The bytes per instance of the classes importable here
+        """
+        parent: RectangleShape = self._parent
+        factories: List[Tuple[str, Factory]] = [
+            ('AnchorPoint',  lambda i: AnchorPoint(i, i, parent)),
+            ('ControlPoint', lambda i: ControlPoint(i, i)),
+            ('LinePoint',    lambda i: LinePoint(i, i)),
+            ('SizerShape',   lambda i: SizerShape(i, i, parent)),
+            ('TextShape',    lambda i: TextShape(i, i, 'text')),
+            ('ShapeModel',   lambda i: ShapeModel()),
+        ]
+
+        return {name: self._bytesPerInstance(factory) for name, factory in factories}
+
+    @classmethod
+    def runIn(cls, sourceDirectory: str) -> BytesPerInstance:
+        """
+        Args:
+            sourceDirectory:  Where the miniogl and ogl packages of the version to measure are
+
+        Returns:  The bytes per instance of that version
+        """
+        environment: Dict[str, str] = dict(environ)
+        environment['PYTHONPATH'] = pathsep.join([sourceDirectory, environ.get('PYTHONPATH', '')])
+
+        output: str = check_output([executable, '-m', __spec__.name, JSON_OPTION], env=environment, text=True)
+
+        return loads(output)
+
+    def _bytesPerInstance(self, factory: Factory) -> float:
+
+        factory(0)      # warm up;  Imports and shared resources are not counted
+        collect()
+
+        start()
+        before, _ = get_traced_memory()
+        instances: List = [factory(i) for i in range(self._count)]
+        after, _ = get_traced_memory()
+        stop()
+
+        bytesPerInstance: float = (after - before) / len(instances)
+        del instances
+
+        return bytesPerInstance
+
+
+def main():
+
+    after: BytesPerInstance = ShapeMemoryBenchmark().run()
+    if JSON_OPTION in argv[1:]:
+        print(dumps(after))
+    elif len(argv) > 1:
+        before: BytesPerInstance = ShapeMemoryBenchmark.runIn(argv[1])
+
+        print(f'{"bytes per":<14} {"before":>10} {"after":>10} {"saved":>10}')
+        for name, bytesAfter in after.items():
+            print(f'{name:<14} {before[name]:10.1f} {bytesAfter:10.1f} {before[name] - bytesAfter:10.1f}')
+    else:
+        for name, bytesAfter in after.items():
+            print(f'{name:<14} {bytesAfter:10.1f} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+
+from typing import Any
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import PENSTYLE_DOT
+from wx import PENSTYLE_SOLID
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.BatchingDC import BatchingDC
+
+
+class FakePen:
+    def __init__(self, name: str, style=PENSTYLE_SOLID, width: int = 1):
+        self._name  = name
+        self._style = style
+        self._width = width
+
+    def GetStyle(self):
+        return self._style
+
+    def GetWidth(self):
+        return self._width
+
+    def __repr__(self) -> str:
+        return self._name
+
+
+class RecordingDC:
+    """
+    Remembers the calls it gets;  Stands in for a real DC
+    """
+    def __init__(self):
+        self.calls: List[Tuple[str, Any]] = []
+
+    def GetPen(self):
+        return 'initialPen'
+
+    def GetBrush(self):
+        return 'initialBrush'
+
+    def GetTextForeground(self):
+        return 'initialColor'
+
+    def GetTextExtent(self, text: str):
+        self.calls.append(('GetTextExtent', text))
+        return len(text), 10
+
+    def __getattr__(self, name: str):
+        def record(*args):
+            self.calls.append((name, args))
+        return record
+
+
+class TestBatchingDC(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._dc:    RecordingDC = RecordingDC()
+        self._batch: BatchingDC  = BatchingDC(self._dc)     # type: ignore
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testLinesAreMerged(self):
+
+        red:  FakePen = FakePen('red')
+        blue: FakePen = FakePen('blue')
+        self._batch.SetPen(red)      # type: ignore
+        self._batch.DrawLine(0, 0, 10, 10)
+        self._batch.SetPen(blue)     # type: ignore
+        self._batch.DrawLine(10, 10, 20, 20)
+        self._batch.DrawLines([(0, 0), (5, 5), (5, 10)])
+        self._batch.flush()
+
+        expectedLines = [(0, 0, 10, 10), (10, 10, 20, 20), (0, 0, 5, 5), (5, 5, 5, 10)]
+        expectedPens  = [red, blue, blue, blue]
+        self.assertEqual([('DrawLineList', (expectedLines, expectedPens))], self._dc.calls, 'One call, each line with its pen')
+
+    def testDashedAndWidePolylinesAreNotSplit(self):
+
+        points = [(0, 0), (5, 5), (5, 10)]
+        for pen in (FakePen('dashed', style=PENSTYLE_DOT), FakePen('wide', width=2)):
+            self._dc.calls.clear()
+            self._batch.SetPen(pen)      # type: ignore
+            self._batch.DrawLine(0, 0, 1, 1)
+            self._batch.DrawLines(points)
+
+            names = [call[0] for call in self._dc.calls]
+            self.assertEqual(['DrawLineList', 'SetPen', 'SetBrush', 'SetTextForeground', 'DrawLines'], names, f'The {pen} polyline is drawn whole')
+            self.assertEqual((points, 0, 0), self._dc.calls[-1][1], 'Unchanged')
+
+    def testKindChangeKeepsOrder(self):
+
+        self._batch.DrawRectangle(0, 0, 10, 10)
+        self._batch.DrawLine(0, 0, 10, 10)
+        self._batch.DrawRectangle(5, 5, 10, 10)
+        self._batch.flush()
+
+        names = [call[0] for call in self._dc.calls]
+        self.assertEqual(['DrawRectangleList', 'DrawLineList', 'DrawRectangleList'], names, 'Primitives should not be reordered')
+
+    def testPassThroughFlushesFirst(self):
+
+        self._batch.SetPen('red')
+        self._batch.DrawLine(0, 0, 10, 10)
+        self._batch.DrawCircle(5, 5, 3)
+
+        names = [call[0] for call in self._dc.calls]
+        self.assertEqual(['DrawLineList', 'SetPen', 'SetBrush', 'SetTextForeground', 'DrawCircle'], names, 'Pending lines, then the state, then the call')
+        self.assertEqual(('red',), self._dc.calls[1][1], 'The circle gets the current pen')
+
+    def testQueriesDoNotFlush(self):
+
+        self._batch.DrawLine(0, 0, 10, 10)
+        self._batch.GetTextExtent('abc')
+
+        self.assertEqual([('GetTextExtent', 'abc')], self._dc.calls, 'Queries should not flush the pending lines')
+
+    def testTextsKeepTheirColor(self):
+
+        self._batch.SetTextForeground('black')
+        self._batch.DrawText('a', 0, 0)
+        self._batch.SetTextForeground('white')
+        self._batch.DrawText('b', (0, 20))
+        self._batch.flush()
+
+        self.assertEqual([('DrawTextList', (['a', 'b'], [(0, 0), (0, 20)], ['black', 'white']))], self._dc.calls, 'Texts with their colors')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchingDC))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,78 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.DamageRegion import DamageRegion
+from miniogl.Shape import BoundingBox
+
+
+class TestDamageRegion(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._damageRegion: DamageRegion = DamageRegion()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testEmpty(self):
+
+        self.assertTrue(self._damageRegion.empty, 'Nothing added yet')
+        self.assertIsNone(self._damageRegion.bounds, 'No bounds when empty')
+
+    def testDisjointBoxesAreKept(self):
+
+        self._damageRegion.add(BoundingBox((0, 0, 10, 10)))
+        self._damageRegion.add(BoundingBox((100, 100, 110, 110)))
+
+        self.assertEqual(2, len(self._damageRegion.boxes), 'Disjoint boxes should not be merged')
+        self.assertEqual(BoundingBox((0, 0, 110, 110)), self._damageRegion.bounds, 'Bad union')
+
+    def testOverlappingBoxesAreMerged(self):
+
+        self._damageRegion.add(BoundingBox((0, 0, 10, 10)))
+        self._damageRegion.add(BoundingBox((20, 0, 30, 10)))
+        self._damageRegion.add(BoundingBox((5, 5, 25, 8)))
+
+        self.assertEqual([BoundingBox((0, 0, 30, 10))], self._damageRegion.boxes, 'The bridge should merge all three')
+
+    def testTooManyBoxesCollapse(self):
+
+        for i in range(DamageRegion.MAXIMUM_BOXES + 1):
+            self._damageRegion.add(BoundingBox((i * 100, 0, i * 100 + 10, 10)))
+
+        self.assertEqual(1, len(self._damageRegion.boxes), 'Should collapse to the union')
+
+    def testEverything(self):
+
+        self._damageRegion.add(BoundingBox((0, 0, 10, 10)))
+        self._damageRegion.addEverything()
+        self._damageRegion.add(BoundingBox((0, 0, 10, 10)))
+
+        self.assertTrue(self._damageRegion.everything, 'Should be everything')
+        self.assertFalse(self._damageRegion.empty, 'Everything is not empty')
+
+    def testTake(self):
+
+        self._damageRegion.add(BoundingBox((0, 0, 10, 10)))
+        taken: DamageRegion = self._damageRegion.take()
+
+        self.assertTrue(self._damageRegion.empty, 'Taking empties the region')
+        self.assertEqual([BoundingBox((0, 0, 10, 10))], taken.boxes, 'The damage moved')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDamageRegion))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,202 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import MagicMock
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.DamageRegion import DamageRegion
+from miniogl.Diagram import Diagram
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import BoundingBox
+from miniogl.Shape import Shape
+from miniogl.ViewTransform import ViewTransform
+
+
+class TestDiagram(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._diagram: Diagram = Diagram(panel=None)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testAddKeepsInsertionOrder(self):
+
+        rectangles = [RectangleShape(x=10 * i, y=10 * i, width=5, height=5) for i in range(5)]
+        for rectangle in rectangles:
+            self._diagram.AddShape(rectangle, withModelUpdate=False)
+
+        self.assertEqual(rectangles, self._diagram.shapes, 'Draw order should be insertion order')
+
+    def testAddTwiceIsIgnored(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=5, height=5)
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+
+        self.assertEqual(1, len(self._diagram.shapes), 'A shape is only added once')
+
+    def testMembershipIsByIdentity(self):
+
+        class EqualRectangle(RectangleShape):
+            def __eq__(self, other):
+                return True
+
+            def __hash__(self):
+                return 0
+
+        rectangle1: RectangleShape = EqualRectangle(x=0, y=0, width=5, height=5)
+        rectangle2: RectangleShape = EqualRectangle(x=0, y=0, width=5, height=5)
+
+        self._diagram.AddShape(rectangle1, withModelUpdate=False)
+        self._diagram.AddShape(rectangle2, withModelUpdate=False)
+        self._diagram.RemoveShape(rectangle2)
+
+        self.assertEqual([rectangle1], self._diagram.shapes, 'Only the removed shape should go')
+
+    def testRemoveKeepsOrder(self):
+
+        rectangles = [RectangleShape(x=10 * i, y=10 * i, width=5, height=5) for i in range(5)]
+        for rectangle in rectangles:
+            self._diagram.AddShape(rectangle, withModelUpdate=False)
+
+        self._diagram.RemoveShape(rectangles[2])
+
+        self.assertEqual(rectangles[:2] + rectangles[3:], self._diagram.shapes, 'Remaining shapes keep their order')
+        self.assertEqual(rectangles[:2] + rectangles[3:], self._diagram.parentShapes, 'Remaining parents keep their order')
+
+    def testMoveToFrontAndBack(self):
+
+        rectangles = [RectangleShape(x=0, y=0, width=50, height=50) for _ in range(3)]
+        for rectangle in rectangles:
+            self._diagram.AddShape(rectangle, withModelUpdate=False)
+
+        self._diagram.MoveToFront(rectangles[0])
+        self.assertEqual([rectangles[1], rectangles[2], rectangles[0]], self._diagram.shapes, 'Should be drawn last')
+        self.assertIs(rectangles[0], self._diagram.FindShape(10, 10), 'Front most should be found first')
+
+        self._diagram.MoveToBack(rectangles[0])
+        self.assertEqual(rectangles, self._diagram.shapes, 'Should be drawn first')
+        self.assertIs(rectangles[2], self._diagram.FindShape(10, 10), 'Front most should be found first')
+
+    def testShapesViewIsLive(self):
+
+        view = self._diagram.shapesView
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=5, height=5)
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+
+        self.assertEqual([rectangle], list(view), 'The view should see new shapes without a copy')
+        self.assertEqual([rectangle], list(self._diagram.parentShapesView), 'First level shape')
+
+        self._diagram.RemoveShape(rectangle)
+        self.assertEqual(0, len(view), 'The view should see removals')
+
+    def testFindShapesIntersecting(self):
+
+        onScreen:  RectangleShape = RectangleShape(x=10,   y=10,   width=50, height=50)
+        offScreen: RectangleShape = RectangleShape(x=5000, y=5000, width=50, height=50)
+        behind:    RectangleShape = RectangleShape(x=20,   y=20,   width=50, height=50)
+        for rectangle in [onScreen, offScreen, behind]:
+            self._diagram.AddShape(rectangle, withModelUpdate=False)
+        self._diagram.MoveToBack(behind)
+
+        visible = self._diagram.FindShapesIntersecting(BoundingBox((0, 0, 800, 600)))
+
+        self.assertEqual([behind, onScreen], visible, 'Only the visible shapes, in display order')
+
+    def testMoveDamagesOldAndNewBounds(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+        self._diagram.TakeDamage()
+
+        rectangle.SetPosition(500, 500)
+        damage: DamageRegion = self._diagram.TakeDamage()
+
+        self.assertEqual([BoundingBox((0, 0, 50, 50)), BoundingBox((500, 500, 550, 550))], damage.boxes, 'Old and new bounds')
+        self.assertTrue(self._diagram.TakeDamage().empty, 'Damage is only reported once')
+
+    def testRemoveDamagesOldBounds(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+        self._diagram.TakeDamage()
+
+        self._diagram.RemoveShape(rectangle)
+
+        self.assertEqual([BoundingBox((0, 0, 50, 50))], self._diagram.TakeDamage().boxes, 'Should repaint where it was')
+
+    def testSelectionDamagesBounds(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        rectangle.resizable = False
+        self._diagram.AddShape(rectangle, withModelUpdate=False)
+        self._diagram.TakeDamage()
+
+        rectangle.selected = True
+
+        self.assertEqual([BoundingBox((0, 0, 50, 50))], self._diagram.TakeDamage().boxes, 'Should repaint the selected shape')
+
+    def testBoundingBox(self):
+
+        self.assertIsNone(self._diagram.GetBoundingBox(), 'An empty diagram has no bounds')
+
+        self._diagram.AddShape(RectangleShape(x=10,  y=20,  width=50, height=50), withModelUpdate=False)
+        self._diagram.AddShape(RectangleShape(x=200, y=-5,  width=10, height=10), withModelUpdate=False)
+
+        self.assertEqual(BoundingBox((10, -5, 210, 70)), self._diagram.GetBoundingBox(), 'Should enclose every shape')
+
+    def testShapesCatchUpWithTheZoomLazily(self):
+
+        panel:   MagicMock = MagicMock(viewTransform=ViewTransform(scale=2.0))
+        diagram: Diagram   = Diagram(panel=panel)
+
+        parent: RectangleShape = RectangleShape(x=10, y=20, width=5, height=5)
+        child:  Shape          = Shape(x=1, y=1, parent=parent)
+        parent.AppendChild(child)
+        diagram.AddShape(parent, withModelUpdate=False)
+        parent.model.SetPosition(10, 20)
+        parent.model.SetSize(5, 5)
+        child.model.SetPosition(11, 21)
+
+        diagram.StartZoomEpoch(ViewTransform(scale=2.0))
+        self.assertEqual((10, 20), (parent._x, parent._y), 'Zooming should not update the shape')
+
+        self.assertEqual((22, 42), child.GetPosition(), 'Asking for the position updates the shape')
+        self.assertEqual(diagram.zoomEpoch, parent.zoomEpoch, 'The parent is updated first')
+        self.assertEqual((20, 40), parent.GetPosition(), 'Parent position for the new zoom')
+        self.assertEqual((10, 10), parent.GetSize(), 'Parent size for the new zoom')
+
+    def testQueriesFindShapesThatLagBehindTheZoom(self):
+
+        panel:   MagicMock = MagicMock(viewTransform=ViewTransform(scale=2.0))
+        diagram: Diagram   = Diagram(panel=panel)
+
+        rectangle: RectangleShape = RectangleShape(x=10, y=10, width=5, height=5)
+        diagram.AddShape(rectangle, withModelUpdate=False)
+        rectangle.model.SetPosition(10, 10)
+        rectangle.model.SetSize(5, 5)
+
+        diagram.StartZoomEpoch(ViewTransform(scale=2.0))
+
+        self.assertEqual([rectangle], diagram.FindShapesIntersecting(BoundingBox((25, 25, 26, 26))), 'Found where it is at the new zoom')
+        self.assertIs(rectangle, diagram.FindShape(28, 28), 'Hit where it is at the new zoom')
+        self.assertEqual([], diagram.FindShapesIntersecting(BoundingBox((10, 10, 12, 12))), 'Not where it was')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,60 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.Diagram import Diagram
+from miniogl.DiagramRenderer import DiagramRenderer
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import BoundingBox
+
+from tests.miniogl.TestBatchingDC import RecordingDC
+
+
+class TestDiagramRenderer(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._diagram:  Diagram         = Diagram(panel=None)
+        self._renderer: DiagramRenderer = DiagramRenderer(diagram=self._diagram, margin=5)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testBoundsIncludeMargin(self):
+
+        self._diagram.AddShape(RectangleShape(x=10, y=20, width=50, height=50), withModelUpdate=False)
+
+        self.assertEqual(BoundingBox((5, 15, 65, 75)), self._renderer.bounds(), 'Shapes plus the margin')
+
+    def testEmptyDiagramHasNoBounds(self):
+        self.assertIsNone(self._renderer.bounds(), 'Nothing to render')
+
+    def testRenderOnDrawsOnlyIntersectingShapes(self):
+
+        self._diagram.AddShape(RectangleShape(x=10,   y=10,   width=50, height=50), withModelUpdate=False)
+        self._diagram.AddShape(RectangleShape(x=5000, y=5000, width=50, height=50), withModelUpdate=False)
+
+        dc: RecordingDC = RecordingDC()
+        self._renderer.renderOn(dc=dc, bounds=BoundingBox((0, 0, 100, 100)), scale=2.0)     # type: ignore
+
+        calls = dict(dc.calls)
+        self.assertEqual((2.0, 2.0), calls['SetUserScale'], 'The scale is applied by the DC')
+        self.assertEqual((0, 0),     calls['SetLogicalOrigin'], 'The bounds start at the DC origin')
+        self.assertEqual([(10, 10, 50, 50)], calls['DrawRectangleList'][0], 'Only the shape inside the bounds is drawn')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagramRenderer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
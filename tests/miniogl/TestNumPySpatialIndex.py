@@ -0,0 +1,103 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest import skipUnless
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.DamageRegion import DamageRegion
+from miniogl.NumPySpatialIndex import NumPySpatialIndex
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import BoundingBox
+from miniogl.Shape import Shape
+
+
+@skipUnless(NumPySpatialIndex.available(), 'NumPy is not installed')
+class TestNumPySpatialIndex(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._damage:        DamageRegion  = DamageRegion()
+        self._spatialIndex: NumPySpatialIndex = NumPySpatialIndex(damage=self._damage)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testShapesAt(self):
+
+        inside:  RectangleShape = RectangleShape(x=150, y=150, width=100, height=100)
+        outside: RectangleShape = RectangleShape(x=500, y=500, width=10,  height=10)
+        self._spatialIndex.insert(inside)
+        self._spatialIndex.insert(outside)
+
+        self.assertEqual([inside], self._spatialIndex.shapesAt(200, 200), 'Only the rectangle under the point')
+
+    def testShapesIntersecting(self):
+
+        shapes: List[Shape] = [RectangleShape(x=100 * i, y=0, width=50, height=50) for i in range(10)]
+        for shape in shapes:
+            self._spatialIndex.insert(shape)
+
+        found: List[Shape] = self._spatialIndex.shapesIntersecting(BoundingBox((120, 10, 320, 20)))
+
+        self.assertEqual({id(shape) for shape in shapes[1:4]}, {id(shape) for shape in found}, 'Three rectangles overlap the box')
+
+    def testMoveAndRemove(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._spatialIndex.insert(rectangle)
+        self._spatialIndex.refresh()
+
+        rectangle.SetPosition(500, 500)
+        self._spatialIndex.invalidate(rectangle)
+        self.assertEqual([rectangle], self._spatialIndex.shapesAt(510, 510), 'Should be found where it moved')
+        self.assertEqual([], self._spatialIndex.shapesAt(10, 10), 'Should not be found where it was')
+
+        self._spatialIndex.remove(rectangle)
+        self.assertEqual([], self._spatialIndex.shapesAt(510, 510), 'Removed shapes are not found')
+        self.assertEqual(0, len(self._spatialIndex), 'The index should be empty')
+
+    def testUnboundedShapeIsAlwaysCandidate(self):
+
+        shape: Shape = Shape(x=0, y=0)
+        self._spatialIndex.insert(shape)
+
+        self.assertIn(shape, self._spatialIndex.shapesAt(5000, -5000), 'Shapes without bounds are always candidates')
+
+    def testGrows(self):
+
+        count:  int                  = NumPySpatialIndex.INITIAL_CAPACITY + 10
+        shapes: List[RectangleShape] = [RectangleShape(x=20 * i, y=0, width=10, height=10) for i in range(count)]
+        for shape in shapes:
+            self._spatialIndex.insert(shape)
+
+        self.assertEqual([shapes[-1]], self._spatialIndex.shapesAt(20 * (count - 1) + 5, 5), 'Rows past the initial capacity')
+        self.assertEqual([shapes[0]], self._spatialIndex.shapesAt(5, 5), 'Rows before growing are kept')
+
+    def testDamage(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._spatialIndex.insert(rectangle)
+        self._spatialIndex.refresh()
+        self._damage.take()
+
+        self._spatialIndex.remove(rectangle)
+
+        self.assertFalse(self._damage.take().empty, 'Removing a shape damages where it was')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestNumPySpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,77 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import FONTFAMILY_SWISS
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_BOLD
+from wx import FONTWEIGHT_NORMAL
+from wx import PENSTYLE_DOT
+from wx import PENSTYLE_SOLID
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from miniogl.ResourcePool import ResourcePool
+
+
+class TestResourcePool(UnitTestBaseW):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        ResourcePool.clear()
+        self._saveMaximum: int = ResourcePool.MAXIMUM_ENTRIES
+
+    def tearDown(self):
+        super().tearDown()
+        ResourcePool.MAXIMUM_ENTRIES = self._saveMaximum
+        ResourcePool.clear()
+
+    def testSamePenIsShared(self):
+
+        pen1 = ResourcePool.pen('Red', width=1, style=PENSTYLE_DOT)
+        pen2 = ResourcePool.pen('Red', width=1, style=PENSTYLE_DOT)
+
+        self.assertIs(pen1, pen2, 'Equal requests should share the pen')
+        self.assertIsNot(pen1, ResourcePool.pen('Red', width=1, style=PENSTYLE_SOLID), 'A different style is a different pen')
+
+    def testSameFontIsShared(self):
+
+        font1 = ResourcePool.font(10, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+        font2 = ResourcePool.font(10, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+
+        self.assertIs(font1, font2, 'Equal requests should share the font')
+        self.assertIsNot(font1, ResourcePool.font(10, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD), 'Bold is a different font')
+
+    def testSameColourIsShared(self):
+
+        colour1 = ResourcePool.colour('Alice Blue', (240, 248, 255))
+        colour2 = ResourcePool.colour('Alice Blue', (240, 248, 255))
+
+        self.assertIs(colour1, colour2, 'Equal requests should share the colour')
+
+    def testPoolIsBounded(self):
+
+        ResourcePool.MAXIMUM_ENTRIES = 2
+
+        brush1 = ResourcePool.brush('Red')
+        ResourcePool.brush('Green')
+        ResourcePool.brush('Red')       # Now the most recently used
+        ResourcePool.brush('Blue')      # Evicts Green
+
+        self.assertIs(brush1, ResourcePool.brush('Red'), 'The recently used brush should be kept')
+        self.assertEqual(2, len(ResourcePool._brushes), 'The pool should not grow past its maximum')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestResourcePool))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
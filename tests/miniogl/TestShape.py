@@ -1,9 +1,18 @@
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from unittest.mock import MagicMock
+
 from codeallybasic.UnitTestBase import UnitTestBase
 
+from miniogl.AnchorPoint import AnchorPoint
+from miniogl.ControlPoint import ControlPoint
+from miniogl.LinePoint import LinePoint
 from miniogl.Shape import Shape
+from miniogl.SizerShape import SizerShape
+from miniogl.ViewTransform import IDENTITY_TRANSFORM
+
+from miniogl.models.ShapeModel import ShapeModel
 
 
 # import the class you want to test here
@@ -34,6 +43,37 @@ class TestShape(UnitTestBase):
 
         self.assertNotEqual(shape1.id, shape2.id, 'IDs should be different')
 
+    def testGetAllChildrenIsFlat(self):
+
+        parent:     Shape = Shape()
+        child:      Shape = Shape(parent=parent)
+        grandChild: Shape = Shape(parent=child)
+        parent.AppendChild(child)
+        child.AppendChild(grandChild)
+
+        self.assertEqual([child, grandChild], parent.GetAllChildren(), 'Should be a flat list, children first')
+
+    def testScaledZoomKeepsModelCoordinates(self):
+
+        panel: MagicMock = MagicMock()
+        panel.currentZoom   = 2.0        # The DC is scaled while painting
+        panel.viewTransform = IDENTITY_TRANSFORM
+
+        shape: Shape = Shape()
+        shape._diagram = MagicMock(panel=panel)
+
+        shape.SetPosition(30, 40)
+        self.assertEqual((30, 40), shape.model.GetPosition(), 'The model should have the shape position')
+
+        shape.UpdateFromModel()
+        self.assertEqual((30, 40), shape.GetPosition(), 'The zoom should not move the shape')
+
+    def testPointsHaveNoInstanceDictionary(self):
+
+        parent: Shape = Shape()
+        for instance in (AnchorPoint(0, 0, parent), ControlPoint(0, 0), LinePoint(0, 0), SizerShape(0, 0, parent), ShapeModel()):
+            self.assertFalse(hasattr(instance, '__dict__'), f'{type(instance).__name__} should only use slots')
+
 
 def suite() -> TestSuite:
     import unittest
@@ -0,0 +1,137 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.PointShape import PointShape
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import BoundingBox
+from miniogl.Shape import Shape
+from miniogl.SpatialIndex import SpatialIndex
+
+
+class TestSpatialIndex(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._spatialIndex: SpatialIndex = SpatialIndex(cellSize=100)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testShapesAtFindsRectangle(self):
+
+        rectangle: RectangleShape = RectangleShape(x=150, y=150, width=100, height=100)
+        self._spatialIndex.insert(rectangle)
+
+        candidates: List[Shape] = self._spatialIndex.shapesAt(200, 200)
+
+        self.assertIn(rectangle, candidates, 'Rectangle should be a candidate')
+
+    def testShapesAtIgnoresDistantRectangle(self):
+
+        rectangle: RectangleShape = RectangleShape(x=150, y=150, width=100, height=100)
+        self._spatialIndex.insert(rectangle)
+
+        candidates: List[Shape] = self._spatialIndex.shapesAt(1000, 1000)
+
+        self.assertEqual(0, len(candidates), 'Nothing should be there')
+
+    def testNegativeSize(self):
+
+        rectangle: RectangleShape = RectangleShape(x=300, y=300, width=-100, height=-100)
+        self._spatialIndex.insert(rectangle)
+
+        candidates: List[Shape] = self._spatialIndex.shapesAt(250, 250)
+
+        self.assertIn(rectangle, candidates, 'Negative sizes extend up and left')
+
+    def testInvalidateAfterMove(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._spatialIndex.insert(rectangle)
+        self._spatialIndex.shapesAt(10, 10)
+
+        rectangle.SetPosition(500, 500)
+        self._spatialIndex.invalidate(rectangle)
+
+        self.assertNotIn(rectangle, self._spatialIndex.shapesAt(10, 10),   'Should have left the old cell')
+        self.assertIn(rectangle,    self._spatialIndex.shapesAt(510, 510), 'Should be in the new cell')
+
+    def testInvalidateParentMovesChild(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        point:     PointShape     = PointShape(x=10, y=10, parent=rectangle)
+        self._spatialIndex.insert(rectangle)
+        self._spatialIndex.insert(point)
+        self._spatialIndex.shapesAt(10, 10)
+
+        rectangle.SetPosition(500, 500)
+        self._spatialIndex.invalidate(rectangle)
+
+        self.assertIn(point, self._spatialIndex.shapesAt(510, 510), 'The child should follow its parent')
+
+    def testRemove(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=50, height=50)
+        self._spatialIndex.insert(rectangle)
+        self._spatialIndex.remove(rectangle)
+
+        self.assertEqual(0, len(self._spatialIndex), 'Index should be empty')
+        self.assertEqual(0, len(self._spatialIndex.shapesAt(10, 10)), 'Removed shape should not be found')
+
+    def testShapesIntersecting(self):
+
+        inside:  RectangleShape = RectangleShape(x=120, y=120, width=50, height=50)
+        overlap: RectangleShape = RectangleShape(x=380, y=380, width=50, height=50)
+        outside: RectangleShape = RectangleShape(x=900, y=900, width=50, height=50)
+        for rectangle in [inside, overlap, outside]:
+            self._spatialIndex.insert(rectangle)
+
+        candidates: List[Shape] = self._spatialIndex.shapesIntersecting(BoundingBox((100, 100, 400, 400)))
+
+        self.assertIn(inside,     candidates, 'Fully inside shape should be a candidate')
+        self.assertIn(overlap,    candidates, 'Overlapping shape should be a candidate')
+        self.assertNotIn(outside, candidates, 'Distant shape should not be a candidate')
+
+    def testShapesIntersectingLargeQuery(self):
+
+        rectangle: RectangleShape = RectangleShape(x=120, y=120, width=50, height=50)
+        self._spatialIndex.insert(rectangle)
+
+        candidates: List[Shape] = self._spatialIndex.shapesIntersecting(BoundingBox((-100000, -100000, 100000, 100000)))
+
+        self.assertEqual([rectangle], candidates, 'A query larger than the grid should scan the occupied cells')
+
+    def testUnboundedShapeIsAlwaysCandidate(self):
+
+        shape: Shape = Shape(x=0, y=0)
+        self._spatialIndex.insert(shape)
+
+        self.assertIn(shape, self._spatialIndex.shapesAt(5000, -5000), 'Shapes without bounds are always candidates')
+
+    def testLargeShape(self):
+
+        rectangle: RectangleShape = RectangleShape(x=0, y=0, width=10000, height=10000)
+        self._spatialIndex.insert(rectangle)
+
+        self.assertIn(rectangle,    self._spatialIndex.shapesAt(9000, 9000),   'Large shape should be found')
+        self.assertNotIn(rectangle, self._spatialIndex.shapesAt(10500, 9000), 'Outside the large shape')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,126 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from io import StringIO
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.SvgDC import SvgDC
+
+
+class FakeColour:
+    def __init__(self, red: int, green: int, blue: int):
+        self._rgb = (red, green, blue)
+
+    def Red(self):
+        return self._rgb[0]
+
+    def Green(self):
+        return self._rgb[1]
+
+    def Blue(self):
+        return self._rgb[2]
+
+
+class FakePen:
+    """
+    Stands in for a pen or a brush;  Style 0 is neither transparent nor dashed
+    """
+    def __init__(self, colour: FakeColour, width: int = 1):
+        self._colour = colour
+        self._width  = width
+
+    def GetColour(self):
+        return self._colour
+
+    def GetWidth(self):
+        return self._width
+
+    def GetStyle(self):
+        return 0
+
+
+class MeasuringDC:
+    """
+    Every character is 7 wide;  Lines are 10 high with a descent of 2
+    """
+    def SetFont(self, font):
+        pass
+
+    def GetFullTextExtent(self, text: str, font=None):
+        return 7 * len(text), 10, 2, 0
+
+    def GetTextExtent(self, text: str):
+        return 7 * len(text), 10
+
+
+class TestSvgDC(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._output: StringIO = StringIO()
+        self._dc:     SvgDC    = SvgDC(output=self._output, measuringDC=MeasuringDC())      # type: ignore
+
+        self._dc.SetPen(FakePen(FakeColour(255, 0, 0), width=2))     # type: ignore
+        self._dc.SetBrush(FakePen(FakeColour(0, 0, 255)))             # type: ignore
+        self._dc.SetTextForeground(FakeColour(0, 0, 0))               # type: ignore
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRectangle(self):
+
+        self._dc.DrawRectangle(10, 20, 30, 40)
+
+        self.assertEqual('<rect x="10" y="20" width="30" height="40" fill="#0000ff" stroke="#ff0000" stroke-width="2"/>\n',
+                         self._output.getvalue(), 'Rectangle with the brush and pen')
+
+    def testTextIsPlacedOnItsBaseline(self):
+
+        self._dc.DrawText('a<b', 5, 100)
+
+        svg: str = self._output.getvalue()
+        self.assertIn('x="5" y="108"', svg, 'The baseline is the top plus the height less the descent')
+        self.assertIn('>a&lt;b</text>', svg, 'Text is escaped')
+
+    def testSplinePassesThroughMidpoints(self):
+
+        self._dc.DrawSpline([(0, 0), (10, 0), (10, 10)])
+
+        self.assertIn('d="M 0 0 L 5.0 0.0 Q 10 0 10.0 5.0 L 10 10"', self._output.getvalue(), 'Quadratic B-spline like wx')
+
+    def testLargeArc(self):
+
+        self._dc.DrawArc(10, 0, 0, -10, 0, 0)      # From 3 o'clock counterclockwise to 12 o'clock;  A quarter
+        self._dc.DrawArc(0, -10, 10, 0, 0, 0)      # From 12 o'clock counterclockwise to 3 o'clock;  Three quarters
+
+        lines = self._output.getvalue().splitlines()
+        self.assertIn('A 10.0 10.0 0 0 0 0 -10', lines[0], 'A quarter is a small arc')
+        self.assertIn('A 10.0 10.0 0 1 0 10 0', lines[1], 'Three quarters is a large arc')
+
+    def testClippingGroupsAreClosed(self):
+
+        self._dc.SetClippingRegion(0, 0, 10, 10)
+        self._dc.SetClippingRegion(0, 0, 5, 5)
+        self._dc.DestroyClippingRegion()
+        self._dc.close()
+
+        svg: str = self._output.getvalue()
+        self.assertEqual(svg.count('<g '), svg.count('</g>'), 'Every group should be closed')
+        self.assertIn('url(#clip2)', svg, 'Each clip path gets its own id')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSvgDC))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,93 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.TextExtentCache import TextExtentCache
+
+
+class FakeFont:
+    def __init__(self, description: str):
+        self._description = description
+
+    def GetNativeFontInfoDesc(self) -> str:
+        return self._description
+
+
+class MeasuringDC:
+    """
+    Counts the measurements;  Every character is as wide as the font number
+    """
+    def __init__(self):
+        self.font:         FakeFont = FakeFont('1')
+        self.measurements: int      = 0
+
+    def GetFont(self):
+        return self.font
+
+    def GetUserScale(self):
+        return 1.0, 1.0
+
+    def GetTextExtent(self, text: str):
+        self.measurements += 1
+        return int(self.font.GetNativeFontInfoDesc()) * len(text), 10
+
+
+class TestTextExtentCache(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        TextExtentCache.clear()
+        self._saveMaximum: int = TextExtentCache.MAXIMUM_ENTRIES
+        self._dc:          MeasuringDC = MeasuringDC()
+
+    def tearDown(self):
+        super().tearDown()
+        TextExtentCache.MAXIMUM_ENTRIES = self._saveMaximum
+        TextExtentCache.clear()
+
+    def testStringIsMeasuredOnce(self):
+
+        for _ in range(3):
+            self.assertEqual((4, 10), TextExtentCache.textExtent(self._dc, 'name'), 'Should be the DC extent')     # type: ignore
+
+        self.assertEqual(1, self._dc.measurements, 'Only the first lookup should measure')
+        self.assertEqual(1, TextExtentCache.misses, 'One miss')
+        self.assertEqual(2, TextExtentCache.hits, 'Two hits')
+
+    def testFontIsPartOfTheKey(self):
+
+        TextExtentCache.textExtent(self._dc, 'name')     # type: ignore
+        self._dc.font = FakeFont('2')
+
+        self.assertEqual((8, 10), TextExtentCache.textExtent(self._dc, 'name'), 'Should be measured in the new font')     # type: ignore
+        self.assertEqual(2, self._dc.measurements, 'A different font is a different entry')
+
+    def testCacheIsBounded(self):
+
+        TextExtentCache.MAXIMUM_ENTRIES = 2
+
+        TextExtentCache.textExtent(self._dc, 'a')       # type: ignore
+        TextExtentCache.textExtent(self._dc, 'b')       # type: ignore
+        TextExtentCache.textExtent(self._dc, 'a')       # type: ignore  Now the most recently used
+        TextExtentCache.textExtent(self._dc, 'c')       # type: ignore  Evicts b
+
+        TextExtentCache.textExtent(self._dc, 'a')       # type: ignore
+        self.assertEqual(3, self._dc.measurements, 'The recently used extent should be kept')
+        self.assertEqual(2, len(TextExtentCache._extents), 'The cache should not grow past its maximum')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTextExtentCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,114 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from io import BytesIO
+
+from struct import unpack
+
+from zlib import decompress
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.Diagram import Diagram
+from miniogl.Shape import BoundingBox
+from miniogl.StreamingPngWriter import PNG_SIGNATURE
+from miniogl.StreamingPngWriter import StreamingPngWriter
+from miniogl.TiledDiagramExporter import Tile
+from miniogl.TiledDiagramExporter import TiledDiagramExporter
+from miniogl.TiledDiagramExporter import renderTile
+from miniogl.TiledDiagramExporter import tileRows
+
+from tests.miniogl.TestBatchingDC import RecordingDC
+
+
+class TestTiledDiagramExporter(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testTilesCoverTheImage(self):
+
+        rows = tileRows(width=250, height=120, tileSize=100)
+
+        self.assertEqual(2, len(rows), 'Two rows of tiles')
+        self.assertEqual([Tile((0, 0, 100, 100)), Tile((100, 0, 100, 100)), Tile((200, 0, 50, 100))], rows[0], 'Last column is narrower')
+        self.assertEqual([Tile((0, 100, 100, 20)), Tile((100, 100, 100, 20)), Tile((200, 100, 50, 20))], rows[1], 'Last row is shorter')
+
+    def testStreamedPngHoldsEveryRow(self):
+
+        output: BytesIO = BytesIO()
+        writer: StreamingPngWriter = StreamingPngWriter(output=output, width=2, height=3)
+
+        writer.writeRows(bytes([255, 0, 0] * 2 * 2), rowCount=2)
+        writer.writeRows(bytes([0, 0, 255] * 2), rowCount=1)
+        writer.close()
+
+        png: bytes = output.getvalue()
+        self.assertTrue(png.startswith(PNG_SIGNATURE), 'Should be a PNG')
+
+        width, height = unpack('>II', png[16:24])
+        self.assertEqual((2, 3), (width, height), 'Header has the image size')
+
+        compressed: bytes = b''
+        position:   int   = len(PNG_SIGNATURE)
+        while position < len(png):
+            length:    int   = unpack('>I', png[position:position + 4])[0]
+            chunkType: bytes = png[position + 4:position + 8]
+            if chunkType == b'IDAT':
+                compressed += png[position + 8:position + 8 + length]
+            position += 12 + length
+
+        raw: bytes = decompress(compressed)
+        self.assertEqual(b'\x00' + bytes([255, 0, 0] * 2), raw[0:7], 'First row, unfiltered')
+        self.assertEqual(b'\x00' + bytes([0, 0, 255] * 2), raw[14:21], 'Last row, unfiltered')
+        self.assertEqual(21, len(raw), 'Every row was written')
+
+    def testStitchJoinsTilesOfDifferentWidths(self):
+
+        exporter: TiledDiagramExporter = TiledDiagramExporter(diagram=Diagram(panel=None))
+
+        row = [Tile((0, 0, 2, 2)), Tile((2, 0, 1, 2))]
+        wide:   bytes = bytes([1] * 3 * 2) + bytes([2] * 3 * 2)      # two pixels per row
+        narrow: bytes = bytes([3] * 3) + bytes([4] * 3)              # one pixel per row
+
+        band: bytes = exporter._stitch(row, [wide, narrow])
+
+        expected: bytes = bytes([1] * 6 + [3] * 3 + [2] * 6 + [4] * 3)
+        self.assertEqual(expected, band, 'Each image row is the tile rows side by side, top row first')
+
+    @patch('miniogl.TiledDiagramExporter.Bitmap')
+    @patch('miniogl.TiledDiagramExporter.MemoryDC')
+    def testRenderTileOffsetsTheDevice(self, mockMemoryDC: MagicMock, mockBitmap: MagicMock):
+
+        dc: RecordingDC = RecordingDC()
+        mockMemoryDC.return_value = dc
+        mockBitmap.return_value.ConvertToImage.return_value.GetData.return_value = b'pixels'
+        renderer: MagicMock = MagicMock()
+
+        pixels: bytes = renderTile(renderer, Tile((200, 100, 50, 20)), origin=(-10, -10), scale=2.0)
+
+        self.assertEqual(b'pixels', pixels, 'The tile bitmap pixels')
+        self.assertIn(('SetDeviceOrigin', (-200, -100)), dc.calls, 'The tile top left goes to the bitmap origin')
+        renderer.renderOn.assert_called_once_with(dc=dc, bounds=BoundingBox((89, 39, 116, 51)), scale=2.0, origin=(-10, -10))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTiledDiagramExporter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,65 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.ViewTransform import NUMPY_MINIMUM_POINTS
+from miniogl.ViewTransform import ViewTransform
+
+
+class TestViewTransform(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._transform: ViewTransform = ViewTransform(scale=1.5, dx=-10.4, dy=20)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testToView(self):
+        self.assertEqual((5, 50), self._transform.toView(10, 20), 'The offsets are rounded after scaling')
+
+    def testToModel(self):
+        self.assertEqual((10, 20), self._transform.toModel(5, 50), 'Should map the view position back')
+
+    def testSizes(self):
+        self.assertEqual((15, 8), self._transform.toViewSize(10, 5), 'Sizes are only scaled')
+        self.assertEqual((10, 5), self._transform.toModelSize(15, 8), 'Sizes are only scaled')
+
+    def testPointsMatchSinglePoints(self):
+
+        points = [(0, 0), (10, 20), (-7, 3), (101, 55)]
+
+        self.assertEqual([self._transform.toView(x, y) for x, y in points], self._transform.toViewPoints(points), 'Same as one at a time')
+        self.assertEqual([self._transform.toModel(x, y) for x, y in points], self._transform.toModelPoints(points), 'Same as one at a time')
+
+    def testManyPointsMatchSinglePoints(self):
+        """
+        Enough points to go through NumPy when it is installed
+        """
+        points = [(x * 7 - 300, x * 13 % 97 - 40) for x in range(NUMPY_MINIMUM_POINTS * 2)] + [(1, 1), (3, 5)]
+
+        self.assertEqual([self._transform.toView(x, y) for x, y in points], self._transform.toViewPoints(points), 'Same as one at a time')
+        self.assertEqual([self._transform.toModel(x, y) for x, y in points], self._transform.toModelPoints(points), 'Same as one at a time')
+
+    def testIsImmutable(self):
+        from dataclasses import FrozenInstanceError
+
+        with self.assertRaises(FrozenInstanceError):
+            self._transform.scale = 2.0     # type: ignore
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestViewTransform))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,84 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from miniogl.Shape import Shape
+from miniogl.ZOrder import ZOrder
+
+
+class TestZOrder(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._zOrder: ZOrder       = ZOrder()
+        self._shapes: List[Shape] = [Shape(x=i, y=i) for i in range(5)]
+        for shape in self._shapes:
+            self._zOrder.add(shape)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testInsertionOrder(self):
+        self.assertEqual(self._shapes, list(self._zOrder), 'Added shapes are drawn in order')
+
+    def testReversed(self):
+        self.assertEqual(self._shapes[::-1], list(reversed(self._zOrder)), 'Should iterate front to back')
+
+    def testRaiseToFront(self):
+
+        s0, s1, s2, s3, s4 = self._shapes
+        self._zOrder.raiseToFront([s1, s3])
+
+        self.assertEqual([s0, s2, s4, s1, s3], list(self._zOrder), 'Raised shapes keep their relative order')
+
+    def testLowerToBack(self):
+
+        s0, s1, s2, s3, s4 = self._shapes
+        self._zOrder.lowerToBack([s3, s4])
+        self._zOrder.lowerToBack([s2])
+
+        self.assertEqual([s2, s3, s4, s0, s1], list(self._zOrder), 'Lowered shapes keep their relative order')
+
+    def testKeysFollowDisplayOrder(self):
+
+        self._zOrder.lowerToBack([self._shapes[4]])
+        self._zOrder.raiseToFront([self._shapes[0]])
+
+        shapes: List[Shape] = list(self._zOrder)
+        keys:   List[int]   = [self._zOrder.key(shape) for shape in shapes]
+
+        self.assertEqual(sorted(keys), keys, 'Keys should increase along the display list')
+
+    def testRemove(self):
+
+        self._zOrder.lowerToBack([self._shapes[2]])
+        self._zOrder.remove(self._shapes[2])
+
+        self.assertNotIn(self._shapes[2], self._zOrder, 'Should be gone')
+        self.assertEqual(4, len(self._zOrder), 'Only one shape removed')
+
+    def testUnknownShapeIsNotRaised(self):
+
+        stranger: Shape = Shape()
+        self._zOrder.raiseToFront([stranger])
+
+        self.assertNotIn(stranger, self._zOrder, 'Raising does not add shapes')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestZOrder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -5,11 +5,52 @@ from unittest import main as unitTestMain
 from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
 
 from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutField import PyutField
+from pyutmodelv2.PyutMethod import PyutMethod
+from pyutmodelv2.PyutParameter import PyutParameter
+from pyutmodelv2.PyutType import PyutType
 from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
 
+from miniogl.TextExtentCache import TextExtentCache
+
+from ogl.ClassLayout import ClassLayout
+from ogl.ClassLayout import ClassLayoutRow
 from ogl.OglClass import OglClass
 
 
+class FakeFont:
+    def __init__(self, description: str):
+        self._description = description
+
+    def GetNativeFontInfoDesc(self) -> str:
+        return self._description
+
+
+class MeasuringDC:
+    """
+    Characters are 12 wide in the class name font, 10 in the others;  Lines are 10 high.
+    Counts the measurements
+    """
+    def __init__(self, nameFont):
+        self._nameFont = nameFont
+        self._font:        FakeFont = FakeFont('default')
+        self.measurements: int      = 0
+
+    def SetFont(self, font):
+        self._font = FakeFont('name' if font is self._nameFont else 'default')
+
+    def GetFont(self):
+        return self._font
+
+    def GetUserScale(self):
+        return 1.0, 1.0
+
+    def GetTextExtent(self, text: str):
+        self.measurements += 1
+        characterWidth: int = 12 if self._font.GetNativeFontInfoDesc() == 'name' else 10
+        return characterWidth * len(text), 10
+
+
 class TestOglClass(UnitTestBaseW):
     WELL_KNOWN_ID: int = 0xDeadBeef
 
@@ -23,6 +64,7 @@ class TestOglClass(UnitTestBaseW):
 
     def tearDown(self):
         super().tearDown()
+        TextExtentCache.clear()
 
     def testRepr(self):
 
@@ -64,6 +106,96 @@ class TestOglClass(UnitTestBaseW):
 
         self.assertFalse(actualAnswer, 'Did not defer to class value')
 
+    def testRenderCacheKeyIgnoresPosition(self):
+
+        oglClass: OglClass = self._oglClass
+
+        keyBefore = oglClass._renderCacheKey()
+        oglClass.SetPosition(400, 400)
+
+        self.assertEqual(keyBefore, oglClass._renderCacheKey(), 'Moving should keep the cached bitmap')
+
+    def testRenderCacheKeyFollowsModel(self):
+
+        oglClass: OglClass = self._oglClass
+
+        keyBefore = oglClass._renderCacheKey()
+        oglClass.pyutObject.fields.append(PyutField(name='newField'))
+
+        self.assertNotEqual(keyBefore, oglClass._renderCacheKey(), 'A new field should invalidate the cached bitmap')
+
+    def testRenderCacheKeyFollowsSelection(self):
+
+        oglClass: OglClass = self._oglClass
+        oglClass.resizable = False      # No sizers;  The class is not on a diagram
+
+        keyBefore = oglClass._renderCacheKey()
+        oglClass.selected = True
+
+        self.assertNotEqual(keyBefore, oglClass._renderCacheKey(), 'Selection changes the drawing')
+
+    def testLayout(self):
+
+        oglClass:  OglClass  = self._oglClass
+        pyutClass: PyutClass = oglClass.pyutObject
+
+        pyutClass.showFields  = True
+        pyutClass.showMethods = True
+        pyutClass.fields.append(PyutField(name='field'))
+        pyutClass.methods.append(PyutMethod(name='method'))
+
+        TextExtentCache.clear()
+        layout: ClassLayout = oglClass._computeLayout(MeasuringDC(nameFont=oglClass._nameFont))      # type: ignore
+
+        fieldText:  str = str(pyutClass.fields[0])
+        methodText: str = oglClass._methodText(pyutClass.methods[0], pyutClass)
+        self.assertEqual(
+            (
+                ClassLayoutRow(text='TestReprClass', y=5,  width=12 * 13, centered=True, nameFont=True),
+                ClassLayoutRow(text='',              y=20, width=0,       centered=True),
+                ClassLayoutRow(text=fieldText,       y=40, width=10 * len(fieldText)),
+                ClassLayoutRow(text=methodText,      y=60, width=10 * len(methodText)),
+            ),
+            layout.rows, 'Header, field and method rows, half a line apart'
+        )
+        self.assertEqual((35, 55), layout.separators, 'Lines under the header and the fields')
+        self.assertEqual(12 * 13, layout.headerWidth, 'The name is the widest header row')
+        self.assertEqual(75, layout.height, 'Height of every section')
+
+    def testLayoutIsReused(self):
+
+        oglClass: OglClass    = self._oglClass
+        dc:       MeasuringDC = MeasuringDC(nameFont=oglClass._nameFont)
+
+        layout: ClassLayout = oglClass._getLayout(dc)       # type: ignore
+
+        self.assertIs(layout, oglClass._getLayout(dc), 'An unchanged class should not be measured again')      # type: ignore
+
+        oglClass.pyutObject.fields.append(PyutField(name='newField'))
+        self.assertIsNot(layout, oglClass._getLayout(dc), 'A new field changes the layout')      # type: ignore
+
+    def testMembersEditedInPlaceAreRedrawn(self):
+
+        oglClass:  OglClass   = self._oglClass
+        field:     PyutField  = PyutField(name='field')
+        method:    PyutMethod = PyutMethod(name='method')
+        oglClass.pyutObject.fields.append(field)
+        oglClass.pyutObject.methods.append(method)
+
+        keyBefore = oglClass._renderCacheKey()
+        field.name = 'renamed'
+        self.assertNotEqual(keyBefore, oglClass._renderCacheKey(), 'A renamed field is redrawn')
+
+        keyBefore = oglClass._renderCacheKey()
+        field.type = PyutType('int')
+        self.assertNotEqual(keyBefore, oglClass._renderCacheKey(), 'A field with a new type is redrawn')
+
+        keyBefore = oglClass._renderCacheKey()
+        method.parameters.append(PyutParameter(name='parameter'))
+        self.assertNotEqual(keyBefore, oglClass._renderCacheKey(), 'A method with new parameters is redrawn')
+
+        keyBefore = oglClass._renderCacheKey()
+        self.assertEqual(keyBefore, oglClass._renderCacheKey(), 'Nothing changed')
 
 def suite() -> TestSuite:
 
@@ -0,0 +1,61 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from ogl.OglDetailLevel import OglDetailLevel
+
+from ogl.preferences.OglPreferences import OglPreferences
+
+
+class TestOglDetailLevel(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._preferences: OglPreferences = OglPreferences()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testFullDetailAtNormalZoom(self):
+        self.assertEqual(OglDetailLevel.FULL, OglDetailLevel.fromZoom(1.0), 'Unzoomed diagrams are drawn in full')
+
+    def testFullDetailAtThreshold(self):
+        self.assertEqual(OglDetailLevel.FULL, OglDetailLevel.fromZoom(self._preferences.lodNameOnlyZoom), 'The threshold itself is still full detail')
+
+    def testNameOnly(self):
+
+        zoom: float = (self._preferences.lodNameOnlyZoom + self._preferences.lodBoxOnlyZoom) / 2
+        self.assertEqual(OglDetailLevel.NAME_ONLY, OglDetailLevel.fromZoom(zoom), 'Between the thresholds only names are drawn')
+
+    def testBoxOnly(self):
+
+        zoom: float = self._preferences.lodBoxOnlyZoom / 2
+        self.assertEqual(OglDetailLevel.BOX_ONLY, OglDetailLevel.fromZoom(zoom), 'Far out only boxes are drawn')
+
+    def testThresholdChangeIsNoticed(self):
+
+        savedThreshold: float = self._preferences.lodNameOnlyZoom
+        zoom:           float = savedThreshold + 0.1
+        try:
+            self.assertEqual(OglDetailLevel.FULL, OglDetailLevel.fromZoom(zoom), 'Above the threshold')
+            self._preferences.lodNameOnlyZoom = zoom + 0.1
+            self.assertEqual(OglDetailLevel.NAME_ONLY, OglDetailLevel.fromZoom(zoom), 'Same zoom, the new threshold applies')
+        finally:
+            self._preferences.lodNameOnlyZoom = savedThreshold
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestOglDetailLevel))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
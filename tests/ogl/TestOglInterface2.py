@@ -4,15 +4,21 @@ from typing import Tuple
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import PropertyMock
+from unittest.mock import patch
 
 from codeallyadvanced.ui.AttachmentSide import AttachmentSide
 from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
 
 from pyutmodelv2.PyutInterface import PyutInterface
 
+from miniogl.Diagram import Diagram
+from miniogl.LollipopLine import LollipopLine
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
+from miniogl.Shape import BoundingBox
+from miniogl.ViewTransform import ViewTransform
 
 from ogl.OglInterface2 import OglInterface2
 from ogl.OglPosition import OglPosition
@@ -131,6 +137,24 @@ class TestOglInterface2(UnitTestBaseW):
         self.assertEqual(193, namePosition.x, 'West name position X is bad')
         self.assertEqual(549, namePosition.y, 'West name position Y is bad')
 
+    @patch('ogl.OglInterface2.TextExtentCache.textExtent', return_value=(80, 12))
+    @patch.object(OglInterface2, '_measuringDC', return_value=MagicMock())
+    def testBoundingBoxIncludesTheName(self, mockMeasuringDC: MagicMock, mockTextExtent: MagicMock):
+
+        diagram:      Diagram       = Diagram(panel=MagicMock(viewTransform=ViewTransform()))
+        oglInterface: OglInterface2 = OglInterface2(pyutInterface=self._pyutInterface, destinationAnchor=self._destinationAnchor)
+        diagram.AddShape(oglInterface, withModelUpdate=False)
+
+        with patch.object(oglInterface, '_defaultFont', MagicMock(GetPixelSize=Mock(return_value=(6, 12)))):
+            x, y, width, height = oglInterface._nameRectangle(mockMeasuringDC())
+            box: BoundingBox    = oglInterface.GetBoundingBox()
+
+        self.assertEqual((210, 172, 80, 12), (x, y, width, height), 'North names are centered above the circle')
+        self.assertTrue(box[0] <= x and box[1] <= y and x + width <= box[2] and y + height <= box[3], f'The name should be inside {box}')
+
+        circleY: int = 250 - LollipopLine.LOLLIPOP_LINE_LENGTH
+        self.assertLessEqual(box[1], circleY - LollipopLine.LOLLIPOP_CIRCLE_RADIUS, 'The circle should be inside')
+
 
 def suite() -> TestSuite:
 
@@ -9,6 +9,29 @@ from ogl.OglPosition import OglPosition
 from ogl.OglUtils import OglUtils
 
 
+class FakeFont:
+    def GetNativeFontInfoDesc(self) -> str:
+        return 'Sans 10'
+
+
+class MeasuringDC:
+    """
+    Every character is 10 pixels wide;  Counts the measurements
+    """
+    def __init__(self):
+        self.measurements: int = 0
+
+    def GetFont(self):
+        return FakeFont()
+
+    def GetUserScale(self):
+        return 1.0, 1.0
+
+    def GetPartialTextExtents(self, text: str):
+        self.measurements += 1
+        return [10 * (index + 1) for index in range(len(text))]
+
+
 class TestOglUtils(UnitTestBase):
     """
     """
@@ -16,6 +39,7 @@ class TestOglUtils(UnitTestBase):
 
     def setUp(self):
         super().setUp()
+        OglUtils._wrappedTexts.clear()
 
     def tearDown(self):
         pass
@@ -114,6 +138,32 @@ class TestOglUtils(UnitTestBase):
         self.assertEqual(expectedX, snappedX, 'X coordinate not correctly snapped')
         self.assertEqual(expectedY, snappedY, 'Y coordinate not correctly snapped')
 
+    def testLineSplitter(self):
+
+        lines = OglUtils.lineSplitter('aaa bb cccc\n\ndd', MeasuringDC(), textWidth=70)    # type: ignore
+
+        self.assertEqual(['aaa bb', 'cccc', '', 'dd'], lines, 'The trailing space of a word counts toward the width')
+
+    def testLineSplitterWordTooWide(self):
+
+        lines = OglUtils.lineSplitter('aaaaaaaa b', MeasuringDC(), textWidth=50)    # type: ignore
+
+        self.assertEqual(['', 'aaaaaaaa', 'b'], lines, 'A word that does not fit gets its own line')
+
+    def testLineSplitterIsMemoized(self):
+
+        dc: MeasuringDC = MeasuringDC()
+
+        lines = OglUtils.lineSplitter('aaa bb\ncccc', dc, textWidth=70)      # type: ignore
+        lines.append('changed by the caller')
+        again = OglUtils.lineSplitter('aaa bb\ncccc', dc, textWidth=70)      # type: ignore
+
+        self.assertEqual(['aaa bb', 'cccc'], again, 'Should not see changes to an earlier result')
+        self.assertEqual(2, dc.measurements, 'Each paragraph is measured once, the second call is not measured')
+
+        OglUtils.lineSplitter('aaa bb\ncccc', dc, textWidth=40)      # type: ignore
+        self.assertEqual(4, dc.measurements, 'A different width is wrapped again')
+
 
 def suite() -> TestSuite:
     """You need to change the name of the test class here also."""
@@ -2,6 +2,9 @@
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
 from codeallyadvanced.ui.AttachmentSide import AttachmentSide
 from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
 
@@ -78,6 +81,51 @@ class TestOglEventEngine(UnitTestBaseW):
                           lambda: self._eventEngine.sendEvent(OglEventType.CreateLollipopInterface, implementor=implementor,
                                                               attachmentPointBAD=attachmentPoint))
 
+    @patch('ogl.events.OglEventEngine.CallAfter')
+    def testDiagramFrameModifiedIsCoalesced(self, mockCallAfter: MagicMock):
+
+        for _ in range(10):
+            self._eventEngine.sendEvent(OglEventType.DiagramFrameModified)
+
+        self.assertEqual(1, mockCallAfter.call_count, 'Only one event should be scheduled per turn of the event loop')
+
+        mockCallAfter.call_args.args[0]()       # The turn ends
+        self._eventEngine.sendEvent(OglEventType.DiagramFrameModified)
+
+        self.assertEqual(2, mockCallAfter.call_count, 'The next turn gets its own event')
+
+    @patch('ogl.events.OglEventEngine.CallAfter')
+    def testBatchSendsOneEvent(self, mockCallAfter: MagicMock):
+
+        with self._eventEngine.batch():
+            with self._eventEngine.batch():
+                self._eventEngine.sendEvent(OglEventType.DiagramFrameModified)
+            self._eventEngine.sendEvent(OglEventType.DiagramFrameModified)
+            self.assertEqual(0, mockCallAfter.call_count, 'Nothing is sent inside the batch')
+
+        self.assertEqual(1, mockCallAfter.call_count, 'One event at the end of the batch')
+
+    @patch('ogl.events.OglEventEngine.CallAfter')
+    def testEmptyBatchSendsNothing(self, mockCallAfter: MagicMock):
+
+        with self._eventEngine.batch():
+            pass
+
+        self.assertEqual(0, mockCallAfter.call_count, 'Nothing was modified')
+
+    @patch('ogl.events.OglEventEngine.PostEvent')
+    @patch('ogl.events.OglEventEngine.CallAfter')
+    def testNoEventForDestroyedWindow(self, mockCallAfter: MagicMock, mockPostEvent: MagicMock):
+
+        destroyedWindow: MagicMock = MagicMock()
+        destroyedWindow.__bool__.return_value = False       # How wx reports a destroyed window
+
+        eventEngine: OglEventEngine = OglEventEngine(listeningWindow=destroyedWindow)
+        eventEngine.sendEvent(OglEventType.DiagramFrameModified)
+        mockCallAfter.call_args.args[0]()
+
+        self.assertEqual(0, mockPostEvent.call_count, 'The window is gone by the time the event is posted')
+
 
 def suite() -> TestSuite:
 
@@ -119,6 +119,15 @@ class TestOglPreferencesV2(UnitTestBase):
 
         self.assertEqual(expected, actual, 'Why did they not change.')
 
+    def testChangeCount(self):
+
+        prefsV2: OglPreferences = OglPreferences()
+
+        before: int = prefsV2.changeCount
+        prefsV2.backgroundGridInterval = 50
+
+        self.assertEqual(before + 1, prefsV2.changeCount, 'A write should bump the change count')
+
 
 def suite() -> TestSuite:
     import unittest